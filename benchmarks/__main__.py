@@ -0,0 +1,64 @@
+import argparse
+import fnmatch
+import logging
+import sys
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from codenames.classic.simulation import quiet_logging
+
+log = logging.getLogger("benchmarks")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark engine throughput and latency.")
+    parser.add_argument("-k", "--filter", default="*", help="Glob pattern of benchmark names to run.")
+    parser.add_argument("--save", help="Write results as a JSON baseline to this path.")
+    parser.add_argument("--compare", help="Compare results against the JSON baseline at this path.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed slowdown ratio before failing.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-round-sec", type=float, default=0.2)
+    parser.add_argument("--online", action="store_true", help="Include browser games against the local web app.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    available = list(BENCHMARKS)
+    if args.online:
+        from benchmarks.online import (  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
+            ONLINE_BENCHMARKS,
+        )
+
+        available += ONLINE_BENCHMARKS
+    benchmarks = [benchmark for benchmark in available if fnmatch.fnmatch(benchmark.name, args.filter)]
+    results: list[BenchmarkResult] = []
+    with quiet_logging():
+        for benchmark in benchmarks:
+            result = run_benchmark(benchmark, min_round_sec=args.min_round_sec, rounds=args.rounds)
+            results.append(result)
+            per_op_us = result.median_sec_per_op * 1_000_000
+            unit = result.unit
+            log.info(f"{result.name:<40} {result.ops_per_sec:>12,.1f} {unit}/sec {per_op_us:>12,.2f} us/{unit}")
+    if args.save:
+        save_baseline(results, path=args.save)
+        log.info(f"Baseline saved to {args.save}")
+    if not args.compare:
+        return 0
+    comparisons = compare(results, baseline=load_baseline(args.compare))
+    regressions = [comparison for comparison in comparisons if comparison.is_regression(args.tolerance)]
+    for comparison in comparisons:
+        if comparison.ratio is None:
+            log.info(f"{comparison.name:<40} no baseline")
+            continue
+        mark = "REGRESSION" if comparison in regressions else ""
+        log.info(f"{comparison.name:<40} {comparison.ratio:>8.2f}x {mark}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
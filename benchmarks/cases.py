@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Callable
+
+from benchmarks.harness import Benchmark
+from benchmarks.players import ScriptedOperative, ScriptedSpymaster
+from codenames.classic.board import ClassicBoard
+from codenames.classic.color import ClassicColor
+from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
+from codenames.classic.state import ClassicGameState
+from codenames.classic.team import ClassicTeam
+from codenames.duet.board import DuetBoard
+from codenames.duet.player import CompositeDuetPlayer
+from codenames.duet.runner import DuetGamePlayers, DuetGameRunner
+from codenames.duet.state import DuetGameState
+from codenames.duet.team import DuetTeam
+from codenames.generic.move import PASS_GUESS, Clue, Guess
+from codenames.generic.player import PlayerRole
+from codenames.generic.runner import TeamPlayers
+from codenames.generic.team import Team
+from codenames.mini.runner import MiniGameRunner
+from codenames.utils.vocabulary.languages import get_vocabulary
+from tests.utils.players.randoms import RandomOperative, RandomSpymaster
+
+VOCABULARY = get_vocabulary("english")
+SEED = 0
+
+TeamFactory = Callable[[str, Team], TeamPlayers]
+
+
+def random_team(name: str, team: Team) -> TeamPlayers:
+    # The random players use the global generator, which every timed run seeds with SEED.
+    return TeamPlayers(
+        spymaster=RandomSpymaster(f"{name} Spymaster", team),
+        operative=RandomOperative(f"{name} Operative", team),
+    )
+
+
+def scripted_team(name: str, team: Team) -> TeamPlayers:
+    return TeamPlayers(
+        spymaster=ScriptedSpymaster(f"{name} Spymaster", team),
+        operative=ScriptedOperative(f"{name} Operative", team, offset=len(name)),
+    )
+
+
+def classic_boards(n: int) -> list[ClassicBoard]:
+    return ClassicBoard.many_from_vocabulary(vocabulary=VOCABULARY, amount=n, seed=SEED)
+
+
+def duet_boards(n: int) -> list[DuetBoard]:
+    return DuetBoard.many_from_vocabulary(vocabulary=VOCABULARY, amount=n, seed=SEED)
+
+
+def classic_games(build_team: TeamFactory) -> Callable[[int], Callable[[], Any]]:
+    def prepare(n: int) -> Callable[[], Any]:
+        boards = classic_boards(n)
+
+        def run():
+            random.seed(SEED)
+            for board in boards:
+                blue_team, red_team = build_team("Blue", ClassicTeam.BLUE), build_team("Red", ClassicTeam.RED)
+                players = ClassicGamePlayers(blue_team=blue_team, red_team=red_team)
+                ClassicGameRunner(players=players, board=board).run_game()
+
+        return run
+
+    return prepare
+
+
+def duet_games(build_team: TeamFactory) -> Callable[[int], Callable[[], Any]]:
+    def prepare(n: int) -> Callable[[], Any]:
+        rng = random.Random(SEED)
+        states = [
+            DuetGameState.from_boards(board_a=board, board_b=DuetBoard.dual_board(board, rng=rng))
+            for board in duet_boards(n)
+        ]
+
+        def run():
+            random.seed(SEED)
+            for state in states:
+                team_a, team_b = build_team("A", DuetTeam.MAIN), build_team("B", DuetTeam.MAIN)
+                players = DuetGamePlayers(
+                    player_a=CompositeDuetPlayer(spymaster=team_a.spymaster, operative=team_a.operative),
+                    player_b=CompositeDuetPlayer(spymaster=team_b.spymaster, operative=team_b.operative),
+                )
+                DuetGameRunner(players=players, state=state).run_game()
+
+        return run
+
+    return prepare
+
+
+def mini_games(build_team: TeamFactory) -> Callable[[int], Callable[[], Any]]:
+    def prepare(n: int) -> Callable[[], Any]:
+        boards = duet_boards(n)
+
+        def run():
+            random.seed(SEED)
+            for board in boards:
+                MiniGameRunner(players=build_team("Mini", DuetTeam.MAIN), board=board).run_game()
+
+        return run
+
+    return prepare
+
+
+def board_from_vocabulary(n: int) -> Callable[[], Any]:
+    def run():
+        for seed in range(n):
+            ClassicBoard.from_vocabulary(vocabulary=VOCABULARY, seed=seed)
+
+    return run
+
+
+def duet_dual_board(n: int) -> Callable[[], Any]:
+    boards = duet_boards(n)
+
+    def run():
+        for seed, board in enumerate(boards):
+            DuetBoard.dual_board(board, seed=seed)
+
+    return run
+
+
+def mid_game_classic_state() -> ClassicGameState:
+    # A state with revealed cards and given clues, so views and dumps have real work to do.
+    state = ClassicGameState.from_board(board=classic_boards(1)[0])
+    for turn in range(4):
+        state.process_clue(Clue(word=f"clue {turn}", card_amount=2))
+        cards = state.board.cards
+        card_index = next(
+            i for i, card in enumerate(cards) if not card.revealed and card.color != ClassicColor.ASSASSIN
+        )
+        state.process_guess(Guess(card_index=card_index))
+        if state.current_player_role == PlayerRole.OPERATIVE:
+            state.process_guess(Guess(card_index=PASS_GUESS))
+    return state
+
+
+def classic_state_normalized_round_trip(n: int) -> Callable[[], Any]:
+    state = mid_game_classic_state()
+
+    def run():
+        for _ in range(n):
+            ClassicGameState.model_validate_normalized(state.model_dump_normalized())
+
+    return run
+
+
+def classic_state_json_round_trip(n: int) -> Callable[[], Any]:
+    state = mid_game_classic_state()
+
+    def run():
+        for _ in range(n):
+            ClassicGameState.model_validate_json(state.model_dump_json())
+
+    return run
+
+
+def duet_state_normalized_round_trip(n: int) -> Callable[[], Any]:
+    board = duet_boards(1)[0]
+    state = DuetGameState.from_boards(board_a=board, board_b=DuetBoard.dual_board(board, seed=SEED))
+
+    def run():
+        for _ in range(n):
+            DuetGameState.model_validate_normalized(state.model_dump_normalized())
+
+    return run
+
+
+def classic_operative_state(n: int) -> Callable[[], Any]:
+    state = mid_game_classic_state()
+
+    def run():
+        for _ in range(n):
+            _ = state.operative_state
+
+    return run
+
+
+def classic_illegal_clue_words(n: int) -> Callable[[], Any]:
+    state = mid_game_classic_state()
+
+    def run():
+        for _ in range(n):
+            _ = state.illegal_clue_words
+
+    return run
+
+
+BENCHMARKS = [
+    Benchmark(name="classic_game_random", unit="game", prepare=classic_games(random_team)),
+    Benchmark(name="classic_game_scripted", unit="game", prepare=classic_games(scripted_team)),
+    Benchmark(name="duet_game_random", unit="game", prepare=duet_games(random_team)),
+    Benchmark(name="duet_game_scripted", unit="game", prepare=duet_games(scripted_team)),
+    Benchmark(name="mini_game_random", unit="game", prepare=mini_games(random_team)),
+    Benchmark(name="mini_game_scripted", unit="game", prepare=mini_games(scripted_team)),
+    Benchmark(name="classic_board_from_vocabulary", unit="board", prepare=board_from_vocabulary),
+    Benchmark(name="duet_dual_board", unit="board", prepare=duet_dual_board),
+    Benchmark(name="classic_state_normalized_round_trip", unit="call", prepare=classic_state_normalized_round_trip),
+    Benchmark(name="classic_state_json_round_trip", unit="call", prepare=classic_state_json_round_trip),
+    Benchmark(name="duet_state_normalized_round_trip", unit="call", prepare=duet_state_normalized_round_trip),
+    Benchmark(name="classic_operative_state", unit="call", prepare=classic_operative_state),
+    Benchmark(name="classic_illegal_clue_words", unit="call", prepare=classic_illegal_clue_words),
+]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+# A case prepares everything needed for `n` operations outside the timed region,
+# and returns a callable that performs exactly those `n` operations.
+Prepare = Callable[[int], Callable[[], Any]]
+
+BASELINE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    unit: str
+    prepare: Prepare
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    unit: str
+    ops_per_round: int
+    rounds: int
+    median_sec_per_op: float
+    min_sec_per_op: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1 / self.median_sec_per_op if self.median_sec_per_op else 0.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_sec_per_op: float
+    current_sec_per_op: float
+
+    @property
+    def ratio(self) -> float | None:
+        # Above 1 means slower than the baseline, None if the baseline has no measurable time to compare with.
+        if not self.baseline_sec_per_op:
+            return None
+        return self.current_sec_per_op / self.baseline_sec_per_op
+
+    def is_regression(self, tolerance: float) -> bool:
+        return self.ratio is not None and self.ratio > 1 + tolerance
+
+
+def run_benchmark(benchmark: Benchmark, min_round_sec: float = 0.2, rounds: int = 5) -> BenchmarkResult:
+    ops = _calibrate(benchmark, min_round_sec=min_round_sec)
+    samples = []
+    for _ in range(rounds):
+        run = benchmark.prepare(ops)
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) / ops)
+    return BenchmarkResult(
+        name=benchmark.name,
+        unit=benchmark.unit,
+        ops_per_round=ops,
+        rounds=rounds,
+        median_sec_per_op=statistics.median(samples),
+        min_sec_per_op=min(samples),
+    )
+
+
+def _calibrate(benchmark: Benchmark, min_round_sec: float) -> int:
+    # Doubles the amount of operations until a round takes long enough to be timed reliably.
+    ops = 1
+    while True:
+        run = benchmark.prepare(ops)
+        start = time.perf_counter()
+        run()
+        if time.perf_counter() - start >= min_round_sec or ops >= 1 << 20:
+            return ops
+        ops *= 2
+
+
+def save_baseline(results: Iterable[BenchmarkResult], path: str | Path):
+    data = {
+        "format": BASELINE_FORMAT,
+        "environment": environment_info(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path: str | Path) -> dict[str, BenchmarkResult]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("format") != BASELINE_FORMAT:
+        msg = f"Unsupported baseline format: {data.get('format')}"
+        raise ValueError(msg)
+    return {name: BenchmarkResult(**result) for name, result in data["results"].items()}
+
+
+def compare(results: Iterable[BenchmarkResult], baseline: dict[str, BenchmarkResult]) -> list[Comparison]:
+    # Benchmarks missing from the baseline are skipped, so new cases don't break old baselines.
+    return [
+        Comparison(
+            name=result.name,
+            baseline_sec_per_op=baseline[result.name].median_sec_per_op,
+            current_sec_per_op=result.median_sec_per_op,
+        )
+        for result in results
+        if result.name in baseline
+    ]
+
+
+def environment_info() -> dict[str, str]:
+    try:
+        codenames_version = version("codenames")
+    except PackageNotFoundError:
+        codenames_version = "unknown"
+    return {
+        "codenames": codenames_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
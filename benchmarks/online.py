@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from benchmarks.harness import Benchmark
+from benchmarks.players import ScriptedOperative, ScriptedSpymaster
+from codenames.classic.team import ClassicTeam
+from codenames.online.codenames_game.driver_pool import DriverPool
+from codenames.online.codenames_game.local_app import LocalCodenamesApp
+from codenames.online.codenames_game.runner import CodenamesGameRunner
+
+PLAYERS_PER_GAME = 4
+
+
+def online_games(n: int) -> Callable[[], Any]:
+    # Browsers are started and warmed before timing, but quitting them is part of the last round's time.
+    app = LocalCodenamesApp(seed=0).start()
+    pool = DriverPool(max_size=PLAYERS_PER_GAME)
+    pool.warm_up(PLAYERS_PER_GAME)
+
+    def run():
+        try:
+            for _ in range(n):
+                with CodenamesGameRunner(  # pylint: disable=not-context-manager
+                    ScriptedSpymaster("Blue Spymaster", ClassicTeam.BLUE),
+                    ScriptedSpymaster("Red Spymaster", ClassicTeam.RED),
+                    ScriptedOperative("Blue Operative", ClassicTeam.BLUE, offset=0),
+                    ScriptedOperative("Red Operative", ClassicTeam.RED, offset=12),
+                    show_host=False,
+                    driver_pool=pool,
+                    base_url=app.base_url,
+                ) as manager:
+                    manager.auto_start()
+        finally:
+            pool.close()
+            app.stop()
+
+    return run
+
+
+# Needs Chrome and chromedriver, so these only run with `--online`.
+ONLINE_BENCHMARKS = [
+    Benchmark(name="online_game_local_app", unit="game", prepare=online_games),
+]
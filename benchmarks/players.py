@@ -0,0 +1,26 @@
+from codenames.generic.card import CardColor
+from codenames.generic.move import PASS_GUESS, Clue, Guess
+from codenames.generic.player import Operative, Spymaster
+from codenames.generic.state import OperativeState, SpymasterState
+from codenames.generic.team import Team
+
+
+class ScriptedSpymaster[C: CardColor, T: Team, S: SpymasterState](Spymaster[C, T, S]):
+    # Always gives a 2 cards clue, so games take the same moves on every run.
+    def give_clue(self, game_state: S) -> Clue:
+        return Clue(word=f"{self.name} {len(game_state.given_clues)}", card_amount=2)
+
+
+class ScriptedOperative[C: CardColor, T: Team, S: OperativeState](Operative[C, T, S]):
+    # Sweeps the board from a fixed offset, guessing the first unrevealed card.
+    def __init__(self, name: str, team: T, offset: int = 0):
+        super().__init__(name, team)
+        self.offset = offset
+
+    def guess(self, game_state: S) -> Guess:
+        cards = game_state.board.cards
+        for step in range(len(cards)):
+            index = (self.offset + step) % len(cards)
+            if not cards[index].revealed:
+                return Guess(card_index=index)
+        return Guess(card_index=PASS_GUESS)
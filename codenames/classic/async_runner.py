@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Iterator
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers
+from codenames.classic.state import ClassicGameState
+from codenames.classic.team import ClassicTeam
+from codenames.classic.winner import Winner
+from codenames.generic.async_runner import (
+    AnyOperative,
+    AnySpymaster,
+    AsyncClueGivenSubscriber,
+    AsyncGuessGivenSubscriber,
+    AsyncTeamPlayers,
+    AsyncTimedOutSubscriber,
+    request_timed_clue,
+    request_timed_guess,
+)
+from codenames.generic.exceptions import InvalidGuess
+from codenames.generic.move import GivenGuess
+from codenames.generic.player import AsyncPlayer
+from codenames.generic.runner import SEPARATOR, MovePolicy, MoveTimer, MoveTiming
+from codenames.utils.formatting import wrap
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AsyncClassicGamePlayers:
+    blue_team: AsyncTeamPlayers
+    red_team: AsyncTeamPlayers
+
+    @classmethod
+    def from_players(cls, players: ClassicGamePlayers) -> AsyncClassicGamePlayers:
+        blue_team = AsyncTeamPlayers.from_team_players(players.blue_team)
+        red_team = AsyncTeamPlayers.from_team_players(players.red_team)
+        return cls(blue_team=blue_team, red_team=red_team)
+
+    @property
+    def spymasters(self) -> tuple[AnySpymaster, AnySpymaster]:
+        return self.blue_team.spymaster, self.red_team.spymaster
+
+    @property
+    def operatives(self) -> tuple[AnyOperative, AnyOperative]:
+        return self.blue_team.operative, self.red_team.operative
+
+    def __iter__(self) -> Iterator[AsyncPlayer]:
+        return iter([*self.blue_team, *self.red_team])
+
+
+class AsyncClassicGameRunner:  # pylint: disable=too-many-instance-attributes
+    """
+    Same game flow as `ClassicGameRunner`, but awaits player moves, so one event loop can drive many games.
+    Sync players are supported too, set `sync_players_in_thread` if they block on I/O (or to time them out).
+    """
+
+    def __init__(
+        self,
+        players: AsyncClassicGamePlayers | ClassicGamePlayers,
+        state: ClassicGameState | None = None,
+        board: ClassicBoard | None = None,
+        sync_players_in_thread: bool = False,
+        *,
+        move_policy: MovePolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
+        if isinstance(players, ClassicGamePlayers):
+            players = AsyncClassicGamePlayers.from_players(players)
+        self.players = players
+        if not state:
+            if not board:
+                raise ValueError("Exactly one of state or board must be provided.")
+            state = ClassicGameState.from_board(board=board)
+        self.state = state
+        self.sync_players_in_thread = sync_players_in_thread
+        self.instrumentation = instrumentation or NO_INSTRUMENTATION
+        self.move_timer = MoveTimer(policy=move_policy or MovePolicy(), instrumentation=self.instrumentation)
+        self.clue_given_subscribers: list[AsyncClueGivenSubscriber] = []
+        self.guess_given_subscribers: list[AsyncGuessGivenSubscriber] = []
+        self.timed_out_subscribers: list[AsyncTimedOutSubscriber] = []
+
+    @property
+    def winner(self) -> Winner | None:
+        return self.state.winner
+
+    @property
+    def move_policy(self) -> MovePolicy:
+        return self.move_timer.policy
+
+    @property
+    def move_timings(self) -> list[MoveTiming]:
+        return self.move_timer.timings
+
+    async def run_game(self) -> Winner:
+        self._notify_game_starts()
+        while not self.state.is_game_over:
+            is_blue = self.state.current_team == ClassicTeam.BLUE
+            current_team = self.players.blue_team if is_blue else self.players.red_team
+            await self._run_team_turn(team=current_team)
+        winner: Winner = self.winner  # type: ignore[assignment]
+        log.info(f"{SEPARATOR}{winner.reason.value}, {wrap(winner.team)} team wins!")
+        return winner
+
+    def _notify_game_starts(self):
+        censored_board = self.state.board.censored
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for spymaster in self.players.spymasters:
+                spymaster.on_game_start(board=self.state.board)
+            for operative in self.players.operatives:
+                operative.on_game_start(board=censored_board)
+
+    async def _run_team_turn(self, team: AsyncTeamPlayers):
+        await self._get_clue_from(spymaster=team.spymaster)
+        while self.state.left_guesses > 0:
+            await self._get_guess_from(operative=team.operative)
+
+    async def _get_clue_from(self, spymaster: AnySpymaster):
+        log.info("%s[%s] turn.", SEPARATOR, self.state.current_team)
+        with self.instrumentation.measure(Metric.SPYMASTER_VIEW):
+            spymaster_view = self.state.spymaster_view
+        clue = await request_timed_clue(
+            self.move_timer,
+            spymaster,
+            spymaster_view,
+            in_thread=self.sync_players_in_thread,
+        )
+        if clue is None:
+            self._time_out(player=spymaster)
+            return
+        with self.instrumentation.measure(Metric.CLUE_SUBSCRIBERS):
+            for subscriber in self.clue_given_subscribers:
+                subscriber(spymaster, clue)
+        with self.instrumentation.measure(Metric.PROCESS_CLUE):
+            given_clue = self.state.process_clue(clue=clue)
+        if given_clue is None:
+            return
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_clue_given(given_clue=given_clue)
+
+    def _time_out(self, player: AnySpymaster | AnyOperative):
+        for subscriber in self.timed_out_subscribers:
+            subscriber(player)
+        self.state.time_out()
+
+    async def _get_guess_from(self, operative: AnyOperative):
+        given_guess = await self._get_guess_until_valid(operative)
+        if given_guess is None:
+            return
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_guess_given(given_guess=given_guess)
+
+    async def _get_guess_until_valid(self, operative: AnyOperative) -> GivenGuess | None:
+        with self.instrumentation.measure(Metric.OPERATIVE_VIEW):
+            operative_view = self.state.operative_view
+        invalid_guesses = 0
+        while True:
+            guess = await request_timed_guess(
+                self.move_timer,
+                operative,
+                operative_view,
+                invalid_guesses=invalid_guesses,
+                in_thread=self.sync_players_in_thread,
+            )
+            if guess is None:
+                self._time_out(player=operative)
+                return None
+            try:
+                with self.instrumentation.measure(Metric.PROCESS_GUESS):
+                    given_guess = self.state.process_guess(guess=guess)
+                with self.instrumentation.measure(Metric.GUESS_SUBSCRIBERS):
+                    for subscriber in self.guess_given_subscribers:
+                        subscriber(operative, guess)
+                return given_guess
+            except InvalidGuess:
+                invalid_guesses += 1
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import logging
-import random
 from typing import Self
 
 from codenames.classic.color import ClassicColor
 from codenames.classic.team import ClassicTeam
 from codenames.classic.types import ClassicCard, ClassicCards
 from codenames.generic.board import Board, Vocabulary
-from codenames.utils.builder import extract_random_subset
+from codenames.utils.builder import RandomSource, assign_colors, get_rng
 from codenames.utils.vocabulary.languages import get_vocabulary
 
 log = logging.getLogger(__name__)
@@ -45,28 +44,52 @@ class ClassicBoard(Board[ClassicColor]):
         assassin_amount: int = 1,
         first_team: ClassicTeam | None = None,
         seed: int | None = None,
+        *,
+        rng: RandomSource | None = None,
     ) -> Self:
-        if seed:
-            random.seed(seed)
+        boards = cls.many_from_vocabulary(
+            vocabulary=vocabulary,
+            amount=1,
+            board_size=board_size,
+            assassin_amount=assassin_amount,
+            first_team=first_team,
+            seed=seed,
+            rng=rng,
+        )
+        return boards[0]
 
-        first_team = first_team or random.choice(list(ClassicTeam))  # type: ignore[assignment]
-        red_amount = blue_amount = board_size // 3
-        if first_team == ClassicTeam.RED:
-            red_amount += 1
-        else:
-            blue_amount += 1
-        neutral_amount = board_size - red_amount - blue_amount - assassin_amount
-
-        extract_red = extract_random_subset(vocabulary.words, red_amount)
-        extract_blue = extract_random_subset(extract_red.remaining, blue_amount)
-        extract_neutral = extract_random_subset(extract_blue.remaining, neutral_amount)
-        extract_assassin = extract_random_subset(extract_neutral.remaining, assassin_amount)
-
-        red_cards = [ClassicCard(word=word, color=ClassicColor.RED) for word in extract_red.sample]
-        blue_cards = [ClassicCard(word=word, color=ClassicColor.BLUE) for word in extract_blue.sample]
-        neutral_cards = [ClassicCard(word=word, color=ClassicColor.NEUTRAL) for word in extract_neutral.sample]
-        assassin_cards = [ClassicCard(word=word, color=ClassicColor.ASSASSIN) for word in extract_assassin.sample]
-
-        all_cards = red_cards + blue_cards + neutral_cards + assassin_cards
-        random.shuffle(all_cards)
-        return cls(language=vocabulary.language, cards=all_cards)
+    @classmethod
+    def many_from_vocabulary(
+        cls,
+        vocabulary: Vocabulary,
+        amount: int,
+        *,
+        board_size: int = 25,
+        assassin_amount: int = 1,
+        first_team: ClassicTeam | None = None,
+        seed: int | None = None,
+        rng: RandomSource | None = None,
+    ) -> list[Self]:
+        local_rng = get_rng(seed=seed, rng=rng)
+        words = tuple(vocabulary.words)
+        teams = list(ClassicTeam)
+        boards = []
+        for _ in range(amount):
+            board_first_team = first_team or local_rng.choice(teams)
+            red_amount = blue_amount = board_size // 3
+            if board_first_team == ClassicTeam.RED:
+                red_amount += 1
+            else:
+                blue_amount += 1
+            neutral_amount = board_size - red_amount - blue_amount - assassin_amount
+            color_amounts = [
+                (ClassicColor.RED, red_amount),
+                (ClassicColor.BLUE, blue_amount),
+                (ClassicColor.NEUTRAL, neutral_amount),
+                (ClassicColor.ASSASSIN, assassin_amount),
+            ]
+            cards = [
+                ClassicCard(word=word, color=color) for word, color in assign_colors(words, color_amounts, local_rng)
+            ]
+            boards.append(cls(language=vocabulary.language, cards=cards))
+        return boards
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.color import ClassicColor
+from codenames.classic.score import Score
+from codenames.classic.state import ClassicGameState
+from codenames.classic.team import ClassicTeam
+from codenames.classic.types import ClassicCard
+from codenames.classic.winner import Winner, WinningReason
+from codenames.generic.board import Board
+from codenames.generic.exceptions import GameIsOver, InvalidGuess, InvalidTurn
+from codenames.generic.move import PASS_GUESS, QUIT_GAME
+from codenames.generic.player import PlayerRole
+from codenames.generic.state import TeamScore
+
+# Array codes, the position in each tuple is the value stored in the arrays.
+# Team codes match the codes of their card colors.
+TEAMS = (ClassicTeam.BLUE, ClassicTeam.RED)
+COLORS = (ClassicColor.BLUE, ClassicColor.RED, ClassicColor.NEUTRAL, ClassicColor.ASSASSIN)
+REASONS = tuple(WinningReason)
+
+BLUE, RED, NEUTRAL, ASSASSIN = range(len(COLORS))
+NO_WINNER = -1
+TARGET_REACHED = REASONS.index(WinningReason.TARGET_SCORE_REACHED)
+HIT_ASSASSIN = REASONS.index(WinningReason.OPPONENT_HIT_ASSASSIN)
+QUIT = REASONS.index(WinningReason.OPPONENT_QUIT)
+
+type BoolArray = np.ndarray
+type IntArray = np.ndarray
+
+
+@dataclass
+class ClassicGameBatch:  # pylint: disable=too-many-instance-attributes
+    """
+    N classic games held as arrays, game `i` is row `i` of every array, team `t` is column `t` (0 is blue).
+    Clues and guesses are applied to many games per call, with the rules of `ClassicGameState`.
+    Clue words are not tracked, so clue legality is left to the caller.
+    """
+
+    colors: IntArray  # (N, board size), codes of COLORS
+    revealed: BoolArray  # (N, board size)
+    score_total: IntArray  # (N, 2)
+    score_revealed: IntArray  # (N, 2)
+    current_team: IntArray  # (N,), codes of TEAMS
+    operative_turn: BoolArray  # (N,), whether the current role is the operative
+    left_guesses: IntArray  # (N,)
+    winner: IntArray  # (N,), codes of TEAMS, or NO_WINNER
+    winning_reason: IntArray  # (N,), codes of REASONS, or NO_WINNER
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[ClassicBoard]) -> ClassicGameBatch:
+        if not all(board.is_clean for board in boards):
+            raise ValueError("Boards must be clean.")
+        colors = np.array([_color_codes(board) for board in boards], dtype=np.int8)
+        score_total = np.stack([np.count_nonzero(colors == BLUE, axis=1), np.count_nonzero(colors == RED, axis=1)], 1)
+        amount = len(boards)
+        return cls(
+            colors=colors,
+            revealed=np.zeros(colors.shape, dtype=bool),
+            score_total=score_total.astype(np.int16),
+            score_revealed=np.zeros((amount, 2), dtype=np.int16),
+            # As in `ClassicGameState.from_board`, blue starts unless red has more cards.
+            current_team=np.where(score_total[:, BLUE] >= score_total[:, RED], BLUE, RED).astype(np.int8),
+            operative_turn=np.zeros(amount, dtype=bool),
+            left_guesses=np.zeros(amount, dtype=np.int16),
+            winner=np.full(amount, NO_WINNER, dtype=np.int8),
+            winning_reason=np.full(amount, NO_WINNER, dtype=np.int8),
+        )
+
+    @classmethod
+    def from_states(cls, states: Sequence[ClassicGameState]) -> ClassicGameBatch:
+        scores = [(state.score.blue, state.score.red) for state in states]
+        return cls(
+            colors=np.array([_color_codes(state.board) for state in states], dtype=np.int8),
+            revealed=np.array([[card.revealed for card in state.board.cards] for state in states], dtype=bool),
+            score_total=np.array([[score.total for score in team_scores] for team_scores in scores], dtype=np.int16),
+            score_revealed=np.array(
+                [[score.revealed for score in team_scores] for team_scores in scores],
+                dtype=np.int16,
+            ),
+            current_team=np.array([TEAMS.index(state.current_team) for state in states], dtype=np.int8),
+            operative_turn=np.array([state.current_player_role == PlayerRole.OPERATIVE for state in states]),
+            left_guesses=np.array([state.left_guesses for state in states], dtype=np.int16),
+            winner=np.array(
+                [TEAMS.index(state.winner.team) if state.winner else NO_WINNER for state in states],
+                dtype=np.int8,
+            ),
+            winning_reason=np.array(
+                [REASONS.index(state.winner.reason) if state.winner else NO_WINNER for state in states],
+                dtype=np.int8,
+            ),
+        )
+
+    def to_states(self, boards: Sequence[ClassicBoard]) -> list[ClassicGameState]:
+        """
+        Builds a `ClassicGameState` per game, taking words and language from `boards` (in game order).
+        Clue and guess histories are not tracked, so they are empty.
+        """
+        if len(boards) != self.size:
+            msg = f"Got {len(boards)} boards for {self.size} games"
+            raise ValueError(msg)
+        return [self._to_state(i, board=board) for i, board in enumerate(boards)]
+
+    @property
+    def size(self) -> int:
+        return len(self.current_team)
+
+    @property
+    def is_game_over(self) -> BoolArray:
+        return self.winner != NO_WINNER
+
+    @property
+    def winners(self) -> list[Winner | None]:
+        return [self._get_winner(i) for i in range(self.size)]
+
+    @property
+    def awaiting_clue(self) -> BoolArray:
+        return ~self.is_game_over & ~self.operative_turn
+
+    @property
+    def awaiting_guess(self) -> BoolArray:
+        return ~self.is_game_over & self.operative_turn
+
+    @property
+    def hidden_cards(self) -> BoolArray:
+        return ~self.revealed
+
+    def process_clues(self, card_amounts: IntArray, active: BoolArray | None = None):
+        """
+        Gives a clue for `card_amounts[i]` cards in every active game `i` (all games awaiting a clue by default),
+        `QUIT_GAME` included.
+        """
+        games = np.flatnonzero(self.awaiting_clue) if active is None else self._active_games(active)
+        amounts = np.asarray(card_amounts)[games]
+        self._validate_clues(games)
+        self._apply_clues(games, amounts=amounts)
+
+    def process_guesses(self, card_indexes: IntArray, active: BoolArray | None = None):
+        """
+        Applies `card_indexes[i]` to every active game `i` (all games awaiting a guess by default),
+        `PASS_GUESS` and `QUIT_GAME` included. Nothing is applied if any active guess is invalid.
+        """
+        games = np.flatnonzero(self.awaiting_guess) if active is None else self._active_games(active)
+        guesses = np.asarray(card_indexes)[games]
+        self._validate_guesses(games, guesses=guesses)
+        self._apply_guesses(games, guesses=guesses)
+
+    def process_moves(self, moves: IntArray, active: BoolArray | None = None):
+        """
+        A single step over all active games (all unfinished games by default): `moves[i]` is a card amount
+        for games awaiting a clue, and a card index for games awaiting a guess.
+        """
+        active = ~self.is_game_over if active is None else active
+        clue_games = self._active_games(active & ~self.operative_turn)
+        guess_games = self._active_games(active & self.operative_turn)
+        moves = np.asarray(moves)
+        self._validate_guesses(guess_games, guesses=moves[guess_games])
+        self._apply_clues(clue_games, amounts=moves[clue_games])
+        self._apply_guesses(guess_games, guesses=moves[guess_games])
+
+    def _active_games(self, active: BoolArray) -> IntArray:
+        games = np.flatnonzero(active)
+        if np.any(self.is_game_over[games]):
+            raise GameIsOver
+        return games
+
+    def _validate_clues(self, games: IntArray):
+        if np.any(self.operative_turn[games]):
+            raise InvalidTurn("It's not the Spymaster's turn now!")
+
+    def _validate_guesses(self, games: IntArray, guesses: IntArray):
+        if not np.all(self.operative_turn[games]):
+            raise InvalidTurn("It's not the Operative's turn now!")
+        picked = (guesses != PASS_GUESS) & (guesses != QUIT_GAME)
+        board_size = self.colors.shape[1]
+        if np.any(picked & ((guesses < 0) | (guesses >= board_size))):
+            raise InvalidGuess("Given card index is out of range!")
+        if np.any(self.revealed[games[picked], guesses[picked]]):
+            raise InvalidGuess("Given card is already revealed!")
+
+    def _apply_clues(self, games: IntArray, amounts: IntArray):
+        # As in `ClassicGameState.process_clue`.
+        quit_ = amounts == QUIT_GAME
+        self._team_quit(games[quit_])
+        given = games[~quit_]
+        self.left_guesses[given] = amounts[~quit_] + 1
+        self.operative_turn[given] = True
+
+    def _apply_guesses(self, games: IntArray, guesses: IntArray):
+        # As in `ClassicGameState.process_guess`.
+        passed, quit_ = guesses == PASS_GUESS, guesses == QUIT_GAME
+        picked = ~passed & ~quit_
+        teams = self.current_team[games]
+        cards = np.where(picked, guesses, 0)
+        colors = self.colors[games, cards]
+        self.revealed[games[picked], cards[picked]] = True
+        self._update_scores(games[picked], teams=teams[picked], colors=colors[picked])
+        correct = picked & (colors == teams)
+        continues = correct & ~self.is_game_over[games]
+        self.left_guesses[games[continues]] -= 1
+        continues &= self.left_guesses[games] > 0
+        self._end_turn(games[passed | (picked & ~continues)])
+        self._team_quit(games[quit_])
+
+    def _update_scores(self, games: IntArray, teams: IntArray, colors: IntArray):
+        # As in `ClassicGameState._update_score`, a team colored card scores for its own team.
+        assassin = colors == ASSASSIN
+        self._set_winner(games[assassin], teams=1 - teams[assassin], reason=HIT_ASSASSIN)
+        scored = colors <= RED
+        games, colors = games[scored], colors[scored]
+        self.score_revealed[games, colors] += 1
+        reached = self.score_revealed[games, colors] == self.score_total[games, colors]
+        self._set_winner(games[reached], teams=colors[reached], reason=TARGET_REACHED)
+
+    def _team_quit(self, games: IntArray):
+        self._set_winner(games, teams=1 - self.current_team[games], reason=QUIT)
+        self._end_turn(games)
+
+    def _set_winner(self, games: IntArray, teams: IntArray, reason: int):
+        self.winner[games] = teams
+        self.winning_reason[games] = reason
+
+    def _end_turn(self, games: IntArray):
+        self.left_guesses[games] = 0
+        self.current_team[games] = 1 - self.current_team[games]
+        self.operative_turn[games] = ~self.operative_turn[games]
+
+    def _to_state(self, i: int, board: ClassicBoard) -> ClassicGameState:
+        cards = [
+            ClassicCard(word=card.word, color=COLORS[color], revealed=revealed)
+            for card, color, revealed in zip(board.cards, self.colors[i], self.revealed[i], strict=True)
+        ]
+        blue_score, red_score = (
+            TeamScore(total=int(total), revealed=int(revealed))
+            for total, revealed in zip(self.score_total[i], self.score_revealed[i], strict=True)
+        )
+        return ClassicGameState(
+            board=ClassicBoard(language=board.language, cards=cards),
+            score=Score(blue=blue_score, red=red_score),
+            current_team=TEAMS[self.current_team[i]],
+            current_player_role=PlayerRole.OPERATIVE if self.operative_turn[i] else PlayerRole.SPYMASTER,
+            left_guesses=int(self.left_guesses[i]),
+            winner=self._get_winner(i),
+        )
+
+    def _get_winner(self, i: int) -> Winner | None:
+        if self.winner[i] == NO_WINNER:
+            return None
+        return Winner(team=TEAMS[self.winner[i]], reason=REASONS[self.winning_reason[i]])
+
+
+def _color_codes(board: Board[ClassicColor]) -> list[int]:
+    return [COLORS.index(card.color) for card in board.cards]  # type: ignore[arg-type]
@@ -15,9 +15,14 @@ from codenames.generic.runner import (
     SEPARATOR,
     ClueGivenSubscriber,
     GuessGivenSubscriber,
+    MovePolicy,
+    MoveTimer,
+    MoveTiming,
     TeamPlayers,
+    TimedOutSubscriber,
 )
 from codenames.utils.formatting import wrap
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
 
 log = logging.getLogger(__name__)
 
@@ -63,6 +68,8 @@ class ClassicGameRunner:
         players: ClassicGamePlayers,
         state: ClassicGameState | None = None,
         board: ClassicBoard | None = None,
+        move_policy: MovePolicy | None = None,
+        instrumentation: Instrumentation | None = None,
     ):
         self.players = players
         if not state:
@@ -70,8 +77,11 @@ class ClassicGameRunner:
                 raise ValueError("Exactly one of state or board must be provided.")
             state = ClassicGameState.from_board(board=board)
         self.state = state
+        self.instrumentation = instrumentation or NO_INSTRUMENTATION
+        self.move_timer = MoveTimer(policy=move_policy or MovePolicy(), instrumentation=self.instrumentation)
         self.clue_given_subscribers: list[ClueGivenSubscriber] = []
         self.guess_given_subscribers: list[GuessGivenSubscriber] = []
+        self.timed_out_subscribers: list[TimedOutSubscriber] = []
 
     @property
     def spymasters(self) -> tuple[Spymaster, Spymaster]:
@@ -93,6 +103,14 @@ class ClassicGameRunner:
     def winner(self) -> Winner | None:
         return self.state.winner
 
+    @property
+    def move_policy(self) -> MovePolicy:
+        return self.move_timer.policy
+
+    @property
+    def move_timings(self) -> list[MoveTiming]:
+        return self.move_timer.timings
+
     def run_game(self) -> Winner:
         self._notify_game_starts()
         winner = self._run_rounds()
@@ -101,10 +119,11 @@ class ClassicGameRunner:
 
     def _notify_game_starts(self):
         censored_board = self.state.board.censored
-        for spymaster in self.spymasters:
-            spymaster.on_game_start(board=self.state.board)
-        for operative in self.operatives:
-            operative.on_game_start(board=censored_board)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for spymaster in self.spymasters:
+                spymaster.on_game_start(board=self.state.board)
+            for operative in self.operatives:
+                operative.on_game_start(board=censored_board)
 
     def _run_rounds(self) -> Winner:
         while not self.state.is_game_over:
@@ -118,33 +137,55 @@ class ClassicGameRunner:
             self._get_guess_from(operative=team.operative)
 
     def _get_clue_from(self, spymaster: Spymaster):
-        log.info(f"{SEPARATOR}{wrap(self.state.current_team)} turn.")
-        clue = spymaster.give_clue(game_state=self.state.spymaster_state)
-        for subscriber in self.clue_given_subscribers:
-            subscriber(spymaster, clue)
-        given_clue = self.state.process_clue(clue=clue)
+        log.info("%s[%s] turn.", SEPARATOR, self.state.current_team)
+        with self.instrumentation.measure(Metric.SPYMASTER_VIEW):
+            spymaster_view = self.state.spymaster_view
+        clue = self.move_timer.give_clue(spymaster, game_state=spymaster_view)
+        if clue is None:
+            self._time_out(player=spymaster)
+            return
+        with self.instrumentation.measure(Metric.CLUE_SUBSCRIBERS):
+            for subscriber in self.clue_given_subscribers:
+                subscriber(spymaster, clue)
+        with self.instrumentation.measure(Metric.PROCESS_CLUE):
+            given_clue = self.state.process_clue(clue=clue)
         if given_clue is None:
             return
-        for player in self.players:
-            player.on_clue_given(given_clue=given_clue)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_clue_given(given_clue=given_clue)
+
+    def _time_out(self, player: Player):
+        for subscriber in self.timed_out_subscribers:
+            subscriber(player)
+        self.state.time_out()
 
     def _get_guess_from(self, operative: Operative):
         given_guess = self._get_guess_until_valid(operative)
         if given_guess is None:
             return
-        for player in self.players:
-            player.on_guess_given(given_guess=given_guess)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_guess_given(given_guess=given_guess)
 
     def _get_guess_until_valid(self, operative: Operative) -> GivenGuess | None:
+        with self.instrumentation.measure(Metric.OPERATIVE_VIEW):
+            operative_view = self.state.operative_view
+        invalid_guesses = 0
         while True:
-            guess = operative.guess(game_state=self.state.operative_state)
+            guess = self.move_timer.guess(operative, game_state=operative_view, invalid_guesses=invalid_guesses)
+            if guess is None:
+                self._time_out(player=operative)
+                return None
             try:
-                given_guess = self.state.process_guess(guess=guess)
-                for subscriber in self.guess_given_subscribers:
-                    subscriber(operative, guess)
+                with self.instrumentation.measure(Metric.PROCESS_GUESS):
+                    given_guess = self.state.process_guess(guess=guess)
+                with self.instrumentation.measure(Metric.GUESS_SUBSCRIBERS):
+                    for subscriber in self.guess_given_subscribers:
+                        subscriber(operative, guess)
                 return given_guess
             except InvalidGuess:
-                pass
+                invalid_guesses += 1
 
 
 def find_team(players: Collection[Player], team: ClassicTeam) -> TeamPlayers:
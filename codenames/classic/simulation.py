@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
+from codenames.classic.state import ClassicGameState
+from codenames.classic.team import ClassicTeam
+from codenames.classic.winner import WinningReason
+from codenames.generic.exceptions import InvalidGuess
+from codenames.generic.player import Operative
+from codenames.generic.runner import MovePolicy
+from codenames.utils.instrumentation import Instrumentation
+
+log = logging.getLogger(__name__)
+
+PlayersFactory = Callable[[], ClassicGamePlayers]
+
+
+@dataclass(frozen=True, slots=True)
+class GameRecord:
+    winner: ClassicTeam
+    reason: WinningReason
+    turn_count: int
+    blue_revealed: int
+    red_revealed: int
+
+    @classmethod
+    def from_state(cls, state: ClassicGameState) -> GameRecord:
+        if state.winner is None:
+            raise ValueError("Game is not over yet.")
+        return cls(
+            winner=state.winner.team,
+            reason=state.winner.reason,
+            turn_count=len(state.given_clues),
+            blue_revealed=state.score.blue.revealed,
+            red_revealed=state.score.red.revealed,
+        )
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    records: list[GameRecord]
+    duration_sec: float
+
+    @property
+    def games_per_second(self) -> float:
+        if self.duration_sec <= 0:
+            return 0.0
+        return len(self.records) / self.duration_sec
+
+    def wins(self, team: ClassicTeam) -> int:
+        return sum(1 for record in self.records if record.winner == team)
+
+
+class ClassicGameSimulator:
+    """
+    Plays many headless games, one per board, with fresh players for every game.
+    Games are stepped directly on a state that skips pydantic validation, without subscribers, move timings
+    or per-move player notifications (`on_clue_given` / `on_guess_given`), so players must not depend on them.
+    A move policy or instrumentation needs the full `ClassicGameRunner`, which is used for those games.
+    Logging is left to the caller, see `quiet_logging`.
+    """
+
+    def __init__(self, players_factory: PlayersFactory, move_policy: MovePolicy | None = None):
+        self.players_factory = players_factory
+        self.move_policy = move_policy
+
+    def run(self, boards: Iterable[ClassicBoard]) -> SimulationResult:
+        start = time.perf_counter()
+        records = [self.run_game(board=board) for board in boards]
+        duration = time.perf_counter() - start
+        result = SimulationResult(records=records, duration_sec=duration)
+        log.info(f"Simulated {len(records)} games in {duration:.2f} seconds ({result.games_per_second:.1f} games/sec)")
+        return result
+
+    def run_game(self, board: ClassicBoard, instrumentation: Instrumentation | None = None) -> GameRecord:
+        return GameRecord.from_state(self.play_game(board=board, instrumentation=instrumentation))
+
+    def play_game(self, board: ClassicBoard, instrumentation: Instrumentation | None = None) -> ClassicGameState:
+        state = ClassicGameState.from_board(board=board, validate=False)
+        players = self.players_factory()
+        if self.move_policy is None and instrumentation is None:
+            _play_lean(players=players, state=state)
+            return state
+        runner = ClassicGameRunner(
+            players=players,
+            state=state,
+            move_policy=self.move_policy,
+            instrumentation=instrumentation,
+        )
+        runner.run_game()
+        return state
+
+
+def _play_lean(players: ClassicGamePlayers, state: ClassicGameState):
+    # The turn loop of `ClassicGameRunner`, minus everything a headless game between bots doesn't need.
+    censored_board = state.board.censored
+    for spymaster in players.spymasters:
+        spymaster.on_game_start(board=state.board)
+    for operative in players.operatives:
+        operative.on_game_start(board=censored_board)
+    while not state.is_game_over:
+        team = players.blue_team if state.current_team == ClassicTeam.BLUE else players.red_team
+        state.process_clue(clue=team.spymaster.give_clue(game_state=state.spymaster_view))
+        while state.left_guesses > 0:
+            _play_guess(operative=team.operative, state=state)
+
+
+def _play_guess(operative: Operative, state: ClassicGameState):
+    operative_view = state.operative_view
+    while True:
+        try:
+            state.process_guess(guess=operative.guess(game_state=operative_view))
+            return
+        except InvalidGuess:
+            continue
+
+
+@contextmanager
+def quiet_logging(enabled: bool = True, logger_name: str = "codenames") -> Iterator[None]:
+    # Changes the level of a process-wide logger, so use it around a whole process or batch entry point,
+    # not around work that shares the process with other threads.
+    logger = logging.getLogger(logger_name)
+    original_level = logger.level
+    if enabled:
+        logger.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        logger.setLevel(original_level)
@@ -24,8 +24,8 @@ from codenames.generic.state import (
     PlayerState,
     SpymasterState,
     TeamScore,
+    model_builder,
 )
-from codenames.utils.formatting import wrap
 
 log = logging.getLogger(__name__)
 
@@ -75,18 +75,57 @@ class ClassicGameState(ClassicSpymasterState):
         return cls.from_board(board=board)
 
     @classmethod
-    def from_board(cls, board: ClassicBoard) -> Self:
+    def from_board(cls, board: ClassicBoard, validate: bool = True) -> Self:
         if not board.is_clean:
             raise ValueError("Board must be clean.")
         first_team = _determine_first_team(board)
         score = _build_score(board)
-        return cls(
+        build = cls if validate else cls.model_construct
+        return build(
             board=board,
             score=score,
             current_team=first_team,
             current_player_role=PlayerRole.SPYMASTER,
         )
 
+    def model_dump_normalized(self) -> dict[str, Any]:
+        data = self._dump_normalized_fields()
+        data.update(
+            score=[[score.total, score.revealed] for score in (self.score.blue, self.score.red)],
+            current_player_role=self.current_player_role,
+            clues=[[clue.word, clue.card_amount, clue.for_words] for clue in self.clues],
+            left_guesses=self.left_guesses,
+            winner=[self.winner.team, self.winner.reason] if self.winner else None,
+        )
+        return data
+
+    @classmethod
+    def model_validate_normalized(cls, data: dict[str, Any], trusted: bool = False) -> Self:
+        fields = cls._load_normalized_fields(
+            data,
+            board_class=ClassicBoard,
+            color_class=ClassicColor,
+            team_class=ClassicTeam,
+            trusted=trusted,
+        )
+        blue_score, red_score = (TeamScore(total=total, revealed=revealed) for total, revealed in data["score"])
+        clues = [
+            Clue(word=word, card_amount=card_amount, for_words=for_words)
+            for word, card_amount, for_words in data["clues"]
+        ]
+        winner = None
+        if data["winner"] is not None:
+            team, reason = data["winner"]
+            winner = Winner(team=team, reason=reason)
+        return model_builder(cls, trusted)(
+            **fields,
+            score=Score(blue=blue_score, red=red_score),
+            current_player_role=PlayerRole(data["current_player_role"]),
+            clues=clues,
+            left_guesses=data["left_guesses"],
+            winner=winner,
+        )
+
     @property
     def spymaster_state(self) -> ClassicSpymasterState:
         return ClassicSpymasterState(
@@ -111,6 +150,14 @@ class ClassicGameState(ClassicSpymasterState):
             left_guesses=self.left_guesses,
         )
 
+    @property
+    def spymaster_view(self) -> ClassicSpymasterState:
+        return self._build_view(ClassicSpymasterState, board=self.board)
+
+    @property
+    def operative_view(self) -> ClassicOperativeState:
+        return self._build_view(ClassicOperativeState, board=self.board.censored_view)
+
     @property
     def last_given_clue(self) -> GivenClue:
         return self.given_clues[-1]
@@ -129,12 +176,14 @@ class ClassicGameState(ClassicSpymasterState):
             log.info("Spymaster quit the game")
             self._team_quit()
             return None
-        formatted_clue_word = canonical_format(clue.word)
-        if formatted_clue_word in self.illegal_clue_words:
+        if self.is_illegal_clue_word(clue.word):
             raise InvalidClue("Clue word is on board or was already used!")
+        formatted_clue_word = canonical_format(clue.word)
         given_clue = ClassicGivenClue(word=formatted_clue_word, card_amount=clue.card_amount, team=self.current_team)
-        log.info(f"Spymaster: {wrap(clue.word)} {clue.card_amount} card(s)")
+        # Lazy formatting, this is called on every move
+        log.info("Spymaster: [%s] %s card(s)", clue.word, clue.card_amount)
         self.given_clues.append(given_clue)
+        self._add_illegal_clue_word(given_clue.formatted_word)
         self.left_guesses = given_clue.card_amount + 1
         self.current_player_role = PlayerRole.OPERATIVE
         return given_clue
@@ -154,7 +203,7 @@ class ClassicGameState(ClassicSpymasterState):
             return None
         guessed_card = self._reveal_guessed_card(guess)
         given_guess = ClassicGivenGuess(guessed_card=guessed_card, for_clue=self.last_given_clue)
-        log.info(f"Operative: {given_guess}")
+        log.info("Operative: %s", given_guess)
         self.given_guesses.append(given_guess)
         self._update_score(given_guess)
         if self.is_game_over:
@@ -179,7 +228,7 @@ class ClassicGameState(ClassicSpymasterState):
             raise InvalidGuess("Given card index is out of range!") from e
         if guessed_card.revealed:
             raise InvalidGuess("Given card is already revealed!")
-        guessed_card.revealed = True
+        self.board.reveal_card(guess.card_index)
         return guessed_card
 
     def _end_turn(self, switch_role: bool = True):
@@ -188,9 +237,15 @@ class ClassicGameState(ClassicSpymasterState):
         if switch_role:
             self.current_player_role = self.current_player_role.other
 
-    def _team_quit(self):
+    def time_out(self):
+        if self.is_game_over:
+            raise GameIsOver
+        log.info("%s team timed out", self.current_team)
+        self._team_quit(reason=WinningReason.OPPONENT_TIMED_OUT)
+
+    def _team_quit(self, reason: WinningReason = WinningReason.OPPONENT_QUIT):
         winner_color = self.current_team.opponent
-        self.winner = Winner(team=winner_color, reason=WinningReason.OPPONENT_QUIT)
+        self.winner = Winner(team=winner_color, reason=reason)
         self._end_turn()
 
     def _update_score(self, given_guess: ClassicGivenGuess):
@@ -208,13 +263,20 @@ class ClassicGameState(ClassicSpymasterState):
 
 
 def _determine_first_team(board: ClassicBoard) -> ClassicTeam:
-    if len(board.blue_cards) >= len(board.red_cards):
+    blue_mask, red_mask = board.color_mask(ClassicColor.BLUE), board.color_mask(ClassicColor.RED)
+    if blue_mask.bit_count() >= red_mask.bit_count():
         return ClassicTeam.BLUE
     return ClassicTeam.RED
 
 
 def _build_score(board: ClassicBoard) -> Score:
-    blue_score = TeamScore(total=len(board.blue_cards), revealed=len(board.revealed_cards_for_color(ClassicColor.BLUE)))
-    red_score = TeamScore(total=len(board.red_cards), revealed=len(board.revealed_cards_for_color(ClassicColor.RED)))
+    blue_score = _build_team_score(board, card_color=ClassicColor.BLUE)
+    red_score = _build_team_score(board, card_color=ClassicColor.RED)
     score = Score(blue=blue_score, red=red_score)
     return score
+
+
+def _build_team_score(board: ClassicBoard, card_color: ClassicColor) -> TeamScore:
+    color_mask = board.color_mask(card_color)
+    revealed_mask = color_mask & board.revealed_mask
+    return TeamScore(total=color_mask.bit_count(), revealed=revealed_mask.bit_count())
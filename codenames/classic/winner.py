@@ -9,6 +9,7 @@ class WinningReason(StrEnum):
     TARGET_SCORE_REACHED = "Target score reached"
     OPPONENT_HIT_ASSASSIN = "Opponent hit assassin card"
     OPPONENT_QUIT = "Opponent quit"
+    OPPONENT_TIMED_OUT = "Opponent timed out"
 
 
 class Winner(BaseModel):
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Iterator
+
+from codenames.duet.board import DuetBoard
+from codenames.duet.player import AsyncDuetPlayer, DuetPlayer
+from codenames.duet.runner import DuetGamePlayers
+from codenames.duet.score import GameResult
+from codenames.duet.state import DuetGameState, DuetSide
+from codenames.generic.async_runner import (
+    AnyOperative,
+    AnySpymaster,
+    AsyncClueGivenSubscriber,
+    AsyncGuessGivenSubscriber,
+    AsyncTeamPlayers,
+    AsyncTimedOutSubscriber,
+    request_timed_clue,
+    request_timed_guess,
+)
+from codenames.generic.exceptions import InvalidGuess
+from codenames.generic.move import GivenGuess
+from codenames.generic.player import PlayerRole
+from codenames.generic.runner import SEPARATOR, MovePolicy, MoveTimer, MoveTiming
+from codenames.utils.formatting import wrap
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
+
+log = logging.getLogger(__name__)
+
+AnyDuetPlayer = DuetPlayer | AsyncDuetPlayer
+
+
+@dataclass
+class AsyncDuetGamePlayers:
+    player_a: AnyDuetPlayer
+    player_b: AnyDuetPlayer
+
+    @classmethod
+    def from_players(cls, players: DuetGamePlayers) -> AsyncDuetGamePlayers:
+        return cls(player_a=players.player_a, player_b=players.player_b)
+
+    @property
+    def team_a(self) -> AsyncTeamPlayers:
+        return AsyncTeamPlayers(spymaster=self.player_a, operative=self.player_b)
+
+    @property
+    def team_b(self) -> AsyncTeamPlayers:
+        return AsyncTeamPlayers(spymaster=self.player_b, operative=self.player_a)
+
+    def __iter__(self) -> Iterator[AnyDuetPlayer]:
+        return iter([self.player_a, self.player_b])
+
+
+class AsyncDuetGameRunner:  # pylint: disable=too-many-instance-attributes
+    """
+    Same game flow as `DuetGameRunner`, but awaits player moves, so one event loop can drive many games.
+    """
+
+    def __init__(
+        self,
+        players: AsyncDuetGamePlayers | DuetGamePlayers,
+        state: DuetGameState | None = None,
+        board: DuetBoard | None = None,
+        sync_players_in_thread: bool = False,
+        *,
+        move_policy: MovePolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
+        if isinstance(players, DuetGamePlayers):
+            players = AsyncDuetGamePlayers.from_players(players)
+        self.players = players
+        if (not state and not board) or (state and board):
+            raise ValueError("Exactly one of state or board must be provided.")
+        self.state = state or DuetGameState.from_board(board=board)  # type: ignore[arg-type]
+        self.sync_players_in_thread = sync_players_in_thread
+        self.instrumentation = instrumentation or NO_INSTRUMENTATION
+        self.move_timer = MoveTimer(policy=move_policy or MovePolicy(), instrumentation=self.instrumentation)
+        self.clue_given_subscribers: list[AsyncClueGivenSubscriber] = []
+        self.guess_given_subscribers: list[AsyncGuessGivenSubscriber] = []
+        self.timed_out_subscribers: list[AsyncTimedOutSubscriber] = []
+
+    @property
+    def current_team(self) -> AsyncTeamPlayers:
+        if self.state.current_playing_side == DuetSide.SIDE_A:
+            return self.players.team_a
+        return self.players.team_b
+
+    @property
+    def move_policy(self) -> MovePolicy:
+        return self.move_timer.policy
+
+    @property
+    def move_timings(self) -> list[MoveTiming]:
+        return self.move_timer.timings
+
+    @property
+    def current_role(self) -> PlayerRole:
+        return self.state.current_side_state.current_player_role
+
+    async def run_game(self) -> GameResult:
+        self._notify_game_starts()
+        while not self.state.is_game_over:
+            await self._run_side_turn()
+        result: GameResult = self.state.game_result  # type: ignore[assignment]
+        suffix = "win!" if result.win else "lose!"
+        log.info(f"{SEPARATOR}{result.reason}, you {suffix}")
+        return result
+
+    def _notify_game_starts(self):
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            self.players.player_a.on_game_start(board=self.state.side_a.board)
+            self.players.player_a.on_game_start(board=self.state.side_b.board.censored)
+            self.players.player_b.on_game_start(board=self.state.side_b.board)
+            self.players.player_b.on_game_start(board=self.state.side_a.board.censored)
+
+    async def _run_side_turn(self):
+        side_turn = self.state.current_playing_side
+        log.info(f"{SEPARATOR}{wrap(side_turn)} turn.")
+        team = self.current_team
+        if not self.state.is_sudden_death:
+            await self._get_clue_from(spymaster=team.spymaster)
+        while not self.state.is_game_over and self.current_role == PlayerRole.OPERATIVE:
+            await self._get_guess_from(operative=team.operative)
+            # In sudden death, we get one guess per operative turn
+            if self.state.is_sudden_death:
+                break
+
+    async def _get_clue_from(self, spymaster: AnySpymaster):
+        state, dual_state = self.state.current_side_state, self.state.current_dual_state
+        with self.instrumentation.measure(Metric.SPYMASTER_VIEW):
+            spymaster_view = state.get_spymaster_view(dual_state=dual_state)
+        clue = await request_timed_clue(
+            self.move_timer,
+            spymaster,
+            spymaster_view,
+            in_thread=self.sync_players_in_thread,
+        )
+        if clue is None:
+            self._time_out(player=spymaster)
+            return
+        with self.instrumentation.measure(Metric.CLUE_SUBSCRIBERS):
+            for subscriber in self.clue_given_subscribers:
+                subscriber(spymaster, clue)
+        with self.instrumentation.measure(Metric.PROCESS_CLUE):
+            given_clue = self.state.process_clue(clue=clue)
+        if given_clue is None:
+            return
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_clue_given(given_clue=given_clue)
+
+    def _time_out(self, player: AnySpymaster | AnyOperative):
+        for subscriber in self.timed_out_subscribers:
+            subscriber(player)
+        self.state.time_out()
+
+    async def _get_guess_from(self, operative: AnyOperative):
+        given_guess = await self._get_guess_until_valid(operative)
+        if given_guess is None:
+            return
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_guess_given(given_guess=given_guess)
+
+    async def _get_guess_until_valid(self, operative: AnyOperative) -> GivenGuess | None:
+        state, dual_state = self.state.current_side_state, self.state.current_dual_state
+        with self.instrumentation.measure(Metric.OPERATIVE_VIEW):
+            operative_view = state.get_operative_view(dual_state=dual_state)
+        invalid_guesses = 0
+        while True:
+            guess = await request_timed_guess(
+                self.move_timer,
+                operative,
+                operative_view,
+                invalid_guesses=invalid_guesses,
+                in_thread=self.sync_players_in_thread,
+            )
+            if guess is None:
+                self._time_out(player=operative)
+                return None
+            try:
+                with self.instrumentation.measure(Metric.PROCESS_GUESS):
+                    given_guess = self.state.process_guess(guess=guess)
+            except InvalidGuess:
+                invalid_guesses += 1
+                continue
+            with self.instrumentation.measure(Metric.GUESS_SUBSCRIBERS):
+                for subscriber in self.guess_given_subscribers:
+                    subscriber(operative, guess)
+            return given_guess
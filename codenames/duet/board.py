@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import logging
-import random
 from typing import Self
 
 from codenames.duet.card import DuetColor
 from codenames.duet.types import DuetCard, DuetCards
 from codenames.generic.board import Board, Vocabulary
-from codenames.utils.builder import extract_random_subset
+from codenames.utils.builder import RandomSource, assign_colors, get_rng
 
 log = logging.getLogger(__name__)
 
@@ -21,7 +20,7 @@ class DuetBoard(Board[DuetColor]):
     @property
     def is_clean(self) -> bool:
         base = super().is_clean
-        return base and not self.irrelevant_cards
+        return base and not self.color_mask(DuetColor.IRRELEVANT)
 
     @property
     def green_cards(self) -> DuetCards:
@@ -47,27 +46,56 @@ class DuetBoard(Board[DuetColor]):
         green_amount: int = 9,
         assassin_amount: int = 3,
         seed: int | None = None,
+        *,
+        rng: RandomSource | None = None,
     ) -> Self:
-        if seed:
-            random.seed(seed)
+        boards = cls.many_from_vocabulary(
+            vocabulary=vocabulary,
+            amount=1,
+            board_size=board_size,
+            green_amount=green_amount,
+            assassin_amount=assassin_amount,
+            seed=seed,
+            rng=rng,
+        )
+        return boards[0]
 
+    @classmethod
+    def many_from_vocabulary(
+        cls,
+        vocabulary: Vocabulary,
+        amount: int,
+        *,
+        board_size: int = 25,
+        green_amount: int = 9,
+        assassin_amount: int = 3,
+        seed: int | None = None,
+        rng: RandomSource | None = None,
+    ) -> list[Self]:
+        local_rng = get_rng(seed=seed, rng=rng)
+        words = tuple(vocabulary.words)
         neutral_amount = board_size - green_amount - assassin_amount
-        extract_green = extract_random_subset(vocabulary.words, green_amount)
-        extract_neutral = extract_random_subset(extract_green.remaining, neutral_amount)
-        extract_assassin = extract_random_subset(extract_neutral.remaining, assassin_amount)
-
-        green_cards = [DuetCard(word=word, color=DuetColor.GREEN) for word in extract_green.sample]
-        neutral_cards = [DuetCard(word=word, color=DuetColor.NEUTRAL) for word in extract_neutral.sample]
-        assassin_cards = [DuetCard(word=word, color=DuetColor.ASSASSIN) for word in extract_assassin.sample]
-
-        all_cards = green_cards + neutral_cards + assassin_cards
-        random.shuffle(all_cards)
-        return cls(language=vocabulary.language, cards=all_cards)
+        color_amounts = [
+            (DuetColor.GREEN, green_amount),
+            (DuetColor.NEUTRAL, neutral_amount),
+            (DuetColor.ASSASSIN, assassin_amount),
+        ]
+        boards = []
+        for _ in range(amount):
+            cards = [DuetCard(word=word, color=color) for word, color in assign_colors(words, color_amounts, local_rng)]
+            boards.append(cls(language=vocabulary.language, cards=cards))
+        return boards
 
     @classmethod
-    def dual_board(cls, board: DuetBoard, overlap_ratio: float = 3, seed: int | None = None) -> Self:
-        if seed:
-            random.seed(seed)
+    def dual_board(
+        cls,
+        board: DuetBoard,
+        overlap_ratio: float = 3,
+        seed: int | None = None,
+        *,
+        rng: RandomSource | None = None,
+    ) -> Self:
+        local_rng = get_rng(seed=seed, rng=rng)
         # Given board analysis
         cards_range = range(len(board.cards))
         card_colors = [card.color for card in board.cards]
@@ -80,14 +108,14 @@ class DuetBoard(Board[DuetColor]):
         # Now we need to:
         #  1. Pick *overlapping* green card indices
         overlap = round(len(green_indices) / overlap_ratio)
-        common_green_indices = set(random.sample(green_indices, overlap))
+        common_green_indices = set(local_rng.sample(green_indices, overlap))
         #  2. Pick the remaining green card indices from the *non-green* indices
         remaining_green_count = len(green_indices) - overlap
-        unique_green_indices = set(random.sample(non_green_indices, remaining_green_count))
+        unique_green_indices = set(local_rng.sample(non_green_indices, remaining_green_count))
         dst_non_green_indices = set(cards_range) - set(unique_green_indices) - set(common_green_indices)
         #  3. Fill up the rest of the places with the non-green colors.
         assert len(dst_non_green_indices) == len(non_green_colors)
-        random.shuffle(non_green_colors)
+        local_rng.shuffle(non_green_colors)
         for i, color in zip(dst_non_green_indices, non_green_colors):
             dual_colors[i] = color  # type: ignore
         dual_cards = [DuetCard(word=card.word, color=color) for card, color in zip(board.cards, dual_colors)]
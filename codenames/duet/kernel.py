@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from codenames.duet.board import DuetBoard
+from codenames.duet.card import DuetColor
+from codenames.duet.score import (
+    ASSASSIN_HIT,
+    GAME_QUIT,
+    MISTAKE_LIMIT_REACHED,
+    MOVE_TIMED_OUT,
+    TARGET_REACHED,
+    TIMER_TOKENS_DEPLETED,
+    GameResult,
+)
+from codenames.duet.state import DuetGameState, DuetSide, DuetSideState
+from codenames.generic.exceptions import GameIsOver, InvalidGuess, InvalidTurn
+from codenames.generic.move import PASS_GUESS, QUIT_GAME
+from codenames.generic.player import PlayerRole
+
+# Array codes, the position in each tuple is the value stored in the arrays.
+COLORS = (DuetColor.GREEN, DuetColor.NEUTRAL, DuetColor.ASSASSIN, DuetColor.IRRELEVANT)
+RESULTS = (
+    None,
+    TARGET_REACHED,
+    ASSASSIN_HIT,
+    GAME_QUIT,
+    TIMER_TOKENS_DEPLETED,
+    MISTAKE_LIMIT_REACHED,
+    MOVE_TIMED_OUT,
+)
+SIDES = (DuetSide.SIDE_A, DuetSide.SIDE_B)
+
+GREEN, NEUTRAL, ASSASSIN, IRRELEVANT = range(len(COLORS))
+NO_RESULT, TARGET, ASSASSIN_HIT_RESULT, QUIT_RESULT, TIMER_RESULT, MISTAKES_RESULT = range(6)
+
+type BoolArray = np.ndarray
+type IntArray = np.ndarray
+
+
+@dataclass
+class DuetGameBatch:  # pylint: disable=too-many-instance-attributes
+    """
+    N Duet games held as arrays, game `i` is row `i` of every array, side `s` is column `s` (0 is side A).
+    Clues and guesses are applied to many games per call, with the rules of `DuetGameState`.
+    Clue words are not tracked, so clue legality is left to the caller.
+    """
+
+    colors: IntArray  # (N, 2, board size), codes of COLORS
+    revealed: BoolArray  # (N, 2, board size)
+    green_total: IntArray  # (N, 2)
+    green_revealed: IntArray  # (N, 2)
+    side_results: IntArray  # (N, 2), codes of RESULTS
+    operative_turn: BoolArray  # (N, 2), whether each side's role is the operative
+    current_side: IntArray  # (N,)
+    timer_tokens: IntArray  # (N,)
+    allowed_mistakes: IntArray  # (N,)
+
+    @classmethod
+    def from_boards(
+        cls,
+        boards_a: Sequence[DuetBoard],
+        boards_b: Sequence[DuetBoard],
+        timer_tokens: int = 9,
+        allowed_mistakes: int = 9,
+    ) -> DuetGameBatch:
+        if len(boards_a) != len(boards_b):
+            msg = f"Got {len(boards_a)} A boards and {len(boards_b)} B boards"
+            raise ValueError(msg)
+        colors = np.array(
+            [
+                [_color_codes(board_a), _color_codes(board_b)]
+                for board_a, board_b in zip(boards_a, boards_b, strict=True)
+            ],
+            dtype=np.int8,
+        )
+        if np.any(colors == IRRELEVANT):
+            raise ValueError("Boards must be clean.")
+        amount = len(boards_a)
+        return cls(
+            colors=colors,
+            revealed=np.zeros(colors.shape, dtype=bool),
+            green_total=np.count_nonzero(colors == GREEN, axis=2).astype(np.int16),
+            green_revealed=np.zeros((amount, 2), dtype=np.int16),
+            side_results=np.zeros((amount, 2), dtype=np.int8),
+            operative_turn=np.zeros((amount, 2), dtype=bool),
+            current_side=np.zeros(amount, dtype=np.int8),
+            timer_tokens=np.full(amount, timer_tokens, dtype=np.int16),
+            allowed_mistakes=np.full(amount, allowed_mistakes, dtype=np.int16),
+        )
+
+    @classmethod
+    def from_states(cls, states: Sequence[DuetGameState]) -> DuetGameBatch:
+        result_codes = {result: code for code, result in enumerate(RESULTS) if result is not None}
+        sides_per_game = [(state.side_a, state.side_b) for state in states]
+
+        def side_values(get_value) -> list[list]:
+            return [[get_value(side) for side in sides] for sides in sides_per_game]
+
+        def side_result_code(side: DuetSideState) -> int:
+            return NO_RESULT if side.game_result is None else result_codes[side.game_result]
+
+        return cls(
+            colors=np.array(side_values(lambda side: _color_codes(side.board)), dtype=np.int8),
+            revealed=np.array(side_values(lambda side: [card.revealed for card in side.board.cards]), dtype=bool),
+            green_total=np.array(side_values(lambda side: side.score.main.total), dtype=np.int16),
+            green_revealed=np.array(side_values(lambda side: side.score.main.revealed), dtype=np.int16),
+            side_results=np.array(side_values(side_result_code), dtype=np.int8),
+            operative_turn=np.array(
+                side_values(lambda side: side.current_player_role == PlayerRole.OPERATIVE),
+                dtype=bool,
+            ),
+            current_side=np.array([SIDES.index(state.current_playing_side) for state in states], dtype=np.int8),
+            timer_tokens=np.array([state.timer_tokens for state in states], dtype=np.int16),
+            allowed_mistakes=np.array([state.allowed_mistakes for state in states], dtype=np.int16),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.current_side)
+
+    @property
+    def result_codes(self) -> IntArray:
+        # Same precedence as `DuetGameState.game_result`, applied from the lowest to the highest.
+        side_a, side_b = self.side_results[:, 0], self.side_results[:, 1]
+        codes = np.where((side_a == TARGET) & (side_b == TARGET), TARGET, NO_RESULT).astype(np.int8)
+        codes = np.where(_is_loss(side_b), side_b, codes)
+        codes = np.where(_is_loss(side_a), side_a, codes)
+        codes = np.where(self.allowed_mistakes == 0, MISTAKES_RESULT, codes)
+        return np.where(self.timer_tokens < 0, TIMER_RESULT, codes)
+
+    @property
+    def game_results(self) -> list[GameResult | None]:
+        return [RESULTS[code] for code in self.result_codes]
+
+    @property
+    def is_game_over(self) -> BoolArray:
+        return self.result_codes != NO_RESULT
+
+    @property
+    def is_sudden_death(self) -> BoolArray:
+        return self.timer_tokens == 0
+
+    @property
+    def is_stalled(self) -> BoolArray:
+        # A correct guess in sudden death can pass the turn to a side that already won,
+        # `DuetGameState` rejects any further move in that case, so these games can't go on.
+        return ~self.is_game_over & (self._current(self.side_results) != NO_RESULT)
+
+    @property
+    def awaiting_clue(self) -> BoolArray:
+        return self._playing() & ~self._current(self.operative_turn)
+
+    @property
+    def awaiting_guess(self) -> BoolArray:
+        return self._playing() & self._current(self.operative_turn)
+
+    @property
+    def hidden_cards(self) -> BoolArray:
+        # (N, board size), the cards the current side's operative may guess.
+        return ~self._current(self.revealed)
+
+    def process_clues(self, active: BoolArray | None = None):
+        # Gives a clue in every active game, all games awaiting a clue by default.
+        games = np.flatnonzero(self.awaiting_clue) if active is None else self._active_games(active)
+        if np.any(self.operative_turn[games, self.current_side[games]]):
+            raise InvalidTurn("It's not the Spymaster's turn now!")
+        self.operative_turn[games, self.current_side[games]] = True
+
+    def process_guesses(self, card_indexes: IntArray, active: BoolArray | None = None):
+        """
+        Applies `card_indexes[i]` to every active game `i` (all games awaiting a guess by default),
+        `PASS_GUESS` and `QUIT_GAME` included. Nothing is applied if any active guess is invalid.
+        """
+        games = np.flatnonzero(self.awaiting_guess) if active is None else self._active_games(active)
+        sides = self.current_side[games].astype(np.intp)
+        guesses = np.asarray(card_indexes)[games]
+        self._validate_guesses(games, sides=sides, guesses=guesses)
+        passed, quit_ = guesses == PASS_GUESS, guesses == QUIT_GAME
+        picked = ~passed & ~quit_
+        cards = np.where(picked, guesses, 0)
+        colors = self.colors[games, sides, cards]
+        correct, hit_assassin = picked & (colors == GREEN), picked & (colors == ASSASSIN)
+        # Side level, as in `DuetSideState.process_guess`.
+        self.revealed[games[picked], sides[picked], cards[picked]] = True
+        self.side_results[games[quit_], sides[quit_]] = QUIT_RESULT
+        self.side_results[games[hit_assassin], sides[hit_assassin]] = ASSASSIN_HIT_RESULT
+        self._add_points(games[correct], sides=sides[correct])
+        self.operative_turn[games[~correct], sides[~correct]] = False
+        self._apply_wrong_guesses(games[~correct], sides=sides[~correct], mistakes=picked[~correct])
+        self._apply_correct_guesses(games[correct], sides=sides[correct], cards=cards[correct])
+
+    def _active_games(self, active: BoolArray) -> IntArray:
+        games = np.flatnonzero(active)
+        if not np.all(self._playing()[games]):
+            raise GameIsOver
+        return games
+
+    def _validate_guesses(self, games: IntArray, sides: IntArray, guesses: IntArray):
+        if not np.all(self.operative_turn[games, sides]):
+            raise InvalidTurn("It's not the Operative's turn now!")
+        picked = (guesses != PASS_GUESS) & (guesses != QUIT_GAME)
+        board_size = self.colors.shape[2]
+        if np.any(picked & ((guesses < 0) | (guesses >= board_size))):
+            raise InvalidGuess("Given card index is out of range!")
+        if np.any(self.revealed[games[picked], sides[picked], guesses[picked]]):
+            raise InvalidGuess("Given card is already revealed!")
+
+    def _apply_wrong_guesses(self, games: IntArray, sides: IntArray, mistakes: BoolArray):
+        # As in `DuetGameState.process_guess` for wrong guesses, passes and quits.
+        self._update_tokens(games, mistakes=mistakes)
+        dual_playing = self.side_results[games, 1 - sides] == NO_RESULT
+        self.current_side[games[dual_playing]] = 1 - sides[dual_playing]
+
+    def _apply_correct_guesses(self, games: IntArray, sides: IntArray, cards: IntArray):
+        # The dual card is now irrelevant, as in `DuetSideState.dual_card_revealed`.
+        duals = 1 - sides
+        hidden = ~self.revealed[games, duals, cards]
+        hidden_games, hidden_duals, hidden_cards = games[hidden], duals[hidden], cards[hidden]
+        dual_green = self.colors[hidden_games, hidden_duals, hidden_cards] == GREEN
+        self._add_points(hidden_games[dual_green], sides=hidden_duals[dual_green])
+        self.colors[hidden_games, hidden_duals, hidden_cards] = IRRELEVANT
+        self.revealed[hidden_games, hidden_duals, hidden_cards] = True
+        # Reaching the target consumes a timer token, unless in sudden death.
+        finished = self.side_results[games, sides] != NO_RESULT
+        consumes_token = finished & ~self.is_sudden_death[games]
+        self._update_tokens(games[consumes_token], mistakes=np.zeros(np.count_nonzero(consumes_token), dtype=bool))
+        switches = finished | self.is_sudden_death[games]
+        self.current_side[games[switches]] = duals[switches]
+
+    def _add_points(self, games: IntArray, sides: IntArray):
+        self.green_revealed[games, sides] += 1
+        reached = self.green_revealed[games, sides] == self.green_total[games, sides]
+        self.side_results[games[reached], sides[reached]] = TARGET
+
+    def _update_tokens(self, games: IntArray, mistakes: BoolArray):
+        # As in `DuetGameState._update_tokens`.
+        counting = games[self.timer_tokens[games] >= 0]
+        self.timer_tokens[counting] -= 1
+        self.operative_turn[games[self.timer_tokens[games] == 0]] = True
+        self.allowed_mistakes[games[mistakes]] -= 1
+
+    def _playing(self) -> BoolArray:
+        # Neither over nor stalled.
+        return (self.result_codes == NO_RESULT) & (self._current(self.side_results) == NO_RESULT)
+
+    def _current(self, side_values: np.ndarray) -> np.ndarray:
+        # Taking rows of the flattened (game, side) axis is much faster than fancy indexing both axes.
+        rows = 2 * np.arange(self.size) + self.current_side
+        return np.take(side_values.reshape(2 * self.size, *side_values.shape[2:]), rows, axis=0)
+
+
+def _color_codes(board: DuetBoard) -> list[int]:
+    return [COLORS.index(card.color) for card in board.cards]  # type: ignore[arg-type]
+
+
+def _is_loss(side_results: IntArray) -> BoolArray:
+    return (side_results != NO_RESULT) & (side_results != TARGET)
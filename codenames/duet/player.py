@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import abc
+from typing import TYPE_CHECKING, Protocol
 
 from codenames.duet.card import DuetColor
 from codenames.duet.state import DuetOperativeState, DuetSpymasterState
 from codenames.duet.team import DuetTeam
-from codenames.generic.player import Operative, Spymaster
+from codenames.generic.player import (
+    AsyncOperative,
+    AsyncSpymaster,
+    Operative,
+    Spymaster,
+)
+
+if TYPE_CHECKING:
+    from codenames.generic.board import Board
+    from codenames.generic.move import Clue, GivenClue, GivenGuess, Guess
 
 
 class DuetSpymaster(Spymaster[DuetColor, DuetTeam, DuetSpymasterState], abc.ABC):
@@ -18,3 +28,45 @@ class DuetOperative(Operative[DuetColor, DuetTeam, DuetOperativeState], abc.ABC)
 
 class DuetPlayer(DuetSpymaster, DuetOperative, abc.ABC):
     pass
+
+
+class AsyncDuetPlayer(
+    AsyncSpymaster[DuetColor, DuetTeam, DuetSpymasterState],
+    AsyncOperative[DuetColor, DuetTeam, DuetOperativeState],
+    Protocol,
+):
+    pass
+
+
+class CompositeDuetPlayer(DuetPlayer):
+    def __init__(
+        self,
+        spymaster: Spymaster[DuetColor, DuetTeam, DuetSpymasterState],
+        operative: Operative[DuetColor, DuetTeam, DuetOperativeState],
+        name: str | None = None,
+    ):
+        super().__init__(name=name or f"{spymaster.name} + {operative.name}", team=spymaster.team)
+        self.spymaster = spymaster
+        self.operative = operative
+
+    @property
+    def players(self) -> tuple[Spymaster, Operative]:
+        return self.spymaster, self.operative
+
+    def give_clue(self, game_state: DuetSpymasterState) -> Clue:
+        return self.spymaster.give_clue(game_state=game_state)
+
+    def guess(self, game_state: DuetOperativeState) -> Guess:
+        return self.operative.guess(game_state=game_state)
+
+    def on_game_start(self, board: Board[DuetColor]):
+        for player in self.players:
+            player.on_game_start(board=board)
+
+    def on_clue_given(self, given_clue: GivenClue[DuetTeam]):
+        for player in self.players:
+            player.on_clue_given(given_clue=given_clue)
+
+    def on_guess_given(self, given_guess: GivenGuess[DuetColor, DuetTeam]):
+        for player in self.players:
+            player.on_guess_given(given_guess=given_guess)
@@ -10,14 +10,19 @@ from codenames.duet.score import GameResult
 from codenames.duet.state import DuetGameState, DuetSide
 from codenames.generic.exceptions import InvalidGuess
 from codenames.generic.move import GivenGuess
-from codenames.generic.player import Operative, PlayerRole, Spymaster
+from codenames.generic.player import Operative, Player, PlayerRole, Spymaster
 from codenames.generic.runner import (
     SEPARATOR,
     ClueGivenSubscriber,
     GuessGivenSubscriber,
+    MovePolicy,
+    MoveTimer,
+    MoveTiming,
     TeamPlayers,
+    TimedOutSubscriber,
 )
 from codenames.utils.formatting import wrap
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
 
 log = logging.getLogger(__name__)
 
@@ -40,13 +45,23 @@ class DuetGamePlayers:
 
 
 class DuetGameRunner:
-    def __init__(self, players: DuetGamePlayers, state: DuetGameState | None = None, board: DuetBoard | None = None):
+    def __init__(
+        self,
+        players: DuetGamePlayers,
+        state: DuetGameState | None = None,
+        board: DuetBoard | None = None,
+        move_policy: MovePolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
         self.players = players
         if (not state and not board) or (state and board):
             raise ValueError("Exactly one of state or board must be provided.")
         self.state = state or DuetGameState.from_board(board=board)  # type: ignore[arg-type]
+        self.instrumentation = instrumentation or NO_INSTRUMENTATION
+        self.move_timer = MoveTimer(policy=move_policy or MovePolicy(), instrumentation=self.instrumentation)
         self.clue_given_subscribers: list[ClueGivenSubscriber] = []
         self.guess_given_subscribers: list[GuessGivenSubscriber] = []
+        self.timed_out_subscribers: list[TimedOutSubscriber] = []
 
     @property
     def current_team(self) -> TeamPlayers:
@@ -54,6 +69,14 @@ class DuetGameRunner:
             return self.players.team_a
         return self.players.team_b
 
+    @property
+    def move_policy(self) -> MovePolicy:
+        return self.move_timer.policy
+
+    @property
+    def move_timings(self) -> list[MoveTiming]:
+        return self.move_timer.timings
+
     @property
     def current_role(self) -> PlayerRole:
         return self.state.current_side_state.current_player_role
@@ -66,10 +89,11 @@ class DuetGameRunner:
         return result
 
     def _notify_game_starts(self):
-        self.players.player_a.on_game_start(board=self.state.side_a.board)
-        self.players.player_a.on_game_start(board=self.state.side_b.board.censored)
-        self.players.player_b.on_game_start(board=self.state.side_b.board)
-        self.players.player_b.on_game_start(board=self.state.side_a.board.censored)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            self.players.player_a.on_game_start(board=self.state.side_a.board)
+            self.players.player_a.on_game_start(board=self.state.side_b.board.censored)
+            self.players.player_b.on_game_start(board=self.state.side_b.board)
+            self.players.player_b.on_game_start(board=self.state.side_a.board.censored)
 
     def _run_rounds(self) -> GameResult:
         while not self.state.is_game_over:
@@ -90,32 +114,53 @@ class DuetGameRunner:
 
     def _get_clue_from(self, spymaster: Spymaster):
         state, dual_state = self.state.current_side_state, self.state.current_dual_state
-        spymaster_state = state.get_spymaster_state(dual_state=dual_state)
-        clue = spymaster.give_clue(game_state=spymaster_state)
-        for subscriber in self.clue_given_subscribers:
-            subscriber(spymaster, clue)
-        given_clue = self.state.process_clue(clue=clue)
+        with self.instrumentation.measure(Metric.SPYMASTER_VIEW):
+            spymaster_view = state.get_spymaster_view(dual_state=dual_state)
+        clue = self.move_timer.give_clue(spymaster, game_state=spymaster_view)
+        if clue is None:
+            self._time_out(player=spymaster)
+            return
+        with self.instrumentation.measure(Metric.CLUE_SUBSCRIBERS):
+            for subscriber in self.clue_given_subscribers:
+                subscriber(spymaster, clue)
+        with self.instrumentation.measure(Metric.PROCESS_CLUE):
+            given_clue = self.state.process_clue(clue=clue)
         if given_clue is None:
             return
-        for player in self.players:
-            player.on_clue_given(given_clue=given_clue)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_clue_given(given_clue=given_clue)
+
+    def _time_out(self, player: Player):
+        for subscriber in self.timed_out_subscribers:
+            subscriber(player)
+        self.state.time_out()
 
     def _get_guess_from(self, operative: Operative):
         given_guess = self._get_guess_until_valid(operative)
         if given_guess is None:
             return
-        for player in self.players:
-            player.on_guess_given(given_guess=given_guess)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_guess_given(given_guess=given_guess)
 
     def _get_guess_until_valid(self, operative: Operative) -> GivenGuess | None:
         state, dual_state = self.state.current_side_state, self.state.current_dual_state
-        operative_state = state.get_operative_state(dual_state=dual_state)
+        with self.instrumentation.measure(Metric.OPERATIVE_VIEW):
+            operative_view = state.get_operative_view(dual_state=dual_state)
+        invalid_guesses = 0
         while True:
-            guess = operative.guess(game_state=operative_state)
+            guess = self.move_timer.guess(operative, game_state=operative_view, invalid_guesses=invalid_guesses)
+            if guess is None:
+                self._time_out(player=operative)
+                return None
             try:
-                given_guess = self.state.process_guess(guess=guess)
+                with self.instrumentation.measure(Metric.PROCESS_GUESS):
+                    given_guess = self.state.process_guess(guess=guess)
             except InvalidGuess:
+                invalid_guesses += 1
                 continue
-            for subscriber in self.guess_given_subscribers:
-                subscriber(operative, guess)
+            with self.instrumentation.measure(Metric.GUESS_SUBSCRIBERS):
+                for subscriber in self.guess_given_subscribers:
+                    subscriber(operative, guess)
             return given_guess
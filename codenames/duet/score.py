@@ -32,3 +32,4 @@ ASSASSIN_HIT = GameResult(win=False, reason="Assassin card was hit")
 GAME_QUIT = GameResult(win=False, reason="Team quit the game")
 TIMER_TOKENS_DEPLETED = GameResult(win=False, reason="Timer tokens depleted")
 MISTAKE_LIMIT_REACHED = GameResult(win=False, reason="Mistake limit reached")
+MOVE_TIMED_OUT = GameResult(win=False, reason="Move timed out")
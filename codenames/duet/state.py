@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from enum import StrEnum
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel, field_validator
 
@@ -12,6 +12,7 @@ from codenames.duet.score import (
     ASSASSIN_HIT,
     GAME_QUIT,
     MISTAKE_LIMIT_REACHED,
+    MOVE_TIMED_OUT,
     TARGET_REACHED,
     TIMER_TOKENS_DEPLETED,
     GameResult,
@@ -30,7 +31,13 @@ from codenames.generic.exceptions import (
 )
 from codenames.generic.move import PASS_GUESS, QUIT_GAME, Clue, GivenClue, Guess
 from codenames.generic.player import PlayerRole
-from codenames.generic.state import OperativeState, PlayerState, SpymasterState
+from codenames.generic.state import (
+    OperativeState,
+    PlayerState,
+    SpymasterState,
+    TeamScore,
+    model_builder,
+)
 from codenames.utils.formatting import wrap
 
 log = logging.getLogger(__name__)
@@ -43,10 +50,15 @@ class DuetPlayerState(PlayerState[DuetColor, DuetTeam]):
     current_team: DuetTeam = DuetTeam.MAIN
     dual_given_words: list[str] = []
 
+    _GIVEN_WORD_FIELDS: ClassVar[tuple[str, ...]] = ("given_clues", "dual_given_words")
+
     @property
-    def illegal_clue_words(self) -> WordGroup:
-        base = super().illegal_clue_words
-        return *base, *self.dual_given_words
+    def given_words(self) -> WordGroup:
+        return *self.given_clue_words, *self.dual_given_words
+
+    def add_dual_given_word(self, formatted_word: str):
+        self.dual_given_words.append(formatted_word)
+        self._add_illegal_clue_word(formatted_word)
 
     @field_validator("board", mode="before")
     @classmethod
@@ -87,6 +99,44 @@ class DuetSideState(DuetSpymasterState):
         score = Score.new(green=len(board.green_cards))
         return cls(board=board, score=score)
 
+    def model_dump_normalized(self) -> dict[str, Any]:
+        data = self._dump_normalized_fields()
+        data.update(
+            score=[self.score.main.total, self.score.main.revealed],
+            current_player_role=self.current_player_role,
+            clues=[[clue.word, clue.card_amount, clue.for_words] for clue in self.clues],
+            dual_given_words=list(self.dual_given_words),
+            game_result=[self.game_result.win, self.game_result.reason] if self.game_result else None,
+        )
+        return data
+
+    @classmethod
+    def model_validate_normalized(cls, data: dict[str, Any], trusted: bool = False) -> Self:
+        fields = cls._load_normalized_fields(
+            data,
+            board_class=DuetBoard,
+            color_class=DuetColor,
+            team_class=DuetTeam,
+            trusted=trusted,
+        )
+        total, revealed = data["score"]
+        clues = [
+            Clue(word=word, card_amount=card_amount, for_words=for_words)
+            for word, card_amount, for_words in data["clues"]
+        ]
+        game_result = None
+        if data["game_result"] is not None:
+            win, reason = data["game_result"]
+            game_result = GameResult(win=win, reason=reason)
+        return model_builder(cls, trusted)(
+            **fields,
+            score=Score(main=TeamScore(total=total, revealed=revealed)),
+            current_player_role=PlayerRole(data["current_player_role"]),
+            clues=clues,
+            dual_given_words=list(data["dual_given_words"]),
+            game_result=game_result,
+        )
+
     @property
     def last_given_clue(self) -> GivenClue:
         return self.given_clues[-1]
@@ -103,6 +153,14 @@ class DuetSideState(DuetSpymasterState):
     def operative_state(self) -> DuetOperativeState:
         return self.get_operative_state(None)
 
+    @property
+    def spymaster_view(self) -> DuetSpymasterState:
+        return self.get_spymaster_view(None)
+
+    @property
+    def operative_view(self) -> DuetOperativeState:
+        return self.get_operative_view(None)
+
     def process_clue(self, clue: Clue) -> DuetGivenClue | None:
         if self.is_game_over:
             raise GameIsOver
@@ -113,12 +171,13 @@ class DuetSideState(DuetSpymasterState):
             log.info("Spymaster quit the game")
             self._quit()
             return None
-        formatted_clue_word = canonical_format(clue.word)
-        if formatted_clue_word in self.illegal_clue_words:
+        if self.is_illegal_clue_word(clue.word):
             raise InvalidClue("Clue word is on board or was already used!")
+        formatted_clue_word = canonical_format(clue.word)
         given_clue = DuetGivenClue(word=formatted_clue_word, card_amount=clue.card_amount, team=self.current_team)
         log.info(f"Spymaster: {wrap(clue.word)} {wrap(clue.card_amount)} card(s)")
         self.given_clues.append(given_clue)
+        self._add_illegal_clue_word(given_clue.formatted_word)
         self.current_player_role = PlayerRole.OPERATIVE
         return given_clue
 
@@ -153,8 +212,9 @@ class DuetSideState(DuetSpymasterState):
             return
         if card.color == DuetColor.GREEN:
             self._update_score(card_color=DuetColor.GREEN)
-        card.color = DuetColor.IRRELEVANT  # This is a hack, but effectively what happens
-        card.revealed = True
+        # This is a hack, but effectively what happens
+        self.board.set_card_color(guess.card_index, DuetColor.IRRELEVANT)
+        self.board.reveal_card(guess.card_index)
 
     def get_spymaster_state(self, dual_state: DuetSideState | None) -> DuetSpymasterState:
         dual_player_state = dual_state.get_operative_state(None) if dual_state else None
@@ -183,6 +243,14 @@ class DuetSideState(DuetSpymasterState):
             dual_state=dual_player_state,
         )
 
+    def get_spymaster_view(self, dual_state: DuetSideState | None) -> DuetSpymasterState:
+        dual_player_view = dual_state.get_operative_view(None) if dual_state else None
+        return self._build_view(DuetSpymasterState, board=self.board, dual_state=dual_player_view)
+
+    def get_operative_view(self, dual_state: DuetSideState | None) -> DuetOperativeState:
+        dual_player_view = dual_state.get_spymaster_view(None) if dual_state else None
+        return self._build_view(DuetOperativeState, board=self.board.censored_view, dual_state=dual_player_view)
+
     def _reveal_guessed_card(self, guess: Guess) -> DuetCard:
         try:
             guessed_card = self.board[guess.card_index]
@@ -190,12 +258,18 @@ class DuetSideState(DuetSpymasterState):
             raise InvalidGuess("Given card index is out of range!") from e
         if guessed_card.revealed:
             raise InvalidGuess("Given card is already revealed!")
-        guessed_card.revealed = True
+        self.board.reveal_card(guess.card_index)
         return guessed_card
 
     def _end_turn(self):
         self.current_player_role = self.current_player_role.other
 
+    def time_out(self):
+        if self.is_game_over:
+            raise GameIsOver
+        log.info("Move timed out")
+        self.game_result = MOVE_TIMED_OUT
+
     def _quit(self):
         self.game_result = GAME_QUIT
         self._end_turn()
@@ -232,6 +306,25 @@ class DuetGameState(BaseModel):
         dual_board = DuetBoard.dual_board(board=board)
         return cls.from_boards(board_a=board, board_b=dual_board)
 
+    def model_dump_normalized(self) -> dict[str, Any]:
+        return {
+            "side_a": self.side_a.model_dump_normalized(),
+            "side_b": self.side_b.model_dump_normalized(),
+            "current_playing_side": self.current_playing_side,
+            "timer_tokens": self.timer_tokens,
+            "allowed_mistakes": self.allowed_mistakes,
+        }
+
+    @classmethod
+    def model_validate_normalized(cls, data: dict[str, Any], trusted: bool = False) -> DuetGameState:
+        return model_builder(cls, trusted)(
+            side_a=DuetSideState.model_validate_normalized(data["side_a"], trusted=trusted),
+            side_b=DuetSideState.model_validate_normalized(data["side_b"], trusted=trusted),
+            current_playing_side=DuetSide(data["current_playing_side"]),
+            timer_tokens=data["timer_tokens"],
+            allowed_mistakes=data["allowed_mistakes"],
+        )
+
     @classmethod
     def from_boards(cls, board_a: DuetBoard, board_b: DuetBoard) -> DuetGameState:
         if not board_a.is_clean or not board_b.is_clean:
@@ -284,7 +377,7 @@ class DuetGameState(BaseModel):
         side_state = self.current_side_state
         given_clue = side_state.process_clue(clue)
         if given_clue:
-            self.current_dual_state.dual_given_words.append(given_clue.formatted_word)
+            self.current_dual_state.add_dual_given_word(given_clue.formatted_word)
         return given_clue
 
     def process_guess(self, guess: Guess) -> DuetGivenGuess | None:
@@ -306,6 +399,9 @@ class DuetGameState(BaseModel):
             self.current_playing_side = self.current_playing_side.opposite
         return given_guess
 
+    def time_out(self):
+        self.current_side_state.time_out()
+
     def _update_tokens(self, mistake: bool) -> None:
         if self.timer_tokens >= 0:
             self.timer_tokens -= 1
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator, cast
+
+from codenames.generic.move import PASS_GUESS, Clue, Guess
+from codenames.generic.player import (
+    AsyncOperative,
+    AsyncPlayer,
+    AsyncSpymaster,
+    Operative,
+    PlayerRole,
+    Spymaster,
+)
+from codenames.generic.runner import MoveTimer, TeamPlayers, state_for_move
+
+log = logging.getLogger(__name__)
+
+AnySpymaster = Spymaster | AsyncSpymaster
+AnyOperative = Operative | AsyncOperative
+AsyncClueGivenSubscriber = Callable[[AnySpymaster, Clue], None]
+AsyncGuessGivenSubscriber = Callable[[AnyOperative, Guess], None]
+AsyncTimedOutSubscriber = Callable[[AnySpymaster | AnyOperative], None]
+
+
+@dataclass(frozen=True)
+class AsyncTeamPlayers:
+    spymaster: AnySpymaster
+    operative: AnyOperative
+
+    @classmethod
+    def from_team_players(cls, team_players: TeamPlayers) -> AsyncTeamPlayers:
+        return cls(spymaster=team_players.spymaster, operative=team_players.operative)
+
+    def __iter__(self) -> Iterator[AsyncPlayer]:
+        return iter([self.spymaster, self.operative])
+
+    def __post_init__(self):
+        if self.spymaster.team != self.operative.team:
+            raise ValueError("Spymaster and Operative must be on the same team")
+
+
+async def request_timed_clue(
+    move_timer: MoveTimer,
+    spymaster: AnySpymaster,
+    game_state: Any,
+    in_thread: bool = False,
+) -> Clue | None:
+    # As `MoveTimer.give_clue`. Sync players running inline block the loop, so they can't be timed out.
+    timeout_sec = move_timer.policy.clue_timeout_sec
+    move = request_clue(spymaster, state_for_move(game_state, timeout_sec=timeout_sec), in_thread=in_thread)
+    clue = await _timed(move_timer, spymaster, PlayerRole.SPYMASTER, move, timeout_sec=timeout_sec)
+    if clue is None:
+        return move_timer.policy.timeout_clue()
+    return clue
+
+
+async def request_timed_guess(
+    move_timer: MoveTimer,
+    operative: AnyOperative,
+    game_state: Any,
+    invalid_guesses: int = 0,
+    in_thread: bool = False,
+) -> Guess | None:
+    # As `MoveTimer.guess`.
+    if move_timer.policy.retries_exhausted(invalid_guesses):
+        log.info("Operative ran out of retries, passing the turn")
+        return Guess(card_index=PASS_GUESS)
+    timeout_sec = move_timer.policy.guess_timeout_sec
+    move = request_guess(operative, state_for_move(game_state, timeout_sec=timeout_sec), in_thread=in_thread)
+    guess = await _timed(move_timer, operative, PlayerRole.OPERATIVE, move, timeout_sec=timeout_sec)
+    if guess is None:
+        return move_timer.policy.timeout_guess()
+    return guess
+
+
+async def _timed[M: (
+    Clue,
+    Guess,
+)](
+    move_timer: MoveTimer,
+    player: AsyncPlayer,
+    role: PlayerRole,
+    move: Awaitable[M],
+    timeout_sec: float | None,
+) -> (
+    M | None
+):
+    start = time.perf_counter()
+    try:
+        result: M | None = await asyncio.wait_for(move, timeout=timeout_sec)
+    except TimeoutError:
+        result = None
+    move_timer.record(player.name, role, duration_sec=time.perf_counter() - start, timed_out=result is None)
+    return result
+
+
+async def request_clue(spymaster: AnySpymaster, game_state: Any, in_thread: bool = False) -> Clue:
+    # Sync players are adapted here, so both kinds can play in the same game.
+    if _is_sync(spymaster.give_clue):
+        return await _call_sync(cast("Spymaster", spymaster).give_clue, game_state, in_thread)
+    return await cast("AsyncSpymaster", spymaster).give_clue(game_state=game_state)
+
+
+async def request_guess(operative: AnyOperative, game_state: Any, in_thread: bool = False) -> Guess:
+    if _is_sync(operative.guess):
+        return await _call_sync(cast("Operative", operative).guess, game_state, in_thread)
+    return await cast("AsyncOperative", operative).guess(game_state=game_state)
+
+
+def _is_sync(move: Callable) -> bool:
+    return not inspect.iscoroutinefunction(move)
+
+
+async def _call_sync[M: (Clue, Guess)](move: Callable[..., M], game_state: Any, in_thread: bool) -> M:
+    # Running inline is cheapest for CPU-bound bots, blocking ones should run in a worker thread.
+    if in_thread:
+        return await asyncio.to_thread(move, game_state=game_state)
+    return move(game_state=game_state)
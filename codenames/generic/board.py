@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import abc
 import math
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Collection, Iterator
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Collection, Iterator, Self, Sequence
 
 from pydantic import BaseModel, field_validator
 
 from codenames.generic.card import Card, CardColor, Cards, canonical_format
-from codenames.generic.exceptions import CardNotFoundError
+from codenames.generic.exceptions import CardNotFoundError, WordNotFoundError
 
 if TYPE_CHECKING:
     from beautifultable import BeautifulTable
@@ -17,8 +18,11 @@ LTR = "\u200E"
 
 WordGroup = tuple[str, ...]
 
+CACHED_INDEXES = ("_masks", "_word_indexes", "censored_view")
+
 
 class Board[C: CardColor](BaseModel, abc.ABC):
+    # Card colors and reveals must change through the board methods, which keep its indexes in sync.
     language: str
     cards: list[Card[C]]
 
@@ -27,6 +31,17 @@ class Board[C: CardColor](BaseModel, abc.ABC):
     def convert_cards(cls, v: Any) -> list[Card[C]]:
         return list(v)
 
+    @classmethod
+    def from_word_ids(
+        cls,
+        vocabulary: IndexedVocabulary,
+        word_ids: Sequence[int],
+        colors: Sequence[C | None],
+    ) -> Self:
+        words = vocabulary.words
+        cards = [{"word": words[word_id], "color": color} for word_id, color in zip(word_ids, colors, strict=True)]
+        return cls.model_validate({"language": vocabulary.language, "cards": cards})
+
     def __getitem__(self, item: int | str) -> Card:
         if isinstance(item, str):
             item = self.find_card_index(item)
@@ -47,13 +62,47 @@ class Board[C: CardColor](BaseModel, abc.ABC):
     def __str__(self) -> str:
         return self.printable_string
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name == "cards":
+            _drop_cached_indexes(self)
+
+    # Copies (`model_copy` included) rebuild their indexes, as their cards may be updated or replaced.
+    # Shallow copies get their own cards too, so revealing a card on one board doesn't change the other.
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        copied.__dict__["cards"] = [card.model_copy() for card in self.cards]
+        _drop_cached_indexes(copied)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        copied = super().__deepcopy__(memo)
+        _drop_cached_indexes(copied)
+        return copied
+
+    @cached_property
+    def _masks(self) -> CardMasks:
+        # Built lazily, so cards can be edited freely until the board is first queried.
+        return CardMasks.from_cards(self.cards)
+
+    @cached_property
+    def _word_indexes(self) -> dict[str, int]:
+        word_indexes: dict[str, int] = {}
+        for i, card in enumerate(self.cards):
+            word_indexes.setdefault(card.formatted_word, i)
+        return word_indexes
+
     @property
     def size(self) -> int:
         return len(self.cards)
 
+    @property
+    def revealed_mask(self) -> int:
+        return self._masks.revealed
+
     @property
     def is_clean(self) -> bool:
-        return all(not card.revealed for card in self.cards)
+        return self._masks.revealed == 0
 
     @property
     def all_words(self) -> WordGroup:
@@ -65,20 +114,25 @@ class Board[C: CardColor](BaseModel, abc.ABC):
 
     @property
     def revealed_card_indexes(self) -> tuple[int, ...]:
-        return tuple(i for i, card in enumerate(self.cards) if card.revealed)
+        return tuple(mask_indexes(self._masks.revealed))
 
     @property
     def unrevealed_cards(self) -> Cards[C]:
-        return tuple(card for card in self.cards if not card.revealed)
+        return self.cards_for_mask(self._masks.all & ~self._masks.revealed)
 
     @property
     def revealed_cards(self) -> Cards[C]:
-        return tuple(card for card in self.cards if card.revealed)
+        return self.cards_for_mask(self._masks.revealed)
 
     @property
     def censored(self) -> Board[C]:
         return self.__class__(language=self.language, cards=[card.censored for card in self.cards])
 
+    @cached_property
+    def censored_view(self) -> Board[C]:
+        # Built once, then updated in place whenever a card of this board changes.
+        return self.censored
+
     @property
     def as_table(self) -> BeautifulTable:
         from beautifultable import (  # pylint: disable=import-outside-toplevel
@@ -101,25 +155,94 @@ class Board[C: CardColor](BaseModel, abc.ABC):
                 row[i] = LTR + str(card)
         return str(table)
 
+    def color_mask(self, card_color: str | None) -> int:
+        return self._masks.colors.get(card_color, 0)  # type: ignore[arg-type]
+
+    def cards_for_mask(self, mask: int) -> Cards[C]:
+        return tuple(self.cards[i] for i in mask_indexes(mask))
+
     def cards_for_color(self, card_color: str) -> Cards[C]:
-        return tuple(card for card in self.cards if card.color == card_color)
+        return self.cards_for_mask(self.color_mask(card_color))
 
     def revealed_cards_for_color(self, card_color: str) -> Cards[C]:
-        return tuple(card for card in self.cards if card.color == card_color and card.revealed)
+        return self.cards_for_mask(self.color_mask(card_color) & self._masks.revealed)
 
     def unrevealed_cards_for_color(self, card_color: str) -> Cards[C]:
-        return tuple(card for card in self.cards if card.color == card_color and not card.revealed)
+        return self.cards_for_mask(self.color_mask(card_color) & ~self._masks.revealed)
 
     def find_card_index(self, word: str) -> int:
         formatted_word = canonical_format(word)
         try:
-            return self.all_words.index(formatted_word)
-        except ValueError as e:
+            return self._word_indexes[formatted_word]
+        except KeyError as e:
             raise CardNotFoundError(word) from e
 
+    def has_word(self, word: str) -> bool:
+        return canonical_format(word) in self._word_indexes
+
+    def word_ids(self, vocabulary: IndexedVocabulary) -> tuple[int, ...]:
+        return tuple(vocabulary.word_id(card.word) for card in self.cards)
+
+    def reveal_card(self, index: int) -> Card[C]:
+        card = self.cards[index]
+        card.revealed = True
+        self._card_changed(index)
+        return card
+
+    def set_card_color(self, index: int, card_color: C):
+        self.cards[index].color = card_color
+        self._card_changed(index)
+
+    def replace_card(self, index: int, card: Card[C]):
+        if card.word != self.cards[index].word:
+            self.__dict__.pop("_word_indexes", None)
+        self.cards[index] = card
+        self._card_changed(index)
+
     def reset_state(self):
         for card in self.cards:
             card.revealed = False
+        masks: CardMasks | None = self.__dict__.get("_masks")
+        if masks is not None:
+            masks.revealed = 0
+        self.__dict__.pop("censored_view", None)
+
+    def _card_changed(self, index: int):
+        card = self.cards[index]
+        masks: CardMasks | None = self.__dict__.get("_masks")
+        if masks is not None:
+            masks.set_card(index, card=card)
+        censored_view: Board[C] | None = self.__dict__.get("censored_view")
+        if censored_view is not None:
+            censored_view.replace_card(index, card.censored)
+
+
+@dataclass(slots=True)
+class CardMasks:
+    """
+    Bit `i` of each mask refers to the card at index `i` of the board.
+    """
+
+    all: int
+    revealed: int
+    colors: dict[CardColor | None, int] = field(default_factory=dict)
+
+    def set_card(self, index: int, card: Card):
+        bit = 1 << index
+        self.revealed = self.revealed | bit if card.revealed else self.revealed & ~bit
+        for color, mask in self.colors.items():
+            self.colors[color] = mask & ~bit
+        self.colors[card.color] = self.colors.get(card.color, 0) | bit
+
+    @classmethod
+    def from_cards(cls, cards: list[Card]) -> CardMasks:
+        masks = cls(all=(1 << len(cards)) - 1, revealed=0)
+        for i, card in enumerate(cards):
+            bit = 1 << i
+            if card.revealed:
+                masks.revealed |= bit
+            masks.colors[card.color] = masks.colors.get(card.color, 0) | bit
+        return masks
 
 
 @dataclass
@@ -128,6 +251,50 @@ class Vocabulary:
     words: Collection[str]
 
 
+@dataclass
+class IndexedVocabulary(Vocabulary):
+    # Words are deduplicated and sorted, so word IDs are stable across interpreter runs.
+    words: tuple[str, ...]
+    formatted_words: tuple[str, ...] = field(init=False, repr=False)
+    word_ids: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.words = tuple(sorted(set(self.words)))
+        self.formatted_words = tuple(canonical_format(word) for word in self.words)
+        self.word_ids = {word: i for i, word in enumerate(self.words)}
+        for i, formatted_word in enumerate(self.formatted_words):
+            self.word_ids.setdefault(formatted_word, i)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @classmethod
+    def from_vocabulary(cls, vocabulary: Vocabulary) -> IndexedVocabulary:
+        if isinstance(vocabulary, IndexedVocabulary):
+            return vocabulary
+        return cls(language=vocabulary.language, words=tuple(vocabulary.words))
+
+    def word_id(self, word: str) -> int:
+        word_id = self.word_ids.get(word)
+        if word_id is None:
+            word_id = self.word_ids.get(canonical_format(word))
+        if word_id is None:
+            raise WordNotFoundError(word=word, language=self.language)
+        return word_id
+
+
+def _drop_cached_indexes(board: Board):
+    for cached_index in CACHED_INDEXES:
+        board.__dict__.pop(cached_index, None)
+
+
+def mask_indexes(mask: int) -> Iterator[int]:
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
 def two_integer_factors(n: int) -> tuple[int, int]:
     x = math.floor(math.sqrt(n))
     if x == 0:
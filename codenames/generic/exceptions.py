@@ -4,10 +4,23 @@ class CardNotFoundError(ValueError):
         super().__init__(f"Card not found: {self.word}")
 
 
+class WordNotFoundError(ValueError):
+    def __init__(self, word: str, language: str):
+        self.word = word
+        self.language = language
+        super().__init__(f"Word not found in {self.language} vocabulary: {self.word}")
+
+
 class QuitGame(Exception):
     pass
 
 
+class MoveTimeout(Exception):
+    def __init__(self, timeout_sec: float):
+        self.timeout_sec = timeout_sec
+        super().__init__(f"Move took longer than {self.timeout_sec} seconds")
+
+
 class GameRuleError(Exception):
     pass
 
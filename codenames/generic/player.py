@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import abc
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 from codenames.generic.card import CardColor
 from codenames.generic.state import OperativeState, SpymasterState
@@ -62,3 +62,27 @@ class Operative[C: CardColor, T: Team, S: OperativeState](Player[C, T], abc.ABC)
     @abc.abstractmethod
     def guess(self, game_state: S) -> Guess:
         raise NotImplementedError
+
+
+class AsyncPlayer[C: CardColor, T: Team](Protocol):
+    """
+    A player whose moves are awaited, e.g. one backed by a remote service.
+    Subclassing `Player` provides everything but the move methods.
+    """
+
+    name: str
+    team: T
+
+    def on_game_start(self, board: Board[C]): ...
+
+    def on_clue_given(self, given_clue: GivenClue[T]): ...
+
+    def on_guess_given(self, given_guess: GivenGuess[C, T]): ...
+
+
+class AsyncSpymaster[C: CardColor, T: Team, S: SpymasterState](AsyncPlayer[C, T], Protocol):
+    async def give_clue(self, game_state: S) -> Clue: ...
+
+
+class AsyncOperative[C: CardColor, T: Team, S: OperativeState](AsyncPlayer[C, T], Protocol):
+    async def guess(self, game_state: S) -> Guess: ...
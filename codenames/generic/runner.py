@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable
+import copy
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from functools import partial
+from typing import Any, Callable
 
-from codenames.generic.move import Clue, Guess
-from codenames.generic.player import Operative, Spymaster
+from codenames.generic.exceptions import MoveTimeout
+from codenames.generic.move import PASS_GUESS, QUIT_GAME, Clue, Guess
+from codenames.generic.player import Operative, Player, PlayerRole, Spymaster
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
+
+log = logging.getLogger(__name__)
 
 SEPARATOR = "\n-----\n"
 ClueGivenSubscriber = Callable[[Spymaster, Clue], None]
 GuessGivenSubscriber = Callable[[Operative, Guess], None]
+TimedOutSubscriber = Callable[[Player], None]  # Called before the player's team forfeits on a timeout.
 
 
 @dataclass(frozen=True)
@@ -22,3 +33,130 @@ class TeamPlayers:
     def __post_init__(self):
         if self.spymaster.team != self.operative.team:
             raise ValueError("Spymaster and Operative must be on the same team")
+
+
+class TimeoutAction(StrEnum):
+    END_TURN = "END_TURN"  # Operatives pass the turn, spymasters can't pass, so they forfeit.
+    QUIT = "QUIT"  # The team quits the game, as if it sent QUIT_GAME.
+    FORFEIT = "FORFEIT"  # The team loses with a timeout reason.
+
+
+@dataclass(frozen=True)
+class MovePolicy:
+    """
+    Limits on player moves. A timed out player keeps running in a background thread, but its move is ignored.
+    Timed moves start a thread each and get a detached copy of the state, which costs some throughput.
+    Operatives that exceed `max_invalid_guesses` are forced to pass the turn.
+    """
+
+    clue_timeout_sec: float | None = None
+    guess_timeout_sec: float | None = None
+    max_invalid_guesses: int | None = None
+    on_timeout: TimeoutAction = TimeoutAction.FORFEIT
+
+    def timeout_clue(self) -> Clue | None:
+        # None means the team forfeits.
+        if self.on_timeout == TimeoutAction.QUIT:
+            return Clue(word="", card_amount=QUIT_GAME)
+        return None
+
+    def timeout_guess(self) -> Guess | None:
+        if self.on_timeout == TimeoutAction.QUIT:
+            return Guess(card_index=QUIT_GAME)
+        if self.on_timeout == TimeoutAction.END_TURN:
+            return Guess(card_index=PASS_GUESS)
+        return None
+
+    def retries_exhausted(self, invalid_guesses: int) -> bool:
+        return self.max_invalid_guesses is not None and invalid_guesses >= self.max_invalid_guesses
+
+
+@dataclass(frozen=True, slots=True)
+class MoveTiming:
+    player: str
+    role: PlayerRole
+    duration_sec: float
+    timed_out: bool = False
+
+
+@dataclass
+class MoveTimer:
+    """
+    Requests moves from players under a `MovePolicy`, recording how long each request took.
+    A returned None means the player's team forfeits.
+    """
+
+    policy: MovePolicy = field(default_factory=MovePolicy)
+    timings: list[MoveTiming] = field(default_factory=list)
+    instrumentation: Instrumentation = NO_INSTRUMENTATION
+
+    def give_clue(self, spymaster: Spymaster, game_state: Any) -> Clue | None:
+        timeout_sec = self.policy.clue_timeout_sec
+        move = partial(spymaster.give_clue, game_state=state_for_move(game_state, timeout_sec=timeout_sec))
+        clue = self._timed(spymaster, PlayerRole.SPYMASTER, move, timeout_sec=timeout_sec)
+        if clue is None:
+            return self.policy.timeout_clue()
+        return clue
+
+    def guess(self, operative: Operative, game_state: Any, invalid_guesses: int = 0) -> Guess | None:
+        if self.policy.retries_exhausted(invalid_guesses):
+            log.info("Operative ran out of retries, passing the turn")
+            return Guess(card_index=PASS_GUESS)
+        timeout_sec = self.policy.guess_timeout_sec
+        move = partial(operative.guess, game_state=state_for_move(game_state, timeout_sec=timeout_sec))
+        guess = self._timed(operative, PlayerRole.OPERATIVE, move, timeout_sec=timeout_sec)
+        if guess is None:
+            return self.policy.timeout_guess()
+        return guess
+
+    def _timed[M: (Clue, Guess)](
+        self,
+        player: Player,
+        role: PlayerRole,
+        move: Callable[[], M],
+        timeout_sec: float | None,
+    ) -> M | None:
+        start = time.perf_counter()
+        try:
+            result: M | None = call_with_timeout(move, timeout_sec=timeout_sec)
+        except MoveTimeout:
+            result = None
+        self.record(player.name, role, duration_sec=time.perf_counter() - start, timed_out=result is None)
+        return result
+
+    def record(self, player_name: str, role: PlayerRole, duration_sec: float, timed_out: bool):
+        metric = Metric.GIVE_CLUE if role == PlayerRole.SPYMASTER else Metric.GUESS
+        self.instrumentation.record(metric, duration_sec)
+        self.timings.append(MoveTiming(player=player_name, role=role, duration_sec=duration_sec, timed_out=timed_out))
+
+
+def state_for_move(game_state: Any, timeout_sec: float | None) -> Any:
+    # A timed out player keeps running after the game moved on, so timed moves get a detached copy of the state
+    # (a deep copy of a player view is a plain state) instead of a view that follows the live game.
+    if timeout_sec is None:
+        return game_state
+    return copy.deepcopy(game_state)
+
+
+def call_with_timeout[M](move: Callable[[], M], timeout_sec: float | None) -> M:
+    if timeout_sec is None:
+        return move()
+    # Python threads can't be killed, a daemon thread at least doesn't block interpreter exit.
+    # A pool wouldn't save much: a stuck move would hold its worker forever, so every timed move gets its own thread.
+    results: list[M] = []
+    errors: list[BaseException] = []
+
+    def target():
+        try:
+            results.append(move())
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            errors.append(e)
+
+    thread = threading.Thread(target=target, name="player-move", daemon=True)
+    thread.start()
+    thread.join(timeout_sec)
+    if thread.is_alive():
+        raise MoveTimeout(timeout_sec)
+    if errors:
+        raise errors[0]
+    return results[0]
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Self
+from functools import cache, cached_property
+from typing import Any, Callable, ClassVar, Iterator, Self, cast
 
 from pydantic import BaseModel
 
 from codenames.generic.board import Board, WordGroup
-from codenames.generic.card import CardColor
+from codenames.generic.card import Card, CardColor, canonical_format
 from codenames.generic.move import Clue, GivenClue, GivenGuess
 from codenames.generic.team import Team
+from codenames.generic.view import read_only, unwrap
 
 log = logging.getLogger(__name__)
 
@@ -23,13 +26,175 @@ class PlayerState[C: CardColor, T: Team](BaseModel):
     given_clues: list[GivenClue[T]] = []
     given_guesses: list[GivenGuess[C, T]] = []
 
+    # Assigning any of these fields drops the given words index built from them.
+    _GIVEN_WORD_FIELDS: ClassVar[tuple[str, ...]] = ("given_clues",)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self._GIVEN_WORD_FIELDS:
+            self.__dict__.pop("_given_word_set", None)
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        copied.__dict__.pop("_given_word_set", None)
+        return copied
+
     @property
     def given_clue_words(self) -> WordGroup:
         return tuple(clue.formatted_word for clue in self.given_clues)
 
+    @property
+    def given_words(self) -> WordGroup:
+        return self.given_clue_words
+
     @property
     def illegal_clue_words(self) -> WordGroup:
-        return *self.board.all_words, *self.given_clue_words
+        return *self.board.all_words, *self.given_words
+
+    @property
+    def illegal_clue_word_set(self) -> frozenset[str]:
+        return frozenset(self.illegal_clue_words)
+
+    @cached_property
+    def _given_word_set(self) -> set[str]:
+        # Board words are looked up in the board's own index, which follows its changes.
+        return set(self.given_words)
+
+    def is_illegal_clue_word(self, word: str) -> bool:
+        formatted_word = canonical_format(word)
+        return formatted_word in self._given_word_set or self.board.has_word(formatted_word)
+
+    def _add_illegal_clue_word(self, formatted_word: str):
+        self._given_word_set.add(formatted_word)
+
+    def _build_view[S: PlayerState](self, state_class: type[S], board: Board[C], **fields: Any) -> S:
+        # Views read this state's live fields on access instead of validating copies of them.
+        # What they hand out is read-only, so players can't change the game through them.
+        view = _view_class(state_class).over(self, board=read_only(board), **fields)
+        return cast("S", view)
+
+    def _dump_normalized_fields(self) -> dict[str, Any]:
+        # Guesses refer to their card and clue by index, instead of embedding copies of them.
+        card_indexes = {id(card): i for i, card in enumerate(self.board.cards)}
+        clue_indexes = {id(clue): i for i, clue in enumerate(self.given_clues)}
+        given_guesses = []
+        for guess in self.given_guesses:
+            card_index = card_indexes.get(id(guess.guessed_card))
+            if card_index is None:
+                card_index = self.board.find_card_index(guess.guessed_card.word)
+            clue_index = clue_indexes.get(id(guess.for_clue))
+            if clue_index is None:
+                clue_index = self.given_clues.index(guess.for_clue)
+            given_guesses.append([card_index, clue_index])
+        return {
+            "language": self.board.language,
+            "cards": [[card.word, card.color, card.revealed] for card in self.board.cards],
+            "current_team": self.current_team,
+            "given_clues": [[clue.word, clue.card_amount, clue.team] for clue in self.given_clues],
+            "given_guesses": given_guesses,
+        }
+
+    @classmethod
+    def _load_normalized_fields(
+        cls,
+        data: dict[str, Any],
+        board_class: type[Board],
+        color_class: type[CardColor],
+        team_class: type[Team],
+        trusted: bool,
+    ) -> dict[str, Any]:
+        # Leaf models are cheap to validate, it's re-validating them through their containers that is costly.
+        card_class = Card[color_class]  # type: ignore[valid-type]
+        clue_class = GivenClue[team_class]  # type: ignore[valid-type]
+        guess_class = GivenGuess[color_class, team_class]  # type: ignore[valid-type]
+        cards = [card_class(word=word, color=color, revealed=revealed) for word, color, revealed in data["cards"]]
+        board = model_builder(board_class, trusted)(language=data["language"], cards=cards)
+        given_clues = [
+            clue_class(word=word, card_amount=card_amount, team=team) for word, card_amount, team in data["given_clues"]
+        ]
+        given_guesses = [
+            guess_class(guessed_card=board.cards[card_index], for_clue=given_clues[clue_index])
+            for card_index, clue_index in data["given_guesses"]
+        ]
+        return {
+            "board": board,
+            "current_team": team_class(data["current_team"]),
+            "given_clues": given_clues,
+            "given_guesses": given_guesses,
+        }
+
+
+class PlayerStateView[C: CardColor, T: Team](PlayerState[C, T]):
+    """
+    Read-only view of a live state. Fields are read from the state on access, and wrapped in read-only views.
+    """
+
+    @classmethod
+    def over(cls, source: PlayerState, **fields: Any) -> Self:
+        # Fields given here (e.g. the censored board) replace the ones read from the source.
+        view = cls.__new__(cls)
+        object.__setattr__(view, "__dict__", {"_view_source": source, "_view_fields": fields})
+        object.__setattr__(view, "__pydantic_fields_set__", set())
+        object.__setattr__(view, "__pydantic_extra__", None)
+        object.__setattr__(view, "__pydantic_private__", None)
+        return view
+
+    def __getattr__(self, name: str) -> Any:
+        view_fields = self.__dict__.get("_view_fields", {})
+        if name in view_fields:
+            return view_fields[name]
+        if name in self.__pydantic_fields__:
+            return read_only(getattr(self.__dict__["_view_source"], name))
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __setattr__(self, name: str, value: Any):
+        msg = f"Can't set {name} on a read-only {type(self).__name__}"
+        raise AttributeError(msg)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerState):
+            return NotImplemented
+        if self.__pydantic_fields__.keys() != other.__pydantic_fields__.keys():
+            return False
+        return all(getattr(self, name) == getattr(other, name) for name in self.__pydantic_fields__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> PlayerState:  # type: ignore[override]
+        # A deep copy doesn't follow the live state anymore, so it's a plain state again.
+        return copy.deepcopy(self.__wrapped__, memo)
+
+    def __repr_args__(self) -> Iterator[tuple[str, Any]]:
+        for name in self.__pydantic_fields__:
+            yield name, getattr(self, name)
+
+    @property
+    def __wrapped__(self) -> PlayerState:
+        # A state model sharing the live objects this view reads, for copying and serializing it.
+        state_class: type[PlayerState] = type(self).__bases__[1]
+        values: dict[str, Any] = {name: unwrap(getattr(self, name)) for name in self.__pydantic_fields__}
+        return state_class.model_construct(**values)
+
+    def is_illegal_clue_word(self, word: str) -> bool:
+        source: PlayerState = self.__dict__["_view_source"]
+        return source.is_illegal_clue_word(word)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # type: ignore[override]
+        return self.__wrapped__.model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # type: ignore[override]
+        return self.__wrapped__.model_dump_json(**kwargs)
+
+
+@cache
+def _view_class(state_class: type[PlayerState]) -> type[PlayerStateView]:
+    namespace = {"__module__": state_class.__module__, "__doc__": PlayerStateView.__doc__}
+    view_class = type(f"{state_class.__name__}View", (PlayerStateView, state_class), namespace)
+    return cast("type[PlayerStateView]", view_class)
 
 
 class SpymasterState[C: CardColor, T: Team](PlayerState[C, T]):
@@ -65,3 +230,8 @@ class TeamScore(BaseModel):
     @property
     def unrevealed(self) -> int:
         return self.total - self.revealed
+
+
+def model_builder[M: BaseModel](model_class: type[M], trusted: bool) -> Callable[..., M]:
+    # Trusted input (e.g. produced by this package) skips validation of the containing models.
+    return model_class.model_construct if trusted else model_class
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import copy
+import functools
+from typing import Any, Callable, Iterator, Self, Sequence
+
+from pydantic import BaseModel
+
+# Methods that change the object they are called on, which read-only views refuse to call.
+MUTATING_METHODS = frozenset({"add_point", "replace_card", "reset_state", "reveal_card", "set_card_color"})
+
+
+class ModelView:
+    """
+    Read-only view of a live model: attributes are read from the model on access, and writes are refused.
+    """
+
+    __slots__ = ("__wrapped__",)
+
+    def __init__(self, target: BaseModel):
+        object.__setattr__(self, "__wrapped__", target)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in MUTATING_METHODS:
+            msg = f"Can't call {name}() on a read-only {type(self.__wrapped__).__name__} view"
+            raise AttributeError(msg)
+        value = getattr(self.__wrapped__, name)
+        if callable(value) and getattr(value, "__self__", None) is self.__wrapped__:
+            return _read_only_method(value)
+        return read_only(value)
+
+    def __setattr__(self, name: str, value: Any):
+        msg = f"Can't set {name} on a read-only {type(self.__wrapped__).__name__} view"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str):
+        msg = f"Can't delete {name} from a read-only {type(self.__wrapped__).__name__} view"
+        raise AttributeError(msg)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> BaseModel:
+        # A deep copy doesn't follow the live model anymore, so it's a plain model again.
+        return copy.deepcopy(self.__wrapped__, memo)
+
+    def __getitem__(self, item: Any) -> Any:
+        return read_only(self.__wrapped__[item])  # type: ignore[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (read_only(value) for value in self.__wrapped__)  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return len(self.__wrapped__)  # type: ignore[arg-type]
+
+    def __bool__(self) -> bool:
+        return bool(self.__wrapped__)
+
+    def __eq__(self, other: object) -> bool:
+        return self.__wrapped__ == unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self.__wrapped__)
+
+    def __repr__(self) -> str:
+        return repr(self.__wrapped__)
+
+    def __str__(self) -> str:
+        return str(self.__wrapped__)
+
+
+class SequenceView(Sequence[Any]):
+    """
+    Read-only view of a live list or tuple, which hands out its items as read-only views.
+    """
+
+    __slots__ = ("__wrapped__",)
+
+    def __init__(self, target: Sequence[Any]):
+        self.__wrapped__ = target
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Sequence[Any]:
+        return copy.deepcopy(self.__wrapped__, memo)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return SequenceView(self.__wrapped__[index])
+        return read_only(self.__wrapped__[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return (read_only(item) for item in self.__wrapped__)
+
+    def __len__(self) -> int:
+        return len(self.__wrapped__)
+
+    def __contains__(self, item: object) -> bool:
+        return unwrap(item) in self.__wrapped__
+
+    def __eq__(self, other: object) -> bool:
+        return self.__wrapped__ == unwrap(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.__wrapped__)
+
+
+def read_only(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return ModelView(value)
+    if isinstance(value, list):
+        return SequenceView(value)
+    # Tuples are only wrapped for their models, word and index tuples are immutable already.
+    if isinstance(value, tuple) and value and isinstance(value[0], BaseModel):
+        return SequenceView(value)
+    return value
+
+
+def unwrap(value: Any) -> Any:
+    # Views of live objects (state views included) hand them out as their `__wrapped__` attribute.
+    return getattr(value, "__wrapped__", value)
+
+
+def _read_only_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        args = tuple(unwrap(arg) for arg in args)
+        kwargs = {name: unwrap(arg) for name, arg in kwargs.items()}
+        return read_only(method(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+
+from codenames.duet.board import DuetBoard
+from codenames.duet.score import GameResult
+from codenames.generic.async_runner import (
+    AnyOperative,
+    AnySpymaster,
+    AsyncClueGivenSubscriber,
+    AsyncGuessGivenSubscriber,
+    AsyncTeamPlayers,
+    AsyncTimedOutSubscriber,
+    request_timed_clue,
+    request_timed_guess,
+)
+from codenames.generic.exceptions import InvalidGuess
+from codenames.generic.move import GivenGuess
+from codenames.generic.player import PlayerRole
+from codenames.generic.runner import (
+    SEPARATOR,
+    MovePolicy,
+    MoveTimer,
+    MoveTiming,
+    TeamPlayers,
+)
+from codenames.mini.state import MiniGameState
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
+
+log = logging.getLogger(__name__)
+
+
+class AsyncMiniGameRunner:  # pylint: disable=too-many-instance-attributes
+    """
+    Same game flow as `MiniGameRunner`, but awaits player moves, so one event loop can drive many games.
+    """
+
+    def __init__(
+        self,
+        players: AsyncTeamPlayers | TeamPlayers,
+        state: MiniGameState | None = None,
+        board: DuetBoard | None = None,
+        sync_players_in_thread: bool = False,
+        *,
+        move_policy: MovePolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
+        if isinstance(players, TeamPlayers):
+            players = AsyncTeamPlayers.from_team_players(players)
+        self.players = players
+        if (not state and not board) or (state and board):
+            raise ValueError("Exactly one of state or board must be provided.")
+        self.state = state or MiniGameState.from_board(board=board)  # type: ignore[arg-type]
+        self.sync_players_in_thread = sync_players_in_thread
+        self.instrumentation = instrumentation or NO_INSTRUMENTATION
+        self.move_timer = MoveTimer(policy=move_policy or MovePolicy(), instrumentation=self.instrumentation)
+        self.clue_given_subscribers: list[AsyncClueGivenSubscriber] = []
+        self.guess_given_subscribers: list[AsyncGuessGivenSubscriber] = []
+        self.timed_out_subscribers: list[AsyncTimedOutSubscriber] = []
+
+    @property
+    def spymaster(self) -> AnySpymaster:
+        return self.players.spymaster
+
+    @property
+    def operative(self) -> AnyOperative:
+        return self.players.operative
+
+    @property
+    def move_policy(self) -> MovePolicy:
+        return self.move_timer.policy
+
+    @property
+    def move_timings(self) -> list[MoveTiming]:
+        return self.move_timer.timings
+
+    @property
+    def current_role(self) -> PlayerRole:
+        return self.state.current_player_role
+
+    async def run_game(self) -> GameResult:
+        self._notify_game_starts()
+        while not self.state.is_game_over:
+            await self._run_turn()
+        result: GameResult = self.state.game_result  # type: ignore[assignment]
+        suffix = "win!" if result.win else "lose!"
+        log.info(f"{SEPARATOR}{result.reason}, you {suffix}")
+        return result
+
+    def _notify_game_starts(self):
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            self.spymaster.on_game_start(board=self.state.board)
+            self.operative.on_game_start(board=self.state.board.censored)
+
+    async def _run_turn(self):
+        if not self.state.is_sudden_death:
+            await self._get_clue_from(spymaster=self.spymaster)
+        while not self.state.is_game_over and self.current_role == PlayerRole.OPERATIVE:
+            await self._get_guess_from(operative=self.operative)
+
+    async def _get_clue_from(self, spymaster: AnySpymaster):
+        with self.instrumentation.measure(Metric.SPYMASTER_VIEW):
+            spymaster_view = self.state.spymaster_view
+        clue = await request_timed_clue(
+            self.move_timer,
+            spymaster,
+            spymaster_view,
+            in_thread=self.sync_players_in_thread,
+        )
+        if clue is None:
+            self._time_out(player=spymaster)
+            return
+        with self.instrumentation.measure(Metric.CLUE_SUBSCRIBERS):
+            for subscriber in self.clue_given_subscribers:
+                subscriber(spymaster, clue)
+        with self.instrumentation.measure(Metric.PROCESS_CLUE):
+            given_clue = self.state.process_clue(clue=clue)
+        if given_clue is None:
+            return
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_clue_given(given_clue=given_clue)
+
+    def _time_out(self, player: AnySpymaster | AnyOperative):
+        for subscriber in self.timed_out_subscribers:
+            subscriber(player)
+        self.state.time_out()
+
+    async def _get_guess_from(self, operative: AnyOperative):
+        given_guess = await self._get_guess_until_valid(operative)
+        if given_guess is None:
+            return
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_guess_given(given_guess=given_guess)
+
+    async def _get_guess_until_valid(self, operative: AnyOperative) -> GivenGuess | None:
+        with self.instrumentation.measure(Metric.OPERATIVE_VIEW):
+            operative_view = self.state.operative_view
+        invalid_guesses = 0
+        while True:
+            guess = await request_timed_guess(
+                self.move_timer,
+                operative,
+                operative_view,
+                invalid_guesses=invalid_guesses,
+                in_thread=self.sync_players_in_thread,
+            )
+            if guess is None:
+                self._time_out(player=operative)
+                return None
+            try:
+                with self.instrumentation.measure(Metric.PROCESS_GUESS):
+                    given_guess = self.state.process_guess(guess=guess)
+            except InvalidGuess:
+                invalid_guesses += 1
+                continue
+            with self.instrumentation.measure(Metric.GUESS_SUBSCRIBERS):
+                for subscriber in self.guess_given_subscribers:
+                    subscriber(operative, guess)
+            return given_guess
@@ -6,26 +6,41 @@ from codenames.duet.board import DuetBoard
 from codenames.duet.score import GameResult
 from codenames.generic.exceptions import InvalidGuess
 from codenames.generic.move import GivenGuess
-from codenames.generic.player import Operative, PlayerRole, Spymaster
+from codenames.generic.player import Operative, Player, PlayerRole, Spymaster
 from codenames.generic.runner import (
     SEPARATOR,
     ClueGivenSubscriber,
     GuessGivenSubscriber,
+    MovePolicy,
+    MoveTimer,
+    MoveTiming,
     TeamPlayers,
+    TimedOutSubscriber,
 )
 from codenames.mini.state import MiniGameState
+from codenames.utils.instrumentation import NO_INSTRUMENTATION, Instrumentation, Metric
 
 log = logging.getLogger(__name__)
 
 
 class MiniGameRunner:
-    def __init__(self, players: TeamPlayers, state: MiniGameState | None = None, board: DuetBoard | None = None):
+    def __init__(
+        self,
+        players: TeamPlayers,
+        state: MiniGameState | None = None,
+        board: DuetBoard | None = None,
+        move_policy: MovePolicy | None = None,
+        instrumentation: Instrumentation | None = None,
+    ):
         self.players = players
         if (not state and not board) or (state and board):
             raise ValueError("Exactly one of state or board must be provided.")
         self.state = state or MiniGameState.from_board(board=board)  # type: ignore[arg-type]
+        self.instrumentation = instrumentation or NO_INSTRUMENTATION
+        self.move_timer = MoveTimer(policy=move_policy or MovePolicy(), instrumentation=self.instrumentation)
         self.clue_given_subscribers: list[ClueGivenSubscriber] = []
         self.guess_given_subscribers: list[GuessGivenSubscriber] = []
+        self.timed_out_subscribers: list[TimedOutSubscriber] = []
 
     @property
     def spymaster(self) -> Spymaster:
@@ -35,6 +50,14 @@ class MiniGameRunner:
     def operative(self) -> Operative:
         return self.players.operative
 
+    @property
+    def move_policy(self) -> MovePolicy:
+        return self.move_timer.policy
+
+    @property
+    def move_timings(self) -> list[MoveTiming]:
+        return self.move_timer.timings
+
     @property
     def current_role(self) -> PlayerRole:
         return self.state.current_player_role
@@ -47,8 +70,9 @@ class MiniGameRunner:
         return result
 
     def _notify_game_starts(self):
-        self.spymaster.on_game_start(board=self.state.board)
-        self.operative.on_game_start(board=self.state.board.censored)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            self.spymaster.on_game_start(board=self.state.board)
+            self.operative.on_game_start(board=self.state.board.censored)
 
     def _run_rounds(self) -> GameResult:
         while not self.state.is_game_over:
@@ -62,29 +86,52 @@ class MiniGameRunner:
             self._get_guess_from(operative=self.operative)
 
     def _get_clue_from(self, spymaster: Spymaster):
-        clue = spymaster.give_clue(game_state=self.state.spymaster_state)
-        for subscriber in self.clue_given_subscribers:
-            subscriber(spymaster, clue)
-        given_clue = self.state.process_clue(clue=clue)
+        with self.instrumentation.measure(Metric.SPYMASTER_VIEW):
+            spymaster_view = self.state.spymaster_view
+        clue = self.move_timer.give_clue(spymaster, game_state=spymaster_view)
+        if clue is None:
+            self._time_out(player=spymaster)
+            return
+        with self.instrumentation.measure(Metric.CLUE_SUBSCRIBERS):
+            for subscriber in self.clue_given_subscribers:
+                subscriber(spymaster, clue)
+        with self.instrumentation.measure(Metric.PROCESS_CLUE):
+            given_clue = self.state.process_clue(clue=clue)
         if given_clue is None:
             return
-        for player in self.players:
-            player.on_clue_given(given_clue=given_clue)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_clue_given(given_clue=given_clue)
+
+    def _time_out(self, player: Player):
+        for subscriber in self.timed_out_subscribers:
+            subscriber(player)
+        self.state.time_out()
 
     def _get_guess_from(self, operative: Operative):
         given_guess = self._get_guess_until_valid(operative)
         if given_guess is None:
             return
-        for player in self.players:
-            player.on_guess_given(given_guess=given_guess)
+        with self.instrumentation.measure(Metric.PLAYER_NOTIFICATIONS):
+            for player in self.players:
+                player.on_guess_given(given_guess=given_guess)
 
     def _get_guess_until_valid(self, operative: Operative) -> GivenGuess | None:
+        with self.instrumentation.measure(Metric.OPERATIVE_VIEW):
+            operative_view = self.state.operative_view
+        invalid_guesses = 0
         while True:
-            guess = operative.guess(game_state=self.state.operative_state)
+            guess = self.move_timer.guess(operative, game_state=operative_view, invalid_guesses=invalid_guesses)
+            if guess is None:
+                self._time_out(player=operative)
+                return None
             try:
-                given_guess = self.state.process_guess(guess=guess)
+                with self.instrumentation.measure(Metric.PROCESS_GUESS):
+                    given_guess = self.state.process_guess(guess=guess)
             except InvalidGuess:
+                invalid_guesses += 1
                 continue
-            for subscriber in self.guess_given_subscribers:
-                subscriber(operative, guess)
+            with self.instrumentation.measure(Metric.GUESS_SUBSCRIBERS):
+                for subscriber in self.guess_given_subscribers:
+                    subscriber(operative, guess)
             return given_guess
@@ -1,4 +1,5 @@
 import logging
+from typing import Any, Self
 
 from codenames.duet.score import MISTAKE_LIMIT_REACHED, TIMER_TOKENS_DEPLETED
 from codenames.duet.state import DuetSideState
@@ -17,6 +18,18 @@ class MiniGameState(DuetSideState):
     def is_sudden_death(self) -> bool:
         return self.timer_tokens == 0
 
+    def model_dump_normalized(self) -> dict[str, Any]:
+        data = super().model_dump_normalized()
+        data.update(timer_tokens=self.timer_tokens, allowed_mistakes=self.allowed_mistakes)
+        return data
+
+    @classmethod
+    def model_validate_normalized(cls, data: dict[str, Any], trusted: bool = False) -> Self:
+        state = super().model_validate_normalized(data, trusted=trusted)
+        state.timer_tokens = data["timer_tokens"]
+        state.allowed_mistakes = data["allowed_mistakes"]
+        return state
+
     def process_guess(self, guess: Guess) -> DuetGivenGuess | None:
         given_guess = super().process_guess(guess)
         # If the guess is correct, there is nothing to do
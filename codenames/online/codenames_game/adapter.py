@@ -1,29 +1,33 @@
 from __future__ import annotations
 
 import logging
-import os
+import math
 from dataclasses import dataclass
 from enum import StrEnum
-from time import sleep
-from typing import TYPE_CHECKING, Callable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
-from selenium import webdriver
 from selenium.common import ElementNotInteractableException
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 
 from codenames.classic.board import ClassicBoard
 from codenames.generic.move import PASS_GUESS, Clue, Guess
 from codenames.generic.player import Player, Spymaster
-from codenames.generic.state import OperativeState
+from codenames.generic.state import OperativeState, SpymasterState
 from codenames.online.codenames_game.agent import Agent
-from codenames.online.codenames_game.card_parser import _parse_card
+from codenames.online.codenames_game.card_parser import (
+    CARDS_PAYLOAD_SCRIPT,
+    _is_card_revealed,
+    parse_cards_payload,
+)
+from codenames.online.codenames_game.driver_pool import DriverPool, create_chrome_driver
+from codenames.online.codenames_game.page_observer import PageObserver
 from codenames.online.codenames_game.screenshot import save_screenshot
 from codenames.online.utils import (
     PollingTimeout,
     fill_input,
     multi_click,
     poll_elements,
+    try_poll_condition,
 )
 from codenames.utils.formatting import wrap
 
@@ -33,6 +37,8 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 WEBAPP_URL = "https://codenames.game/"
+CLUE_TEXT_XPATH = "/html/body/div/div/div/div/div[3]/div/main/div[2]/main/div/article/p[1]"
+CARDS_TEXT_XPATH = "/html/body/div/div/div/div/div[3]/div/main/div[2]/main/div/article/p[2]"
 
 
 class CodenamesGameLanguage(StrEnum):
@@ -52,27 +58,53 @@ class GameConfigs:
     language: CodenamesGameLanguage = DEFAULT_LANGUAGE
 
 
+@dataclass(frozen=True)
+class AdapterTimeouts:
+    # Upper bounds only, every wait returns as soon as its condition holds.
+    element_sec: float = 15
+    move_ack_sec: float = 10
+    # None waits for opponent moves for as long as they take, since human opponents may think for a while.
+    opponent_move_sec: float | None = None
+
+    @property
+    def opponent_move_limit_sec(self) -> float:
+        return math.inf if self.opponent_move_sec is None else self.opponent_move_sec
+
+
 class CodenamesGamePlayerAdapter:
     def __init__(
         self,
         player: Player,
-        implicitly_wait: int = 1,
+        implicitly_wait: int = 0,
         headless: bool = True,
         chromedriver_path: str | None = None,
         game_url: str | None = None,
+        *,
+        timeouts: AdapterTimeouts | None = None,
+        driver_pool: DriverPool | None = None,
+        base_url: str = WEBAPP_URL,
     ):
-        options = webdriver.ChromeOptions()
         if player.is_human or isinstance(player, Agent):
             headless = False
-        if headless:
-            options.add_argument("headless")
-        if not chromedriver_path:
-            chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
-        service = Service(executable_path=chromedriver_path)
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.implicitly_wait(implicitly_wait)
+        if driver_pool:
+            self.driver = driver_pool.acquire(headless=headless)
+            self.driver.implicitly_wait(implicitly_wait)
+        else:
+            self.driver = create_chrome_driver(
+                headless=headless,
+                chromedriver_path=chromedriver_path,
+                implicitly_wait=implicitly_wait,
+            )
+        self.driver_pool = driver_pool
         self.player = player
         self.game_url = game_url
+        self.base_url = base_url
+        self.timeouts = timeouts or AdapterTimeouts()
+        self.page_observer = PageObserver(
+            driver=self.driver,
+            clue_text_xpath=CLUE_TEXT_XPATH,
+            cards_text_xpath=CARDS_TEXT_XPATH,
+        )
 
     # Utils #
 
@@ -86,7 +118,7 @@ class CodenamesGamePlayerAdapter:
     # Methods #
 
     def open(self) -> CodenamesGamePlayerAdapter:
-        game_url = self.game_url or WEBAPP_URL
+        game_url = self.game_url or self.base_url
         log.info(f"{self.log_prefix} opening {game_url}")
         self.driver.get(game_url)
         return self
@@ -94,8 +126,7 @@ class CodenamesGamePlayerAdapter:
     def host_game(self) -> CodenamesGamePlayerAdapter:
         log.info(f"{self.log_prefix} creating a room...")
         create_room_button = self.poll_element(self.get_create_room_button)
-        multi_click(create_room_button)
-        sleep(1)
+        multi_click(create_room_button, until=lambda: self._is_present(self.get_nickname_input))
         self.login()
         log.info(f"{self.log_prefix} New game created")
         return self
@@ -104,7 +135,6 @@ class CodenamesGamePlayerAdapter:
         try:
             full_settings_button = self.poll_element(self.get_full_settings_button, timeout_sec=3)
             full_settings_button.click()
-            sleep(0.2)
             return True
         except PollingTimeout:
             log.info("Full settings button not found, trying without it")
@@ -114,7 +144,6 @@ class CodenamesGamePlayerAdapter:
     def click_language_selector(self) -> bool:
         language_selector = self.poll_element(self.get_language_selector)
         language_selector.click()
-        sleep(0.2)
         return True
 
     def try_pick_language(self, language: str) -> bool:
@@ -125,7 +154,6 @@ class CodenamesGamePlayerAdapter:
 
             language_flag = self.poll_element(get_language_flag, timeout_sec=3)
             language_flag.click()
-            sleep(0.2)
             return True
         except (PollingTimeout, ElementNotInteractableException):
             log.info(f"Language [{language}] selection failed")
@@ -152,17 +180,15 @@ class CodenamesGamePlayerAdapter:
         nickname_input = self.poll_element(self.get_nickname_input)
         fill_input(nickname_input, value=self.player.name)
         # Submit
-        submit_button = self.get_login_submit_button()
-        multi_click(submit_button)
+        submit_button = self.poll_element(self.get_login_submit_button)
+        multi_click(submit_button, until=lambda: not self._is_present(self.get_nickname_input))
         return self
 
     def choose_role(self) -> CodenamesGamePlayerAdapter:
         log.info(f"{self.log_prefix} picking role...")
-        join_button = self.get_join_button()
+        join_button = self.poll_element(self.get_join_button)
         # self.screenshot(f"before-join")
-        sleep(0.3)
-        multi_click(join_button)
-        sleep(0.2)
+        multi_click(join_button, until=lambda: not self._is_present(self.get_join_button))
         self.screenshot("after-join")
         return self
 
@@ -179,14 +205,14 @@ class CodenamesGamePlayerAdapter:
     def start_game(self):
         possible_start_game_buttons = [self.get_start_game_button, self.get_play_with_button]
         start_game_button = self.poll_elements(possible_start_game_buttons)
-        multi_click(start_game_button)
+        multi_click(start_game_button, until=lambda: self._is_present(self.get_cards_payload))
+        self.page_observer.install()
         return self
 
     def parse_board(self, language: str) -> ClassicBoard:
         log.debug("Parsing board...")
-        card_containers = self.poll_element(self.get_card_containers)
-        parse_results = [_parse_card(card) for card in card_containers]
-        parse_results.sort(key=lambda result: result.index)
+        cards_payload = self.poll_element(self.get_cards_payload)
+        parse_results = parse_cards_payload(cards_payload)
         cards = [result.card for result in parse_results]
         log.debug("Board parsed.")
         return ClassicBoard(language=language, cards=cards)
@@ -196,40 +222,55 @@ class CodenamesGamePlayerAdapter:
         # Clue value
         clue_input = self.poll_element(self.get_clue_input)
         fill_input(clue_input, clue.word)
-        sleep(0.1)
         # Number
         number_selector = self.poll_element(self.get_number_wrapper)
         number_selector.click()
-        sleep(0.5)
 
         def get_number_option() -> WebElement:
             return self.get_number_option(number_selector, clue.card_amount)
 
         number_to_select = self.poll_element(get_number_option)
         number_to_select.click()
-        sleep(0.5)
         # Submit
         submit_button = self.poll_element(self.get_give_clue_button)
         submit_button.click()
-        sleep(2)
+
+        def is_clue_shown() -> bool:
+            return self.get_clue_text().text.strip().lower() == clue.word.lower()
+
+        self._wait_for_ack(is_clue_shown, move=f"clue {clue}")
         return self
 
     def transmit_guess(self, guess: Guess) -> CodenamesGamePlayerAdapter:
         log.debug(f"Sending guess: {guess}")
         if guess.card_index == PASS_GUESS:
             end_guessing_button = self.poll_element(self.get_end_guessing_button)
-            multi_click(end_guessing_button, times=10, warn=False)
+
+            def is_acknowledged() -> bool:
+                return not self._is_present(self.get_end_guessing_button)
+
+            clicked = end_guessing_button
         else:
 
             def get_card_picker() -> WebElement:
                 return self.get_card_picker(guess.card_index)
 
-            picker = self.poll_element(get_card_picker)
-            multi_click(picker, times=10, warn=False)
-        sleep(1.5)
+            def is_acknowledged() -> bool:
+                return _is_card_revealed(self.get_card_container(guess.card_index))
+
+            clicked = self.poll_element(get_card_picker)
+        if not multi_click(clicked, times=10, warn=False, until=is_acknowledged):
+            self._wait_for_ack(is_acknowledged, move=f"guess {guess}")
         return self
 
-    def close(self):
+    def close(self, discard: bool = False):
+        # Discarding quits a pooled session instead of returning it, for sessions that another thread may still use.
+        if self.driver_pool:
+            if discard:
+                self.driver_pool.discard(self.driver)
+            else:
+                self.driver_pool.release(self.driver)
+            return
         try:
             self.driver.close()
         except:  # noqa  # pylint: disable=bare-except
@@ -266,7 +307,7 @@ class CodenamesGamePlayerAdapter:
         return self.driver.find_element(by=By.ID, value=team_window_id)
 
     def get_join_button(self) -> WebElement:
-        team_window = self.poll_element(self.get_team_window)
+        team_window = self.get_team_window()
         role_name = "Spymaster" if isinstance(self.player, Spymaster) else "Operative"
         join_button_text = f"Join as {role_name}"
         return team_window.find_element(by=By.XPATH, value=f".//*[contains(text(),'{join_button_text}')]")
@@ -285,6 +326,17 @@ class CodenamesGamePlayerAdapter:
             raise ValueError(msg)
         return self.driver.find_elements(By.XPATH, value="//div[@role='img']")
 
+    def get_cards_payload(self) -> list[dict[str, Any]]:
+        cards_payload = self.driver.execute_script(CARDS_PAYLOAD_SCRIPT)
+        loaded = [card_payload for card_payload in cards_payload if card_payload["word"].strip()]
+        if len(loaded) < 25:
+            msg = f"Expected 25 cards, loaded {len(loaded)}"
+            raise ValueError(msg)
+        return cards_payload
+
+    def get_card_container(self, card_index: int) -> WebElement:
+        return self.driver.find_element(By.XPATH, value=f"//div[@role='img' and @tabindex='{card_index}']")
+
     def get_clue_input(self) -> WebElement:
         return self.driver.find_element(By.CSS_SELECTOR, value="input[name='clue']")
 
@@ -307,12 +359,10 @@ class CodenamesGamePlayerAdapter:
         return self.driver.find_element(by=By.XPATH, value=end_guessing_xpath)
 
     def get_clue_text(self) -> WebElement:
-        xpath = "/html/body/div/div/div/div/div[3]/div/main/div[2]/main/div/article/p[1]"
-        return self.driver.find_element(by=By.XPATH, value=xpath)
+        return self.driver.find_element(by=By.XPATH, value=CLUE_TEXT_XPATH)
 
     def get_cards_text(self) -> WebElement:
-        xpath = "/html/body/div/div/div/div/div[3]/div/main/div[2]/main/div/article/p[2]"
-        return self.driver.find_element(by=By.XPATH, value=xpath)
+        return self.driver.find_element(by=By.XPATH, value=CARDS_TEXT_XPATH)
 
     # Other #
 
@@ -321,7 +371,7 @@ class CodenamesGamePlayerAdapter:
     ](
         self,
         element_getter: Callable[[], T],
-        timeout_sec: float = 15,
+        timeout_sec: float | None = None,
         poll_interval_sec: float = 0.5,
         screenshot: bool = True,
     ) -> T:
@@ -338,60 +388,53 @@ class CodenamesGamePlayerAdapter:
     ](
         self,
         element_getters: list[Callable[[], T]],
-        timeout_sec: float = 15,
+        timeout_sec: float | None = None,
         poll_interval_sec: float = 0.5,
         screenshot: bool = True,
     ) -> T:
         if len(element_getters) > 1:
             log.debug(f"Polling [{len(element_getters)}] elements...")
+        if timeout_sec is None:
+            timeout_sec = self.timeouts.element_sec
         try:
             return poll_elements(element_getters, timeout_sec=timeout_sec, poll_interval_sec=poll_interval_sec)
         except Exception:
             if screenshot:
                 log.info(f"{self.log_prefix} Polling failed, saving screenshot...")
-                self.screenshot("failed polling")
+                self.screenshot("failed polling", rate_limited=False)
             raise
 
-    def screenshot(self, tag: str, raise_on_error: bool = False) -> str | None:
-        return save_screenshot(adapter=self, tag=tag, raise_on_error=raise_on_error)
-
-    def poll_clue_given(self) -> Clue:
-        log.debug("Polling for clue given...")
-        clue_text = self.poll_element(self.get_clue_text, timeout_sec=180, poll_interval_sec=2)
-        cards_text = self.poll_element(self.get_cards_text)
-        return Clue(word=clue_text.text.strip(), card_amount=int(cards_text.text[0]))
-
-    def detect_visibility_change(self, revealed_card_indexes: set[int]) -> int | None:
-        log.debug("Looking for visibility change...")
-        board = self.parse_board(language="")
-        for i, card in enumerate(board.cards):
-            if card.revealed and i not in revealed_card_indexes:
-                log.debug(f"Found a visibility change at index {wrap(i)}")
-                return i
-        log.debug("No visibility change found")
-        return None
-
-    def has_clue_text(self) -> bool:
+    def screenshot(self, tag: str, raise_on_error: bool = False, rate_limited: bool = True) -> str | None:
+        return save_screenshot(adapter=self, tag=tag, raise_on_error=raise_on_error, rate_limited=rate_limited)
+
+    def _is_present(self, element_getter: Callable[[], object]) -> bool:
+        # Immediate check, relies on the driver not waiting implicitly.
         try:
-            self.poll_element(self.get_clue_text, screenshot=False, timeout_sec=2)
+            element_getter()
             return True
-        except PollingTimeout:
+        except Exception:  # pylint: disable=broad-except
             return False
 
-    def poll_guess_given(self, game_state: OperativeState) -> Guess:
-        log.debug("Polling for guess given...")
-        revealed_card_indexes = set(game_state.board.revealed_card_indexes)
-        should_return = False
-        while not should_return:
-            if not self.has_clue_text():
-                log.debug("No clue text found, detecting changes last time...")
-                should_return = True
-            card_index = self.detect_visibility_change(revealed_card_indexes)
-            if card_index is not None:
-                return Guess(card_index=card_index)
-            sleep(1)
-        log.debug("Returning pass guess.")
-        return Guess(card_index=PASS_GUESS)
+    def _wait_for_ack(self, is_acknowledged: Callable[[], bool], move: str):
+        if try_poll_condition(is_acknowledged, timeout_sec=self.timeouts.move_ack_sec):
+            return
+        log.warning(f"{self.log_prefix} {move} was not acknowledged within {self.timeouts.move_ack_sec} seconds")
+        self.screenshot("move not acknowledged", rate_limited=False)
+
+    def wait_for_clue(self, game_state: SpymasterState) -> Clue:
+        log.debug("Waiting for clue given...")
+        return self.page_observer.wait_for_clue(
+            clue_number=len(game_state.given_clues) + 1,
+            timeout_sec=self.timeouts.opponent_move_limit_sec,
+        )
+
+    def wait_for_guess(self, game_state: OperativeState) -> Guess:
+        log.debug("Waiting for guess given...")
+        return self.page_observer.wait_for_guess(
+            revealed_card_indexes=set(game_state.board.revealed_card_indexes),
+            clue_number=len(game_state.given_clues),
+            timeout_sec=self.timeouts.opponent_move_limit_sec,
+        )
 
 
 LANGUAGE_CODES: Mapping[CodenamesGameLanguage, str] = {
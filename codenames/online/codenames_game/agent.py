@@ -27,11 +27,11 @@ class SpymasterAgent(Agent, ClassicSpymaster):
     def give_clue(self, game_state: SpymasterState) -> Clue:
         if not self.adapter:
             raise RuntimeError("SpymasterAgent.adapter is not set")
-        return self.adapter.poll_clue_given()
+        return self.adapter.wait_for_clue(game_state=game_state)
 
 
 class OperativeAgent(Agent, ClassicOperative):
     def guess(self, game_state: OperativeState) -> Guess:
         if not self.adapter:
             raise RuntimeError("OperativeAgent.adapter is not set")
-        return self.adapter.poll_guess_given(game_state=game_state)
+        return self.adapter.wait_for_guess(game_state=game_state)
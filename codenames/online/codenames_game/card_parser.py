@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass
+from typing import Any
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
@@ -24,6 +25,49 @@ class ParseResult:
     index: int
 
 
+# Follows the accessible name of a `role=img` card container: `aria-labelledby`, then `aria-label`, then `title`.
+CARD_LABEL_FUNCTION = """
+const cardLabel = (container) => {
+    const labelledBy = (container.getAttribute("aria-labelledby") || "")
+        .split(" ")
+        .map((id) => document.getElementById(id))
+        .filter((element) => element)
+        .map((element) => element.textContent)
+        .join(" ");
+    return labelledBy || container.getAttribute("aria-label") || container.getAttribute("title") || "";
+};
+"""
+
+# Collects everything `_parse_card` reads from every card container in a single WebDriver round trip.
+CARDS_PAYLOAD_SCRIPT = CARD_LABEL_FUNCTION + """
+return Array.from(document.querySelectorAll("div[role='img']")).map((container) => {
+    const card = container.querySelector("div");
+    return {
+        index: container.getAttribute("tabindex"),
+        word: card ? card.innerText : "",
+        classes: card ? card.getAttribute("class") || "" : "",
+        label: cardLabel(container),
+    };
+});
+"""
+
+
+def parse_cards_payload(payload: list[dict[str, Any]]) -> list[ParseResult]:
+    results = [_parse_card_payload(card_payload) for card_payload in payload]
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def _parse_card_payload(card_payload: dict[str, Any]) -> ParseResult:
+    word = card_payload["word"].strip().lower()
+    card_color = _parse_color_classes(card_payload["classes"].split(" "))
+    revealed = "revealed" in card_payload["label"]
+    index = int(card_payload["index"])
+    card = ClassicCard(word=word, color=card_color, revealed=revealed)
+    log.debug(f"Parsed card {index}: {card}")
+    return ParseResult(card=card, index=index)
+
+
 def _parse_card(card_container: WebElement) -> ParseResult:
     card_element = card_container.find_element(By.TAG_NAME, value="div")
     word = _parse_card_word(card_element=card_element)
@@ -46,6 +90,10 @@ def _parse_card_word(card_element: WebElement) -> str:
 
 def _parse_card_color(card_element: WebElement) -> ClassicColor:
     element_classes = card_element.get_attribute("class").split(" ")  # type: ignore
+    return _parse_color_classes(element_classes)
+
+
+def _parse_color_classes(element_classes: list[str]) -> ClassicColor:
     for css_class, classic_color in CSS_CLASS_TO_CLASSIC_COLOR.items():
         if css_class.lower() in element_classes:
             return classic_color
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from functools import partial
+from threading import Condition
+from typing import Callable, ContextManager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+
+log = logging.getLogger(__name__)
+
+DriverFactory = Callable[[bool], WebDriver]
+
+RESET_STORAGE_SCRIPT = """
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (e) {}
+"""
+
+
+class DriverPoolExhausted(Exception):
+    def __init__(self, max_size: int, timeout_sec: float):
+        self.max_size = max_size
+        self.timeout_sec = timeout_sec
+        super().__init__(f"No browser session freed up within {timeout_sec} seconds (pool size is {max_size})")
+
+
+def create_chrome_driver(headless: bool, chromedriver_path: str | None = None, implicitly_wait: int = 0) -> WebDriver:
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("headless")
+    if not chromedriver_path:
+        chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
+    service = Service(executable_path=chromedriver_path)
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.implicitly_wait(implicitly_wait)
+    return driver
+
+
+class DriverPool(ContextManager):
+    """
+    Keeps browser sessions alive between games, since starting one takes seconds.
+    Released sessions are reset (cookies, storage and page) before they are handed out again.
+    At most `max_size` sessions exist at once, `acquire` blocks until one is released.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4,
+        chromedriver_path: str | None = None,
+        driver_factory: DriverFactory | None = None,
+    ):
+        if max_size < 1:
+            msg = f"Pool size must be positive, got {max_size}"
+            raise ValueError(msg)
+        self.max_size = max_size
+        self._driver_factory = driver_factory or partial(create_chrome_driver, chromedriver_path=chromedriver_path)
+        self._idle: list[tuple[WebDriver, bool]] = []
+        self._headless: dict[WebDriver, bool] = {}
+        self._starting = 0
+        self._closed = False
+        self._condition = Condition()
+
+    @property
+    def size(self) -> int:
+        return len(self._headless) + self._starting
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def __exit__(self, __exc_type, __exc_value, __traceback):
+        self.close()
+
+    def warm_up(self, amount: int, headless: bool = True):
+        drivers = [self.acquire(headless=headless) for _ in range(min(amount, self.max_size))]
+        for driver in drivers:
+            self.release(driver)
+
+    def acquire(self, headless: bool = True, timeout_sec: float | None = None) -> WebDriver:
+        deadline = None if timeout_sec is None else time.monotonic() + timeout_sec
+        with self._condition:
+            while True:
+                for i, (driver, idle_headless) in enumerate(self._idle):
+                    if idle_headless == headless:
+                        del self._idle[i]
+                        log.debug("Reusing a pooled browser session")
+                        return driver
+                if self.size >= self.max_size and self._idle:
+                    # Only sessions of the other kind are idle, replace one of them.
+                    self._quit(self._idle.pop(0)[0])
+                if self.size < self.max_size:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise DriverPoolExhausted(max_size=self.max_size, timeout_sec=timeout_sec)  # type: ignore
+                self._condition.wait(timeout=remaining)
+            # Reserve the slot, the browser is started outside the lock.
+            self._starting += 1
+        try:
+            log.info("Starting a new browser session")
+            driver = self._driver_factory(headless)
+        except Exception:
+            with self._condition:
+                self._starting -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._starting -= 1
+            self._headless[driver] = headless
+        return driver
+
+    def release(self, driver: WebDriver):
+        if driver not in self._headless:
+            msg = "Driver does not belong to this pool"
+            raise ValueError(msg)
+        if self._closed:
+            with self._condition:
+                self._quit(driver)
+            return
+        try:
+            _reset_session(driver)
+        except Exception as e:  # pylint: disable=broad-except
+            log.warning(f"Failed resetting browser session, discarding it: {e}")
+            with self._condition:
+                self._quit(driver)
+                self._condition.notify()
+            return
+        with self._condition:
+            self._idle.append((driver, self._headless[driver]))
+            self._condition.notify()
+
+    def discard(self, driver: WebDriver):
+        # For sessions that may still be in use, which can't be reset and handed out again.
+        if driver not in self._headless:
+            msg = "Driver does not belong to this pool"
+            raise ValueError(msg)
+        with self._condition:
+            self._quit(driver)
+            self._condition.notify()
+
+    def close(self):
+        # Quits idle sessions, sessions still in use are quit when released after closing.
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._quit(self._idle.pop()[0])
+
+    def _quit(self, driver: WebDriver):
+        self._headless.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception as e:  # pylint: disable=broad-except
+            log.debug(f"Failed quitting browser session: {e}")
+
+
+def _reset_session(driver: WebDriver):
+    driver.execute_script(RESET_STORAGE_SCRIPT)
+    driver.delete_all_cookies()
+    driver.get("about:blank")
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Condition, Thread
+from typing import Any, ContextManager, Self
+from urllib.parse import parse_qs, urlparse
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.color import ClassicColor
+from codenames.classic.state import ClassicGameState
+from codenames.classic.team import ClassicTeam
+from codenames.generic.exceptions import (
+    GameIsOver,
+    InvalidClue,
+    InvalidGuess,
+    InvalidTurn,
+)
+from codenames.generic.move import Clue, Guess
+from codenames.generic.player import PlayerRole
+from codenames.online.codenames_game.adapter import (
+    LANGUAGE_CODES,
+    CodenamesGameLanguage,
+)
+from codenames.utils.vocabulary.languages import get_vocabulary
+
+log = logging.getLogger(__name__)
+
+PAGE_PATH = Path(__file__).with_suffix(".html")
+CLASSIC_COLOR_TO_CSS_CLASS = {
+    ClassicColor.RED: "red",
+    ClassicColor.BLUE: "blue",
+    ClassicColor.NEUTRAL: "gray",
+    ClassicColor.ASSASSIN: "black",
+}
+LANGUAGE_BY_CODE = {code: language for language, code in LANGUAGE_CODES.items()}
+MAX_POLL_SEC = 10.0
+
+
+class LocalAppError(Exception):
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        self.status = status
+        super().__init__(message)
+
+
+@dataclass
+class RoomPlayer:
+    name: str
+    team: ClassicTeam | None = None
+    role: PlayerRole | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "team": self.team, "role": self.role}
+
+
+class Room:
+    """
+    A single game room. Every change bumps `version`, which page long polls wait on.
+    """
+
+    def __init__(self, room_id: str, seed: int | None = None):
+        self.room_id = room_id
+        self.seed = seed
+        self.language = CodenamesGameLanguage.ENGLISH
+        self.players: dict[str, RoomPlayer] = {}
+        self.state: ClassicGameState | None = None
+        self.version = 0
+        self._condition = Condition()
+
+    def wait_for_change(self, since: int, timeout_sec: float):
+        with self._condition:
+            self._condition.wait_for(lambda: self.version > since, timeout=timeout_sec)
+
+    def view(self, player_id: str) -> dict[str, Any]:
+        with self._condition:
+            me = self.players.get(player_id)
+            state = self.state
+            view: dict[str, Any] = {
+                "version": self.version,
+                "language": LANGUAGE_CODES[self.language],
+                "started": state is not None,
+                "me": me.to_dict() if me else None,
+                "players": [player.to_dict() for player in self.players.values()],
+                "board": [],
+                "clue": None,
+                "winner": None,
+                "my_turn": False,
+            }
+            if state is None:
+                return view
+            sees_colors = me is not None and me.role == PlayerRole.SPYMASTER
+            view["board"] = [
+                {
+                    "word": card.word,
+                    "color": CLASSIC_COLOR_TO_CSS_CLASS[card.color] if sees_colors or card.revealed else None,  # type: ignore
+                    "revealed": card.revealed,
+                }
+                for card in state.board.cards
+            ]
+            view["current_team"] = state.current_team
+            view["current_role"] = state.current_player_role
+            if state.winner:
+                view["winner"] = state.winner.team
+                return view
+            if state.current_player_role == PlayerRole.OPERATIVE:
+                clue = state.last_given_clue
+                view["clue"] = {"word": clue.word, "amount": clue.card_amount}
+            view["my_turn"] = me is not None and (me.team, me.role) == (state.current_team, state.current_player_role)
+            return view
+
+    def join(self, name: str) -> str:
+        if not name.strip():
+            raise LocalAppError("Nickname is required")
+        player_id = uuid.uuid4().hex
+        with self._condition:
+            self.players[player_id] = RoomPlayer(name=name.strip())
+            self._changed()
+        return player_id
+
+    def choose_role(self, player_id: str, team: str, role: str):
+        with self._condition:
+            player = self._get_player(player_id)
+            if player.team is not None:
+                raise LocalAppError("Player already has a role")
+            team, role = ClassicTeam(team), PlayerRole(role)  # type: ignore
+            taken = any(other.team == team and other.role == PlayerRole.SPYMASTER for other in self.players.values())
+            if role == PlayerRole.SPYMASTER and taken:
+                msg = f"{team} spymaster is taken"
+                raise LocalAppError(msg)
+            player.team, player.role = team, role  # type: ignore
+            self._changed()
+
+    def set_language(self, player_id: str, code: str):
+        with self._condition:
+            self._get_player(player_id)
+            if code not in LANGUAGE_BY_CODE:
+                msg = f"Unknown language code: {code}"
+                raise LocalAppError(msg)
+            self.language = LANGUAGE_BY_CODE[code]
+            self._changed()
+
+    def start(self, player_id: str):
+        with self._condition:
+            self._get_player(player_id)
+            if self.state is not None:
+                raise LocalAppError("Game already started")
+            board = ClassicBoard.from_vocabulary(vocabulary=get_vocabulary(self.language.value), seed=self.seed)
+            self.state = ClassicGameState.from_board(board=board)
+            self._changed()
+
+    def give_clue(self, player_id: str, word: str, amount: int | None):
+        if amount is None:
+            raise LocalAppError("Pick the number of cards")
+        with self._condition:
+            state = self._get_turn_state(player_id, PlayerRole.SPYMASTER)
+            try:
+                state.process_clue(Clue(word=word, card_amount=amount))
+            except (InvalidClue, InvalidTurn, GameIsOver) as e:
+                raise LocalAppError(str(e)) from e
+            self._changed()
+
+    def guess(self, player_id: str, index: int):
+        with self._condition:
+            state = self._get_turn_state(player_id, PlayerRole.OPERATIVE)
+            try:
+                state.process_guess(Guess(card_index=index))
+            except (InvalidGuess, InvalidTurn, GameIsOver) as e:
+                raise LocalAppError(str(e)) from e
+            self._changed()
+
+    def _get_player(self, player_id: str) -> RoomPlayer:
+        player = self.players.get(player_id)
+        if player is None:
+            raise LocalAppError("Unknown player", status=HTTPStatus.FORBIDDEN)
+        return player
+
+    def _get_turn_state(self, player_id: str, role: PlayerRole) -> ClassicGameState:
+        player = self._get_player(player_id)
+        state = self.state
+        if state is None:
+            raise LocalAppError("Game not started")
+        if (player.team, player.role) != (state.current_team, role):
+            raise LocalAppError("It's not your turn", status=HTTPStatus.FORBIDDEN)
+        return state
+
+    def _changed(self):
+        self.version += 1
+        self._condition.notify_all()
+
+
+class LocalCodenamesApp(ContextManager):
+    """
+    A local stand-in for codenames.game, serving the DOM contract `CodenamesGamePlayerAdapter` relies on.
+    Game rules are enforced by `ClassicGameState`, pass `base_url` to `CodenamesGameRunner` to play against it.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, seed: int | None = None):
+        self.host = host
+        self.seed = seed
+        self.rooms: dict[str, Room] = {}
+        self._server = ThreadingHTTPServer((host, port), _LocalAppHandler)
+        self._server.daemon_threads = True
+        self._server.app = self  # type: ignore
+        self._thread: Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        port = self._server.server_address[1]
+        return f"http://{self.host}:{port}/"
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, __exc_type, __exc_value, __traceback):
+        self.stop()
+
+    def start(self) -> Self:
+        self._thread = Thread(target=self._server.serve_forever, name="local-codenames-app", daemon=True)
+        self._thread.start()
+        log.info(f"Local codenames app serving on {self.base_url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def create_room(self) -> Room:
+        room_id = uuid.uuid4().hex[:8]
+        seed = None if self.seed is None else self.seed + len(self.rooms)
+        room = self.rooms[room_id] = Room(room_id=room_id, seed=seed)
+        return room
+
+    def get_room(self, room_id: str) -> Room:
+        room = self.rooms.get(room_id)
+        if room is None:
+            msg = f"Room {room_id} not found"
+            raise LocalAppError(msg, status=HTTPStatus.NOT_FOUND)
+        return room
+
+
+class _LocalAppHandler(BaseHTTPRequestHandler):
+    server: ThreadingHTTPServer
+
+    @property
+    def app(self) -> LocalCodenamesApp:
+        return self.server.app  # type: ignore
+
+    def log_message(self, format: str, *args: Any):  # noqa: A002  # pylint: disable=redefined-builtin
+        log.debug(format, *args)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        try:
+            self._handle_get(path=self.path)
+        except LocalAppError as e:
+            self._send_json(e.status, {"error": str(e)})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        try:
+            self._handle_post(path=self.path)
+        except LocalAppError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Malformed request: {e}"})
+
+    def _handle_get(self, path: str):
+        url = urlparse(path)
+        parts = url.path.strip("/").split("/")
+        if url.path == "/" or parts[0] == "room":
+            self._send(HTTPStatus.OK, PAGE_PATH.read_bytes(), content_type="text/html; charset=utf-8")
+            return
+        if parts == ["create"]:
+            room = self.app.create_room()
+            self.send_response(HTTPStatus.FOUND)
+            self.send_header("Location", f"/room/{room.room_id}")
+            self.end_headers()
+            return
+        if len(parts) != 3 or parts[:2] != ["api", "rooms"]:
+            raise LocalAppError("Not found", status=HTTPStatus.NOT_FOUND)
+        query = parse_qs(url.query)
+        room = self.app.get_room(parts[2])
+        room.wait_for_change(since=int(query.get("since", ["-1"])[0]), timeout_sec=MAX_POLL_SEC)
+        self._send_json(HTTPStatus.OK, room.view(player_id=query.get("player", [""])[0]))
+
+    def _handle_post(self, path: str):
+        parts = urlparse(path).path.strip("/").split("/")
+        if len(parts) != 4 or parts[:2] != ["api", "rooms"]:
+            raise LocalAppError("Not found", status=HTTPStatus.NOT_FOUND)
+        room = self.app.get_room(parts[2])
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "{}")
+        player_id = self._handle_action(room, action=parts[3], body=body)
+        self._send_json(HTTPStatus.OK, {"player": player_id, "view": room.view(player_id=player_id)})
+
+    def _handle_action(self, room: Room, action: str, body: dict[str, Any]) -> str:
+        player_id = body.get("player") or ""
+        if action == "join":
+            return room.join(name=body["name"])
+        if action == "role":
+            room.choose_role(player_id, team=body["team"], role=body["role"])
+        elif action == "language":
+            room.set_language(player_id, code=body["code"])
+        elif action == "start":
+            room.start(player_id)
+        elif action == "clue":
+            room.give_clue(player_id, word=body["word"], amount=body["amount"])
+        elif action == "guess":
+            room.guess(player_id, index=int(body["index"]))
+        else:
+            msg = f"Unknown action: {action}"
+            raise LocalAppError(msg, status=HTTPStatus.NOT_FOUND)
+        return player_id
+
+    def _send_json(self, status: HTTPStatus, data: dict[str, Any]):
+        self._send(status, json.dumps(data).encode("utf-8"), content_type="application/json")
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Callable
+
+from codenames.generic.move import PASS_GUESS, Clue, Guess
+from codenames.online.codenames_game.card_parser import CARD_LABEL_FUNCTION
+from codenames.online.utils import PollingTimeout
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+log = logging.getLogger(__name__)
+
+# Installs a MutationObserver that turns page changes into a queue of events, idempotent per page load.
+# Every event carries the number of clues seen so far, so events can be matched to game turns.
+INSTALL_SCRIPT = CARD_LABEL_FUNCTION + """
+const [clueXPath, cardsXPath] = arguments;
+if (window.__codenamesObserver) {
+    return false;
+}
+const observer = {events: [], waiter: null, clues: 0, word: "", revealed: new Set()};
+const textAt = (xpath) => {
+    const result = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+    return result.singleNodeValue ? result.singleNodeValue.textContent.trim() : "";
+};
+const push = (event) => {
+    observer.events.push({...event, clue: observer.clues});
+    if (observer.waiter) {
+        const waiter = observer.waiter;
+        observer.waiter = null;
+        waiter();
+    }
+};
+const check = () => {
+    const word = textAt(clueXPath);
+    const cards = textAt(cardsXPath);
+    if (word && word !== observer.word && cards) {
+        observer.clues += 1;
+        observer.word = word;
+        push({type: "clue", word: word, cards: cards});
+    } else if (!word && observer.word) {
+        observer.word = "";
+        push({type: "turn_end"});
+    }
+    document.querySelectorAll("div[role='img']").forEach((container) => {
+        const index = parseInt(container.getAttribute("tabindex"));
+        if (!observer.revealed.has(index) && cardLabel(container).includes("revealed")) {
+            observer.revealed.add(index);
+            push({type: "reveal", index: index});
+        }
+    });
+};
+new MutationObserver(check).observe(document.body, {
+    subtree: true, childList: true, characterData: true, attributes: true,
+});
+window.__codenamesObserver = observer;
+check();
+return true;
+"""
+
+# Resolves with the queued events as soon as there are any, or with no events after the given wait.
+# Resolves with null when the observer is gone, for example after a page reload.
+DRAIN_SCRIPT = """
+const [waitMs, done] = arguments;
+const observer = window.__codenamesObserver;
+if (!observer) {
+    done(null);
+    return;
+}
+const drain = () => done(observer.events.splice(0));
+if (observer.events.length) {
+    drain();
+    return;
+}
+const timer = setTimeout(() => {
+    observer.waiter = null;
+    drain();
+}, waitMs);
+observer.waiter = () => {
+    clearTimeout(timer);
+    drain();
+};
+"""
+
+
+class PageEventType(StrEnum):
+    CLUE = "clue"
+    TURN_END = "turn_end"
+    REVEAL = "reveal"
+
+
+@dataclass(frozen=True)
+class PageEvent:
+    type: PageEventType
+    clue_number: int
+    word: str | None = None
+    cards: str | None = None
+    index: int | None = None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> PageEvent:
+        return cls(
+            type=PageEventType(payload["type"]),
+            clue_number=payload["clue"],
+            word=payload.get("word"),
+            cards=payload.get("cards"),
+            index=payload.get("index"),
+        )
+
+
+class PageObserver:
+    """
+    Receives clue and reveal events pushed by the page, instead of polling and re-parsing it.
+    Must be installed before the first clue is given, since clues are matched to turns by their order.
+    """
+
+    def __init__(self, driver: WebDriver, clue_text_xpath: str, cards_text_xpath: str, long_poll_sec: float = 10):
+        self.driver = driver
+        self.clue_text_xpath = clue_text_xpath
+        self.cards_text_xpath = cards_text_xpath
+        self.long_poll_sec = long_poll_sec
+        self.events: list[PageEvent] = []
+        self.installed = False
+
+    def install(self) -> bool:
+        self.driver.set_script_timeout(self.long_poll_sec + 5)
+        installed = self.driver.execute_script(INSTALL_SCRIPT, self.clue_text_xpath, self.cards_text_xpath)
+        self.installed = True
+        return bool(installed)
+
+    def wait_for_clue(self, clue_number: int, timeout_sec: float) -> Clue:
+        # `clue_number` counts the clues given in the game so far, starting at 1.
+        def find_clue() -> Clue | None:
+            for event in self.events:
+                if event.type == PageEventType.CLUE and event.clue_number == clue_number:
+                    return Clue(word=event.word, card_amount=int(event.cards[0]))  # type: ignore
+            return None
+
+        return self.wait_for(find_clue, timeout_sec=timeout_sec)
+
+    def wait_for_guess(self, revealed_card_indexes: set[int], clue_number: int, timeout_sec: float) -> Guess:
+        # A new reveal is a guess, the end of the current clue's turn without one is a pass.
+        def find_guess() -> Guess | None:
+            for event in self.events:
+                if event.type == PageEventType.REVEAL and event.index not in revealed_card_indexes:
+                    return Guess(card_index=event.index)  # type: ignore
+                if event.type == PageEventType.TURN_END and event.clue_number == clue_number:
+                    return Guess(card_index=PASS_GUESS)
+                if event.type == PageEventType.CLUE and event.clue_number > clue_number:
+                    return Guess(card_index=PASS_GUESS)
+            return None
+
+        return self.wait_for(find_guess, timeout_sec=timeout_sec)
+
+    def wait_for[T](self, find: Callable[[], T | None], timeout_sec: float) -> T:
+        if not self.installed:
+            self.install()
+        start = time.time()
+        while (result := find()) is None:
+            passed = time.time() - start
+            if passed >= timeout_sec:
+                raise PollingTimeout(timeout_sec=timeout_sec, started=start, passed=passed)
+            self._drain(wait_sec=min(self.long_poll_sec, timeout_sec - passed))
+        return result
+
+    def _drain(self, wait_sec: float):
+        payload = self.driver.execute_async_script(DRAIN_SCRIPT, int(wait_sec * 1000))
+        if payload is None:
+            log.warning("Page observer is gone, reinstalling it (events in between are lost)")
+            self.install()
+            return
+        new_events = [PageEvent.from_payload(event_payload) for event_payload in payload]
+        log.debug(f"Received {len(new_events)} page events")
+        self.events.extend(new_events)
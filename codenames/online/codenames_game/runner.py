@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from threading import Semaphore, Thread
+import time
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from threading import Thread
 from typing import ContextManager, Iterable
 
 from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
@@ -9,14 +11,27 @@ from codenames.classic.team import ClassicTeam
 from codenames.generic.move import Clue, Guess
 from codenames.generic.player import Operative, Player, PlayerRole, Spymaster
 from codenames.online.codenames_game.adapter import (
+    WEBAPP_URL,
     CodenamesGamePlayerAdapter,
     GameConfigs,
     IllegalOperation,
 )
 from codenames.online.codenames_game.agent import Agent, OperativeAgent, SpymasterAgent
+from codenames.online.codenames_game.driver_pool import DriverPool
+from codenames.online.codenames_game.screenshot import SCREENSHOT_WRITER
 
 log = logging.getLogger(__name__)
 
+DEFAULT_START_TIMEOUT_SEC = 180
+# How long a failed start waits for setup threads, once their browsers were closed under them.
+SETUP_ABORT_TIMEOUT_SEC = 10
+
+
+class GameStartTimeout(Exception):
+    def __init__(self, timeout_sec: float):
+        self.timeout_sec = timeout_sec
+        super().__init__(f"Players did not join within {timeout_sec} seconds")
+
 
 def player_or_agent[T: Player](player: T | None, role: PlayerRole, team: ClassicTeam) -> T:
     if player is not None:
@@ -26,7 +41,7 @@ def player_or_agent[T: Player](player: T | None, role: PlayerRole, team: Classic
     return player_class(name=name, team=team)  # type: ignore
 
 
-class CodenamesGameRunner(ContextManager):
+class CodenamesGameRunner(ContextManager):  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         blue_spymaster: Spymaster | None = None,
@@ -35,6 +50,9 @@ class CodenamesGameRunner(ContextManager):
         red_operative: Operative | None = None,
         show_host: bool = True,
         game_configs: GameConfigs | None = None,
+        *,
+        driver_pool: DriverPool | None = None,
+        base_url: str = WEBAPP_URL,
     ):
         self._host: CodenamesGamePlayerAdapter | None = None
         self.guests: list[CodenamesGamePlayerAdapter] = []
@@ -46,7 +64,8 @@ class CodenamesGameRunner(ContextManager):
         self._show_host = show_host
         self.game_configs = game_configs or GameConfigs()
         self._running_game_url: str | None = None
-        self._auto_start_semaphore = Semaphore()
+        self._driver_pool = driver_pool
+        self._base_url = base_url
 
     @property
     def host_connected(self) -> bool:
@@ -60,7 +79,8 @@ class CodenamesGameRunner(ContextManager):
 
     @property
     def adapters(self) -> Iterable[CodenamesGamePlayerAdapter]:
-        yield self.host  # type: ignore
+        if self.host_connected:
+            yield self.host
         yield from self.guests
 
     @property
@@ -70,28 +90,45 @@ class CodenamesGameRunner(ContextManager):
     def __exit__(self, __exc_type, __exc_value, __traceback):
         self.close()
 
-    def auto_start(self) -> ClassicGameRunner:
-        number_of_guests = 3
-        self._auto_start_semaphore = Semaphore(value=number_of_guests)
-        for player in self.players:
-            if not self.host_connected and isinstance(player, Spymaster):
-                self.host_game(host_player=player, game_configs=self.game_configs)
-            else:
-                self._auto_start_semaphore.acquire()  # pylint: disable=consider-using-with
-                log.debug("Semaphore acquired.")
-                self.add_to_game(guest_player=player, multithreaded=True)
-        if not self._running_game_url:
-            raise ValueError("Game not running after auto start.")
-        for i in range(number_of_guests):
-            self._auto_start_semaphore.acquire()  # pylint: disable=consider-using-with
-            log.debug(f"Thread {i} done.")
-        log.info(f"All {number_of_guests} joined, starting.")
+    def auto_start(self, timeout_sec: float = DEFAULT_START_TIMEOUT_SEC) -> ClassicGameRunner:
+        self.connect_players(timeout_sec=timeout_sec)
         return self.run_game()
 
-    def all_players_screenshots(self, tag: str):
+    def connect_players(self, timeout_sec: float = DEFAULT_START_TIMEOUT_SEC) -> CodenamesGameRunner:
+        """
+        Hosts the game and joins all guests concurrently: guest browsers start and load the site while the host
+        creates the room, and join as soon as its URL is known.
+        Raises the first setup error, or `GameStartTimeout` if not all players joined within `timeout_sec`.
+        On failure, the browsers opened so far are closed, which also stops setup threads stuck in browser calls.
+        """
+        if self.host_connected:
+            raise IllegalOperation("A game is already running.")
+        host_player = next(player for player in self.players if isinstance(player, Spymaster))
+        guest_players = [
+            player for player in self.players if player is not host_player and not isinstance(player, Agent)
+        ]
+        deadline = time.monotonic() + timeout_sec
+        executor = ThreadPoolExecutor(max_workers=1 + len(guest_players), thread_name_prefix="online-start")
+        futures: list[Future] = []
+        try:
+            host_future = executor.submit(self.host_game, host_player, self.game_configs)
+            futures.append(host_future)
+            futures.extend(
+                executor.submit(self._join_guest, guest_player, host_future, deadline) for guest_player in guest_players
+            )
+            _await_setup(futures, timeout_sec=timeout_sec)
+        except BaseException:
+            self._abort_setup(futures)
+            raise
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        log.info(f"All {len(guest_players)} guests joined")
+        return self
+
+    def all_players_screenshots(self, tag: str, rate_limited: bool = True):
         for adapter in self.adapters:
             try:
-                adapter.screenshot(tag=tag)
+                adapter.screenshot(tag=tag, rate_limited=rate_limited)
             except Exception as e:  # pylint: disable=broad-except
                 log.exception(f"Error taking screenshot: {e}")
 
@@ -104,9 +141,9 @@ class CodenamesGameRunner(ContextManager):
         try:
             game_runner.run_game()
         except Exception:  # pylint: disable=broad-except
-            self.all_players_screenshots(tag="game error")
+            self.all_players_screenshots(tag="game error", rate_limited=False)
             raise
-        self.host.screenshot("game over")
+        self.host.screenshot("game over", rate_limited=False)
         return game_runner
 
     def host_game(
@@ -121,7 +158,12 @@ class CodenamesGameRunner(ContextManager):
         if not isinstance(host_player, Spymaster):
             raise IllegalOperation("Host player must be a Spymaster.")
         game_configs = game_configs or GameConfigs()
-        self._host = CodenamesGamePlayerAdapter(player=host_player, headless=not self._show_host)
+        self._host = CodenamesGamePlayerAdapter(
+            player=host_player,
+            headless=not self._show_host,
+            driver_pool=self._driver_pool,
+            base_url=self._base_url,
+        )
         self.host.open().host_game()
         self.host.configure_language(language=game_configs.language)
         self.host.choose_role()
@@ -137,21 +179,58 @@ class CodenamesGameRunner(ContextManager):
             return self
         if isinstance(guest_player, Agent):
             log.debug("Not adding agent guest to online game.")
-            self._auto_start_semaphore.release()
             return self
         if multithreaded:
             thread = Thread(target=self.add_to_game, args=[guest_player, False], daemon=True)
             thread.start()
             return self
-        guest = CodenamesGamePlayerAdapter(player=guest_player, game_url=self._running_game_url)
+        guest = CodenamesGamePlayerAdapter(
+            player=guest_player,
+            game_url=self._running_game_url,
+            driver_pool=self._driver_pool,
+        )
         guest.open().login().choose_role()
         self.guests.append(guest)
-        self._auto_start_semaphore.release()
-        log.debug("Semaphore release")
         return self
 
+    def _join_guest(
+        self,
+        guest_player: Player,
+        host_ready: Future,
+        deadline: float,
+    ) -> CodenamesGamePlayerAdapter:
+        guest = CodenamesGamePlayerAdapter(
+            player=guest_player,
+            driver_pool=self._driver_pool,
+            base_url=self._base_url,
+        )
+        # Registered right away, so closing the runner also closes guests that failed to join.
+        self.guests.append(guest)
+        guest.open()
+        host_ready.result(timeout=max(0.0, deadline - time.monotonic()))
+        guest.game_url = self._running_game_url
+        guest.open().login().choose_role()
+        log.debug(f"Guest {guest_player} joined")
+        return guest
+
+    def _abort_setup(self, futures: list[Future]):
+        for future in futures:
+            future.cancel()
+        # Setup threads may still be inside browser calls, so their sessions are discarded rather than reused.
+        adapters = list(self.adapters)
+        for adapter in adapters:
+            adapter.close(discard=True)
+        self.guests = [guest for guest in self.guests if guest not in adapters]
+        self._host = None
+        self._running_game_url = None
+        _, stuck = wait(futures, timeout=SETUP_ABORT_TIMEOUT_SEC)
+        if stuck:
+            log.warning(f"{len(stuck)} setup threads are still running after closing their browsers")
+
     def close(self):
         log.info("Closing online manager...")
+        # Queued screenshots hold captured bytes only, this waits for them to reach the disk before exit.
+        SCREENSHOT_WRITER.flush()
         for guest in self.guests:
             guest.close()
         if self.host_connected:
@@ -189,3 +268,18 @@ class CodenamesGameRunner(ContextManager):
             return
         adapter = self._get_adapter_for_player(player=operative)
         adapter.transmit_guess(guess=guess)
+
+
+def _await_setup(futures: list[Future], timeout_sec: float):
+    done, pending = wait(futures, timeout=timeout_sec, return_when=FIRST_EXCEPTION)
+    timed_out = bool(pending)
+    # The host goes first, guests fail too when it does.
+    for future in futures:
+        error = future.exception() if future in done else None
+        if isinstance(error, TimeoutError):
+            # A guest gave up waiting for the host at the deadline.
+            timed_out = True
+        elif error is not None:
+            raise error
+    if timed_out:
+        raise GameStartTimeout(timeout_sec=timeout_sec)
@@ -1,7 +1,13 @@
+import base64
 import logging
 import os
 import time
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Full, Queue
+from threading import Lock, Thread
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from codenames.online.codenames_game.adapter import CodenamesGamePlayerAdapter
@@ -11,25 +17,191 @@ log = logging.getLogger(__name__)
 
 BAD_PATH_CHARS = {"\\", "/", ":", "*", "?", '"', "<", ">", "|", "\r", "\n"}
 RUN_ID = 0
-SCREENSHOT_COUNT = 0
 
 
-def save_screenshot(adapter: "CodenamesGamePlayerAdapter", tag: str, raise_on_error: bool = False) -> str | None:
+@dataclass(frozen=True)
+class ScreenshotSettings:
+    # Captures of the same adapter closer than this are skipped.
+    min_interval_sec: float = 2.0
+    # "png" keeps the lossless driver capture, "jpeg" compresses with `quality`.
+    image_format: str = "png"
+    quality: int = 70
+    # Applied by the browser, below 1 downscales the capture.
+    scale: float = 1
+    max_run_bytes: int = 50 * 1024 * 1024
+    max_pending: int = 32
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.image_format == "jpeg" else "png"
+
+    @property
+    def is_default_capture(self) -> bool:
+        return self.image_format == "png" and self.scale == 1
+
+
+@dataclass(frozen=True)
+class _ScreenshotJob:
+    path: str
+    image: bytes
+    log_prefix: str
+
+
+class ScreenshotWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Captures screenshots on the calling thread and writes them on a background thread, so callers skip the disk wait.
+    The capture can't be deferred, the driver isn't thread safe and the page would change in the meantime.
+    Each adapter is rate limited, and a run stops capturing once its captures reach `max_run_bytes`.
+    Captures count against that budget when they are queued, so pending writes can't overshoot it.
+    """
+
+    def __init__(self, settings: ScreenshotSettings | None = None):
+        self.settings = settings or ScreenshotSettings()
+        self.run_bytes = 0
+        self.pending_bytes = 0  # Captured but not written yet.
+        self._count = 0
+        self._last_capture: WeakKeyDictionary = WeakKeyDictionary()
+        self._queue: Queue[_ScreenshotJob] = Queue(maxsize=self.settings.max_pending)
+        self._lock = Lock()
+        self._thread: Thread | None = None
+
+    def submit(self, adapter: "CodenamesGamePlayerAdapter", tag: str, rate_limited: bool = True) -> str | None:
+        path = self._reserve_path(adapter, tag=tag, rate_limited=rate_limited)
+        if path is None:
+            return None
+        job = self._capture_job(adapter, path=path)
+        if not self._reserve_bytes(job):
+            log.debug(f"{adapter.log_prefix} Screenshot would exceed the budget, skipping '{tag}'")
+            return None
+        try:
+            self._queue.put_nowait(job)
+        except Full:
+            self._release_bytes(job)
+            log.warning(f"{adapter.log_prefix} Screenshot queue is full, dropping '{tag}'")
+            return None
+        self._ensure_started()
+        return path
+
+    def save(self, adapter: "CodenamesGamePlayerAdapter", tag: str) -> str:
+        # Synchronous and not rate limited, for callers that need the file to exist.
+        path = self._reserve_path(adapter, tag=tag, rate_limited=False)
+        job = self._capture_job(adapter, path=path) if path is not None else None
+        if job is None or not self._reserve_bytes(job):
+            msg = f"Screenshot disk budget of {self.settings.max_run_bytes} bytes is used up"
+            raise RuntimeError(msg)
+        self._write(job)
+        return job.path
+
+    def flush(self):
+        self._queue.join()
+
+    def reset_run(self):
+        with self._lock:
+            self.run_bytes = 0
+
+    def _reserve_path(self, adapter: "CodenamesGamePlayerAdapter", tag: str, rate_limited: bool) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            if self.run_bytes + self.pending_bytes >= self.settings.max_run_bytes:
+                log.debug(f"{adapter.log_prefix} Screenshot budget used up, skipping '{tag}'")
+                return None
+            last_capture = self._last_capture.get(adapter)
+            if rate_limited and last_capture is not None and now - last_capture < self.settings.min_interval_sec:
+                log.debug(f"{adapter.log_prefix} Screenshot rate limited, skipping '{tag}'")
+                return None
+            self._last_capture[adapter] = now
+            self._count += 1
+            count = self._count
+        file_name = sanitize_for_path(f"{count:03d} {adapter.player} - {tag}.{self.settings.extension}")
+        return os.path.abspath(os.path.join(_run_dir(), file_name))
+
+    def _reserve_bytes(self, job: _ScreenshotJob) -> bool:
+        with self._lock:
+            if self.run_bytes + self.pending_bytes + len(job.image) > self.settings.max_run_bytes:
+                return False
+            self.pending_bytes += len(job.image)
+            return True
+
+    def _release_bytes(self, job: _ScreenshotJob):
+        with self._lock:
+            self.pending_bytes -= len(job.image)
+
+    def _capture_job(self, adapter: "CodenamesGamePlayerAdapter", path: str) -> _ScreenshotJob:
+        image = _capture(adapter, settings=self.settings)
+        return _ScreenshotJob(path=path, image=image, log_prefix=adapter.log_prefix)
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = Thread(target=self._run, name="screenshot-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                self._write(job)
+            except Exception as e:  # pylint: disable=broad-except
+                log.warning(f"Failed to save screenshot: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, job: _ScreenshotJob):
+        try:
+            Path(job.path).write_bytes(job.image)
+        finally:
+            self._release_bytes(job)
+        with self._lock:
+            self.run_bytes += len(job.image)
+        log.info(f"{job.log_prefix} Screenshot saved to {job.path}")
+
+
+SCREENSHOT_WRITER = ScreenshotWriter()
+
+
+def save_screenshot(
+    adapter: "CodenamesGamePlayerAdapter",
+    tag: str,
+    raise_on_error: bool = False,
+    rate_limited: bool = True,
+) -> str | None:
+    """
+    Captures a screenshot, queues it for writing and returns its path, or None if it was skipped.
+    Error and end of game captures should pass `rate_limited=False`, so they aren't skipped after a recent capture.
+    With `raise_on_error`, the screenshot is written before returning and failures are raised.
+    """
     try:
-        global SCREENSHOT_COUNT  # pylint: disable=global-statement
-        SCREENSHOT_COUNT += 1
-        run_dir = _run_dir()
-        file_name = sanitize_for_path(f"{SCREENSHOT_COUNT:03d} {adapter.player} - {tag}.png")
-        path = os.path.join(run_dir, file_name)
-        path_abs = os.path.abspath(path)
-        adapter.driver.save_screenshot(path_abs)
+        if raise_on_error:
+            return SCREENSHOT_WRITER.save(adapter, tag=tag)
+        return SCREENSHOT_WRITER.submit(adapter, tag=tag, rate_limited=rate_limited)
     except Exception as e:  # pylint: disable=broad-except
         if raise_on_error:
             raise
         log.warning(f"Failed to save screenshot: {e}")
         return None
-    log.info(f"{adapter.log_prefix} Screenshot saved to {path_abs}")
-    return path_abs
+
+
+def _capture(adapter: "CodenamesGamePlayerAdapter", settings: ScreenshotSettings) -> bytes:
+    driver = adapter.driver
+    if settings.is_default_capture or not hasattr(driver, "execute_cdp_cmd"):
+        return driver.get_screenshot_as_png()
+    # Chrome encodes and scales the capture itself, no imaging library needed.
+    viewport = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})["cssLayoutViewport"]
+    params: dict = {
+        "format": settings.image_format,
+        "clip": {
+            "x": 0,
+            "y": 0,
+            "width": viewport["clientWidth"],
+            "height": viewport["clientHeight"],
+            "scale": settings.scale,
+        },
+    }
+    if settings.image_format == "jpeg":
+        params["quality"] = settings.quality
+    result = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+    return base64.b64decode(result["data"])
 
 
 def sanitize_for_path(string: str) -> str:
@@ -48,6 +220,7 @@ def _run_dir():
 def reset_screenshot_run():
     global RUN_ID  # pylint: disable=global-statement
     RUN_ID = 10**10 - int(time.time())
+    SCREENSHOT_WRITER.reset_run()
     log.info(f"Run reset, new ID: {RUN_ID}")
     return RUN_ID
 
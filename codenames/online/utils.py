@@ -7,6 +7,9 @@ from selenium.webdriver.remote.webelement import WebElement
 
 log = logging.getLogger(__name__)
 CLEAR = "\b\b\b\b\b"
+# Polling starts at this interval and backs off up to the requested interval,
+# so conditions that are met quickly are noticed quickly.
+MIN_POLL_INTERVAL_SEC = 0.05
 
 
 class PollingTimeout(Exception):
@@ -17,23 +20,35 @@ class PollingTimeout(Exception):
         super().__init__(f"Polling timeout after {passed:.2f} seconds (timeout was {timeout_sec})")
 
 
-def fill_input(element: WebElement, value: str):
+def fill_input(element: WebElement, value: str, timeout_sec: float = 1):
     element.send_keys(CLEAR)
     element.send_keys(CLEAR)
-    sleep(0.1)
+    try_poll_condition(lambda: not element.get_attribute("value"), timeout_sec=timeout_sec)
     element.send_keys(value)
-    sleep(0.1)
+    try_poll_condition(lambda: element.get_attribute("value") == value, timeout_sec=timeout_sec)
 
 
-def multi_click(element: WebElement, times: int = 3, warn: bool = False):
+def multi_click(
+    element: WebElement,
+    times: int = 3,
+    warn: bool = False,
+    until: Callable[[], bool] | None = None,
+    interval_sec: float = 0.1,
+) -> bool:
+    # Clicks until `until` holds, waiting up to `interval_sec` for it after each click.
+    # Returns whether the condition was met (always True when no condition is given).
     for _ in range(times):
         try:
             element.click()
             log.debug("Element clicked")
-            sleep(0.1)
         except Exception:  # pylint: disable=broad-except
             if warn:
                 log.debug("Failed to click, trying again...")
+        if until is None:
+            sleep(interval_sec)
+        elif try_poll_condition(until, timeout_sec=interval_sec, poll_interval_sec=interval_sec):
+            return True
+    return until is None
 
 
 def poll_elements[
@@ -49,16 +64,26 @@ def poll_elements[
         return None
 
     start = time.time()
+    interval_sec = min(MIN_POLL_INTERVAL_SEC, poll_interval_sec)
     while not (element := safe_getter()):
         log.debug("No element found, sleeping...")
         now = time.time()
         passed = now - start
         if passed >= timeout_sec:
             raise PollingTimeout(timeout_sec=timeout_sec, started=start, passed=passed)
-        sleep(poll_interval_sec)
+        sleep(min(interval_sec, timeout_sec - passed))
+        interval_sec = min(interval_sec * 2, poll_interval_sec)
     log.debug("Element found")
     return element
 
 
 def poll_condition(test: Callable[[], bool], timeout_sec: float = 5, poll_interval_sec: float = 0.2):
     poll_elements(element_getters=[test], timeout_sec=timeout_sec, poll_interval_sec=poll_interval_sec)
+
+
+def try_poll_condition(test: Callable[[], bool], timeout_sec: float = 5, poll_interval_sec: float = 0.2) -> bool:
+    try:
+        poll_condition(test, timeout_sec=timeout_sec, poll_interval_sec=poll_interval_sec)
+        return True
+    except PollingTimeout:
+        return False
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator, Self
+
+from codenames.generic.board import IndexedVocabulary
+from codenames.utils.recording import GameRecording, GameReplayer, ReplayState
+
+# The data file holds length-prefixed game recordings, the index file holds the offset of each of them.
+# Both are append-only, so game IDs (positions in the index) never change.
+DATA_MAGIC = b"CNA1"
+RECORD_LENGTH = struct.Struct("<I")
+OFFSET = struct.Struct("<Q")
+INDEX_SUFFIX = ".idx"
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+class GameArchiveWriter:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.index_path = index_path_for(self.path)
+        is_new = not self.path.exists() or self.path.stat().st_size == 0
+        self._data: BinaryIO = self.path.open("ab")  # pylint: disable=consider-using-with
+        self._index: BinaryIO = self.index_path.open("ab")  # pylint: disable=consider-using-with
+        if is_new:
+            self._data.write(DATA_MAGIC)
+        self._offset = self._data.tell()
+        self._game_count = self._index.tell() // OFFSET.size
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, recording: GameRecording | bytes) -> int:
+        data = recording if isinstance(recording, bytes) else recording.to_bytes()
+        self._data.write(RECORD_LENGTH.pack(len(data)))
+        self._data.write(data)
+        self._index.write(OFFSET.pack(self._offset))
+        self._offset += RECORD_LENGTH.size + len(data)
+        game_id = self._game_count
+        self._game_count += 1
+        return game_id
+
+    def flush(self):
+        # Data is flushed first, so the index never points past the end of the data file.
+        self._data.flush()
+        self._index.flush()
+
+    def close(self):
+        self.flush()
+        self._data.close()
+        self._index.close()
+
+
+class GameArchive:
+    """
+    Read-only, memory-mapped view of an archive. Games are decoded only when accessed.
+    """
+
+    def __init__(self, path: str | Path, vocabulary: IndexedVocabulary | None = None):
+        self.path = Path(path)
+        self.vocabulary = vocabulary
+        self._data = _map_file(self.path)
+        self._index = _map_file(index_path_for(self.path))
+        if self._data[: len(DATA_MAGIC)] != DATA_MAGIC:
+            msg = f"Not a game archive: {self.path}"
+            raise ArchiveError(msg)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index) // OFFSET.size
+
+    def __getitem__(self, game_id: int) -> GameRecording:
+        return GameRecording.from_bytes(self.get_bytes(game_id))
+
+    def __iter__(self) -> Iterator[GameRecording]:
+        for game_id in range(len(self)):
+            yield self[game_id]
+
+    def get_bytes(self, game_id: int) -> memoryview:
+        if game_id < 0 or game_id >= len(self):
+            msg = f"Game ID out of bounds: {game_id}"
+            raise IndexError(msg)
+        (offset,) = OFFSET.unpack_from(self._index, game_id * OFFSET.size)
+        (length,) = RECORD_LENGTH.unpack_from(self._data, offset)
+        start = offset + RECORD_LENGTH.size
+        return memoryview(self._data)[start : start + length]
+
+    def replayer(self, game_id: int) -> GameReplayer:
+        return GameReplayer(recording=self[game_id], vocabulary=self.vocabulary)
+
+    def iter_replayers(self) -> Iterator[GameReplayer]:
+        for game_id in range(len(self)):
+            yield self.replayer(game_id)
+
+    def iter_final_states(self) -> Iterator[ReplayState]:
+        for replayer in self.iter_replayers():
+            yield replayer.final_state()
+
+    def close(self):
+        for mapped in (self._data, self._index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+
+def _map_file(path: Path) -> mmap.mmap | bytes:
+    if not path.exists():
+        msg = f"Archive file not found: {path}"
+        raise ArchiveError(msg)
+    with path.open("rb") as file:
+        # Empty files can't be mapped.
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 import random
-from typing import Collection, NamedTuple
+from typing import TYPE_CHECKING, Collection, NamedTuple, Sequence
+
+if TYPE_CHECKING:
+    from numpy.random import Generator
+
+# Either a standard library RNG or a NumPy generator.
+type RandomSource = random.Random | Generator
 
 
 class ExtractResult[T](NamedTuple):
@@ -11,6 +17,33 @@ class ExtractResult[T](NamedTuple):
 
 def extract_random_subset[T](elements: Collection[T], subset_size: int) -> ExtractResult[T]:
     elements = tuple(elements)
-    sample = tuple(random.sample(elements, k=subset_size))
-    remaining = tuple(e for e in elements if e not in sample)
+    sample_indexes = random.sample(range(len(elements)), k=subset_size)
+    sampled = set(sample_indexes)
+    sample = tuple(elements[i] for i in sample_indexes)
+    remaining = tuple(e for i, e in enumerate(elements) if i not in sampled)
     return ExtractResult(remaining=remaining, sample=sample)
+
+
+def get_rng(seed: int | None = None, rng: RandomSource | None = None) -> random.Random:
+    if seed is not None and rng is not None:
+        raise ValueError("At most one of seed or rng can be provided.")
+    if rng is None:
+        # Without a seed, derive from the global RNG so that `random.seed()` still makes boards reproducible.
+        seed = seed if seed is not None else random.getrandbits(64)
+        return random.Random(seed)
+    if isinstance(rng, random.Random):
+        return rng
+    # A NumPy generator, draw a single seed from it.
+    return random.Random(int(rng.integers(2**63)))
+
+
+def assign_colors[C](
+    words: Sequence[str],
+    color_amounts: Sequence[tuple[C, int]],
+    rng: random.Random,
+) -> list[tuple[str, C]]:
+    # Words are drawn with a single sample of vocabulary indexes, instead of extracting a subset per color.
+    colors = [color for color, amount in color_amounts for _ in range(amount)]
+    rng.shuffle(colors)
+    word_indexes = rng.sample(range(len(words)), k=len(colors))
+    return [(words[i], color) for i, color in zip(word_indexes, colors, strict=True)]
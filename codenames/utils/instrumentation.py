@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import time
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Iterable, Self
+
+# Histogram bucket i counts durations in [2^(i-1), 2^i) microseconds, the last bucket is open-ended.
+BUCKET_COUNT = 32
+
+
+class Metric(StrEnum):
+    GIVE_CLUE = "give_clue"
+    GUESS = "guess"
+    PROCESS_CLUE = "process_clue"
+    PROCESS_GUESS = "process_guess"
+    SPYMASTER_VIEW = "spymaster_view"
+    OPERATIVE_VIEW = "operative_view"
+    CLUE_SUBSCRIBERS = "clue_subscribers"
+    GUESS_SUBSCRIBERS = "guess_subscribers"
+    PLAYER_NOTIFICATIONS = "player_notifications"
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    total_sec: float = 0.0
+    max_sec: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * BUCKET_COUNT)
+
+    @property
+    def mean_sec(self) -> float:
+        return self.total_sec / self.count if self.count else 0.0
+
+    def add(self, duration_sec: float):
+        self.count += 1
+        self.total_sec += duration_sec
+        self.max_sec = max(self.max_sec, duration_sec)
+        bucket = int(duration_sec * 1_000_000).bit_length()
+        self.buckets[min(bucket, BUCKET_COUNT - 1)] += 1
+
+    def merge(self, other: TimingStats):
+        self.count += other.count
+        self.total_sec += other.total_sec
+        self.max_sec = max(self.max_sec, other.max_sec)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets, strict=True)]
+
+    def quantile_sec(self, q: float) -> float:
+        # Upper bound of the bucket holding the q-quantile, capped by the observed maximum.
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bucket, amount in enumerate(self.buckets):
+            seen += amount
+            if seen >= target:
+                return min(2**bucket / 1_000_000, self.max_sec)
+        return self.max_sec
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_sec": self.total_sec,
+            "mean_sec": self.mean_sec,
+            "max_sec": self.max_sec,
+            "p50_sec": self.quantile_sec(0.5),
+            "p99_sec": self.quantile_sec(0.99),
+            "buckets": list(self.buckets),
+        }
+
+
+class Instrumentation:
+    """
+    Collects wall time per metric. Use one instance per game, and `merged` to aggregate a run.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.stats: dict[str, TimingStats] = {}
+
+    def __getitem__(self, metric: str) -> TimingStats:
+        return self.stats.get(metric) or TimingStats()
+
+    def measure(self, metric: str) -> AbstractContextManager:
+        return _Measurement(self, metric)
+
+    def record(self, metric: str, duration_sec: float):
+        stats = self.stats.get(metric)
+        if stats is None:
+            stats = self.stats[metric] = TimingStats()
+        stats.add(duration_sec)
+
+    def merge(self, other: Instrumentation) -> Self:
+        for metric, other_stats in other.stats.items():
+            stats = self.stats.get(metric)
+            if stats is None:
+                stats = self.stats[metric] = TimingStats()
+            stats.merge(other_stats)
+        return self
+
+    @classmethod
+    def merged(cls, instrumentations: Iterable[Instrumentation]) -> Instrumentation:
+        result = cls()
+        for instrumentation in instrumentations:
+            result.merge(instrumentation)
+        return result
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {metric: stats.to_dict() for metric, stats in sorted(self.stats.items())}
+
+
+class NoInstrumentation(Instrumentation):
+    # Default for runners, measuring costs a single no-op context manager.
+    enabled = False
+
+    def measure(self, metric: str) -> AbstractContextManager:
+        return _NO_MEASUREMENT
+
+    def record(self, metric: str, duration_sec: float):
+        pass
+
+
+class _Measurement:
+    __slots__ = ("_instrumentation", "_metric", "_start")
+
+    def __init__(self, instrumentation: Instrumentation, metric: str):
+        self._instrumentation = instrumentation
+        self._metric = metric
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *args):
+        self._instrumentation.record(self._metric, time.perf_counter() - self._start)
+
+
+_NO_MEASUREMENT = nullcontext()
+NO_INSTRUMENTATION = NoInstrumentation()
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Iterator, Sequence
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.color import ClassicColor
+from codenames.classic.runner import ClassicGameRunner
+from codenames.classic.state import ClassicGameState
+from codenames.duet.board import DuetBoard
+from codenames.duet.card import DuetColor
+from codenames.duet.runner import DuetGameRunner
+from codenames.duet.state import DuetGameState
+from codenames.generic.board import Board, IndexedVocabulary
+from codenames.generic.card import CardColor
+from codenames.generic.move import Clue, Guess
+from codenames.generic.player import Operative, Player, Spymaster
+from codenames.mini.runner import MiniGameRunner
+from codenames.mini.state import MiniGameState
+from codenames.utils.game_type import GameType
+from codenames.utils.vocabulary.languages import get_vocabulary
+
+GameRunner = ClassicGameRunner | DuetGameRunner | MiniGameRunner
+ReplayState = ClassicGameState | DuetGameState | MiniGameState
+
+# Layout: header, language, word IDs, colors per board, events, clue words.
+MAGIC = b"CNR"
+VERSION = 1
+HEADER = struct.Struct(
+    "<3sBBBHbbIH",
+)  # magic, version, game type, board count, board size, timer, mistakes, events, clues
+EVENT = struct.Struct("<BhH")  # kind, card amount or card index (0 for timeouts), clue word index
+LENGTH = struct.Struct("<H")
+
+GAME_TYPES = list(GameType)
+COLORS: dict[GameType, list[CardColor]] = {
+    GameType.CLASSIC: list(ClassicColor),
+    GameType.DUET: list(DuetColor),
+    GameType.MINI: list(DuetColor),
+}
+
+
+class RecordingError(ValueError):
+    pass
+
+
+class EventKind(IntEnum):
+    CLUE = 0
+    GUESS = 1
+    TIME_OUT = 2  # The current player timed out, and its team forfeits.
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedEvent:
+    kind: EventKind
+    value: int  # Card amount for clues, card index for guesses.
+    word: str | None = None  # Clue word, for clues only.
+
+    @property
+    def move(self) -> Clue | Guess | None:
+        # None for timeouts, which are not player moves.
+        if self.kind == EventKind.TIME_OUT:
+            return None
+        if self.kind == EventKind.CLUE:
+            return Clue(word=self.word, card_amount=self.value)  # type: ignore[arg-type]
+        return Guess(card_index=self.value)
+
+
+@dataclass
+class GameRecording:
+    game_type: GameType
+    language: str
+    word_ids: tuple[int, ...]
+    colors: tuple[tuple[CardColor, ...], ...]  # One row per board, Duet games have two boards.
+    timer_tokens: int = 0
+    allowed_mistakes: int = 0
+    events: list[RecordedEvent] = field(default_factory=list)
+
+    @property
+    def board_size(self) -> int:
+        return len(self.word_ids)
+
+    def to_bytes(self) -> bytes:
+        clue_words: list[str] = []
+        events = []
+        for event in self.events:
+            word_index = 0
+            if event.kind == EventKind.CLUE:
+                word_index = len(clue_words)
+                clue_words.append(event.word or "")
+            events.append(EVENT.pack(event.kind, event.value, word_index))
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            GAME_TYPES.index(self.game_type),
+            len(self.colors),
+            self.board_size,
+            self.timer_tokens,
+            self.allowed_mistakes,
+            len(self.events),
+            len(clue_words),
+        )
+        color_codes = COLORS[self.game_type]
+        colors = bytes(color_codes.index(color) for row in self.colors for color in row)
+        parts = [header, _pack_string(self.language), struct.pack(f"<{self.board_size}H", *self.word_ids), colors]
+        parts.extend(events)
+        parts.extend(_pack_string(word) for word in clue_words)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> GameRecording:
+        data = memoryview(data)
+        magic, version, game_type_code, board_count, board_size, timer_tokens, allowed_mistakes, event_count, _ = (
+            HEADER.unpack_from(data)
+        )
+        if magic != MAGIC or version != VERSION:
+            msg = f"Not a game recording (magic {magic!r}, version {version})"
+            raise RecordingError(msg)
+        game_type = GAME_TYPES[game_type_code]
+        offset = HEADER.size
+        language, offset = _unpack_string(data, offset)
+        word_ids = struct.unpack_from(f"<{board_size}H", data, offset)
+        offset += 2 * board_size
+        color_codes = COLORS[game_type]
+        colors = []
+        for _ in range(board_count):
+            colors.append(tuple(color_codes[code] for code in data[offset : offset + board_size]))
+            offset += board_size
+        raw_events = list(EVENT.iter_unpack(data[offset : offset + EVENT.size * event_count]))
+        offset += EVENT.size * event_count
+        clue_words = []
+        clue_count = sum(kind == EventKind.CLUE for kind, _, _ in raw_events)
+        for _ in range(clue_count):
+            word, offset = _unpack_string(data, offset)
+            clue_words.append(word)
+        events = [
+            RecordedEvent(kind=EventKind(kind), value=value, word=clue_words[i] if kind == EventKind.CLUE else None)
+            for kind, value, i in raw_events
+        ]
+        return cls(
+            game_type=game_type,
+            language=language,
+            word_ids=word_ids,
+            colors=tuple(colors),
+            timer_tokens=timer_tokens,
+            allowed_mistakes=allowed_mistakes,
+            events=events,
+        )
+
+
+class GameRecorder:
+    """
+    Records a game by subscribing to the clue, guess and timeout events of its runner.
+    Must be attached before the game starts, since the initial boards are taken from the runner state.
+    """
+
+    def __init__(self, runner: GameRunner, vocabulary: IndexedVocabulary | None = None):
+        state = runner.state
+        boards: Sequence[Board]
+        if isinstance(state, ClassicGameState):
+            game_type, boards = GameType.CLASSIC, [state.board]
+        elif isinstance(state, DuetGameState):
+            game_type, boards = GameType.DUET, [state.side_a.board, state.side_b.board]
+        else:
+            game_type, boards = GameType.MINI, [state.board]
+        if not all(board.is_clean for board in boards):
+            raise RecordingError("Recorder must be attached before the game starts.")
+        language = boards[0].language
+        vocabulary = vocabulary or get_vocabulary(language)
+        self.recording = GameRecording(
+            game_type=game_type,
+            language=language,
+            word_ids=boards[0].word_ids(vocabulary),
+            colors=tuple(tuple(card.color for card in board.cards) for board in boards),  # type: ignore[misc]
+            timer_tokens=getattr(state, "timer_tokens", 0),
+            allowed_mistakes=getattr(state, "allowed_mistakes", 0),
+        )
+        runner.clue_given_subscribers.append(self._on_clue_given)
+        runner.guess_given_subscribers.append(self._on_guess_given)
+        runner.timed_out_subscribers.append(self._on_timed_out)
+
+    def to_bytes(self) -> bytes:
+        return self.recording.to_bytes()
+
+    def _on_clue_given(self, spymaster: Spymaster, clue: Clue):  # pylint: disable=unused-argument
+        self.recording.events.append(RecordedEvent(kind=EventKind.CLUE, value=clue.card_amount, word=clue.word))
+
+    def _on_guess_given(self, operative: Operative, guess: Guess):  # pylint: disable=unused-argument
+        self.recording.events.append(RecordedEvent(kind=EventKind.GUESS, value=guess.card_index))
+
+    def _on_timed_out(self, player: Player):  # pylint: disable=unused-argument
+        self.recording.events.append(RecordedEvent(kind=EventKind.TIME_OUT, value=0))
+
+
+class GameReplayer:
+    def __init__(self, recording: GameRecording, vocabulary: IndexedVocabulary | None = None):
+        self.recording = recording
+        self.vocabulary = vocabulary or get_vocabulary(recording.language)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview, vocabulary: IndexedVocabulary | None = None) -> GameReplayer:
+        return cls(recording=GameRecording.from_bytes(data), vocabulary=vocabulary)
+
+    @property
+    def event_count(self) -> int:
+        return len(self.recording.events)
+
+    def initial_state(self) -> ReplayState:
+        recording = self.recording
+        if recording.game_type == GameType.CLASSIC:
+            return ClassicGameState.from_board(board=self._build_board(ClassicBoard, index=0))
+        state: DuetGameState | MiniGameState
+        if recording.game_type == GameType.DUET:
+            board_a, board_b = self._build_board(DuetBoard, index=0), self._build_board(DuetBoard, index=1)
+            state = DuetGameState.from_boards(board_a=board_a, board_b=board_b)
+        else:
+            state = MiniGameState.from_board(board=self._build_board(DuetBoard, index=0))
+        state.timer_tokens = recording.timer_tokens
+        state.allowed_mistakes = recording.allowed_mistakes
+        return state
+
+    def state_at(self, event_count: int) -> ReplayState:
+        # The state after the first `event_count` events were applied.
+        state = self.initial_state()
+        for event in self.recording.events[:event_count]:
+            apply_event(state, event)
+        return state
+
+    def final_state(self) -> ReplayState:
+        return self.state_at(self.event_count)
+
+    def states(self) -> Iterator[ReplayState]:
+        # Yields the same state object, updated in place after each event.
+        state = self.initial_state()
+        yield state
+        for event in self.recording.events:
+            apply_event(state, event)
+            yield state
+
+    def _build_board[B: Board](self, board_class: type[B], index: int) -> B:
+        colors = self.recording.colors[index]
+        return board_class.from_word_ids(vocabulary=self.vocabulary, word_ids=self.recording.word_ids, colors=colors)
+
+
+def apply_event(state: ReplayState, event: RecordedEvent):
+    move = event.move
+    if move is None:
+        state.time_out()
+    elif isinstance(move, Clue):
+        state.process_clue(clue=move)
+    else:
+        state.process_guess(guess=move)
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_string(data: memoryview, offset: int) -> tuple[str, int]:
+    (length,) = LENGTH.unpack_from(data, offset)
+    start = offset + LENGTH.size
+    return bytes(data[start : start + length]).decode("utf-8"), start + length
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Mapping, Sequence
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers
+from codenames.classic.simulation import ClassicGameSimulator, quiet_logging
+from codenames.classic.team import ClassicTeam
+from codenames.duet.board import DuetBoard
+from codenames.duet.player import CompositeDuetPlayer
+from codenames.duet.runner import DuetGamePlayers, DuetGameRunner
+from codenames.duet.state import DuetGameState
+from codenames.duet.team import DuetTeam
+from codenames.generic.player import Operative, Spymaster
+from codenames.generic.runner import MovePolicy, TeamPlayers
+from codenames.generic.team import Team
+from codenames.mini.runner import MiniGameRunner
+from codenames.mini.state import MiniGameState
+from codenames.utils.game_type import GameType
+from codenames.utils.instrumentation import Instrumentation
+from codenames.utils.vocabulary.languages import get_vocabulary
+
+log = logging.getLogger(__name__)
+
+# Factories are called with (name, team), so player classes can be used directly.
+# They are sent to worker processes, so they must be picklable (no lambdas or local functions).
+SpymasterFactory = Callable[[str, Team], Spymaster]
+OperativeFactory = Callable[[str, Team], Operative]
+
+
+@dataclass(frozen=True, slots=True)
+class Pairing:
+    spymaster: str
+    operative: str
+
+    def __str__(self) -> str:
+        return f"{self.spymaster} + {self.operative}"
+
+
+# Classic matches are (blue, red) pairings, Duet and Mini matches hold a single pairing.
+Match = tuple[Pairing, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class GameOutcome:
+    seed: int
+    match: Match
+    winner: Pairing | None  # None when a cooperative game is lost.
+    reason: str
+    profile: Instrumentation | None = field(default=None, compare=False)  # Set when the tournament is instrumented.
+
+
+@dataclass
+class PairingStats:
+    games: int = 0
+    wins: int = 0
+    reasons: Counter[str] = field(default_factory=Counter)  # Why the pairing's games were won.
+    loss_reasons: Counter[str] = field(default_factory=Counter)  # Why they were lost, cooperative losses included.
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+
+@dataclass(frozen=True)
+class TournamentResult:
+    outcomes: list[GameOutcome]
+    duration_sec: float
+
+    @property
+    def games_per_second(self) -> float:
+        if self.duration_sec <= 0:
+            return 0.0
+        return len(self.outcomes) / self.duration_sec
+
+    @property
+    def pairing_stats(self) -> dict[Pairing, PairingStats]:
+        stats: dict[Pairing, PairingStats] = {}
+        for outcome in self.outcomes:
+            # A self-play match holds the same pairing twice, but it is a single game for that pairing.
+            for pairing in dict.fromkeys(outcome.match):
+                pairing_stats = stats.setdefault(pairing, PairingStats())
+                pairing_stats.games += 1
+                if outcome.winner == pairing:
+                    pairing_stats.wins += 1
+                    pairing_stats.reasons[outcome.reason] += 1
+                else:
+                    pairing_stats.loss_reasons[outcome.reason] += 1
+        return stats
+
+    @property
+    def reason_counts(self) -> Counter[str]:
+        return Counter(outcome.reason for outcome in self.outcomes)
+
+    @property
+    def profile(self) -> Instrumentation:
+        # Timings aggregated over all games, empty unless the tournament is instrumented.
+        return Instrumentation.merged(outcome.profile for outcome in self.outcomes if outcome.profile)
+
+
+@dataclass(frozen=True)
+class WorkUnit:  # pylint: disable=too-many-instance-attributes
+    game_type: GameType
+    language: str
+    match: Match
+    seeds: tuple[int, ...]
+    spymasters: Mapping[str, SpymasterFactory]
+    operatives: Mapping[str, OperativeFactory]
+    move_policy: MovePolicy | None = None
+    instrument: bool = False
+
+    def build_team(self, pairing: Pairing, team: Team, name_suffix: str = "") -> TeamPlayers:
+        spymaster = self.spymasters[pairing.spymaster](f"{pairing.spymaster}{name_suffix}", team)
+        operative = self.operatives[pairing.operative](f"{pairing.operative}{name_suffix}", team)
+        return TeamPlayers(spymaster=spymaster, operative=operative)
+
+    def new_profile(self) -> Instrumentation | None:
+        return Instrumentation() if self.instrument else None
+
+
+class Tournament:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        game_type: GameType,
+        spymasters: Mapping[str, SpymasterFactory],
+        operatives: Mapping[str, OperativeFactory],
+        seeds: Sequence[int],
+        *,
+        language: str = "english",
+        include_self_play: bool = False,
+        chunk_size: int = 25,
+        max_workers: int | None = None,
+        move_policy: MovePolicy | None = None,
+        instrument: bool = False,
+    ):
+        self.game_type = game_type
+        self.spymasters = dict(spymasters)
+        self.operatives = dict(operatives)
+        self.seeds = tuple(seeds)
+        self.language = language
+        self.include_self_play = include_self_play
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers  # 0 plays all games in the current process.
+        self.move_policy = move_policy
+        self.instrument = instrument
+
+    @property
+    def pairings(self) -> list[Pairing]:
+        return [Pairing(spymaster=s, operative=o) for s, o in itertools.product(self.spymasters, self.operatives)]
+
+    @property
+    def matches(self) -> list[Match]:
+        if self.game_type != GameType.CLASSIC:
+            return [(pairing,) for pairing in self.pairings]
+        blue_red = itertools.product(self.pairings, repeat=2)
+        return [(blue, red) for blue, red in blue_red if self.include_self_play or blue != red]
+
+    def work_units(self) -> list[WorkUnit]:
+        units = []
+        for match in self.matches:
+            for i in range(0, len(self.seeds), self.chunk_size):
+                unit = WorkUnit(
+                    game_type=self.game_type,
+                    language=self.language,
+                    match=match,
+                    seeds=self.seeds[i : i + self.chunk_size],
+                    spymasters={pairing.spymaster: self.spymasters[pairing.spymaster] for pairing in match},
+                    operatives={pairing.operative: self.operatives[pairing.operative] for pairing in match},
+                    move_policy=self.move_policy,
+                    instrument=self.instrument,
+                )
+                units.append(unit)
+        return units
+
+    def run(self) -> TournamentResult:
+        units = self.work_units()
+        log.info(f"Running {len(units)} work units of up to {self.chunk_size} {self.game_type} games each")
+        start = time.perf_counter()
+        if self.max_workers == 0:
+            outcomes = _flatten(play_work_unit(unit) for unit in units)
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                outcomes = _flatten(executor.map(play_work_unit, units))
+        duration = time.perf_counter() - start
+        result = TournamentResult(outcomes=outcomes, duration_sec=duration)
+        log.info(f"Played {len(outcomes)} games in {duration:.2f} seconds ({result.games_per_second:.1f} games/sec)")
+        return result
+
+
+def play_work_unit(unit: WorkUnit) -> list[GameOutcome]:
+    with quiet_logging():
+        if unit.game_type == GameType.CLASSIC:
+            return _play_classic_games(unit)
+        if unit.game_type == GameType.DUET:
+            return _play_duet_games(unit)
+        return _play_mini_games(unit)
+
+
+def _play_classic_games(unit: WorkUnit) -> list[GameOutcome]:
+    vocabulary = get_vocabulary(language=unit.language)
+    blue, red = unit.match
+
+    def build_players() -> ClassicGamePlayers:
+        blue_team = unit.build_team(blue, team=ClassicTeam.BLUE)
+        red_team = unit.build_team(red, team=ClassicTeam.RED)
+        return ClassicGamePlayers(blue_team=blue_team, red_team=red_team)
+
+    simulator = ClassicGameSimulator(players_factory=build_players, move_policy=unit.move_policy)
+    outcomes = []
+    for seed in unit.seeds:
+        # Seeding the global RNG as well makes randomized players reproducible.
+        random.seed(seed)
+        board = ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=seed)
+        profile = unit.new_profile()
+        record = simulator.run_game(board=board, instrumentation=profile)
+        winner = blue if record.winner == ClassicTeam.BLUE else red
+        reason = record.reason.value
+        outcomes.append(GameOutcome(seed=seed, match=unit.match, winner=winner, reason=reason, profile=profile))
+    return outcomes
+
+
+def _play_duet_games(unit: WorkUnit) -> list[GameOutcome]:
+    vocabulary = get_vocabulary(language=unit.language)
+    (pairing,) = unit.match
+    outcomes = []
+    for seed in unit.seeds:
+        random.seed(seed)
+        board = DuetBoard.from_vocabulary(vocabulary=vocabulary, seed=seed)
+        team_a = unit.build_team(pairing, team=DuetTeam.MAIN, name_suffix=" A")
+        team_b = unit.build_team(pairing, team=DuetTeam.MAIN, name_suffix=" B")
+        players = DuetGamePlayers(
+            player_a=CompositeDuetPlayer(spymaster=team_a.spymaster, operative=team_a.operative),
+            player_b=CompositeDuetPlayer(spymaster=team_b.spymaster, operative=team_b.operative),
+        )
+        state, profile = DuetGameState.from_board(board=board), unit.new_profile()
+        runner = DuetGameRunner(players=players, state=state, move_policy=unit.move_policy, instrumentation=profile)
+        result = runner.run_game()
+        winner = pairing if result.win else None
+        outcomes.append(GameOutcome(seed=seed, match=unit.match, winner=winner, reason=result.reason, profile=profile))
+    return outcomes
+
+
+def _play_mini_games(unit: WorkUnit) -> list[GameOutcome]:
+    vocabulary = get_vocabulary(language=unit.language)
+    (pairing,) = unit.match
+    outcomes = []
+    for seed in unit.seeds:
+        random.seed(seed)
+        board = DuetBoard.from_vocabulary(vocabulary=vocabulary, seed=seed)
+        players = unit.build_team(pairing, team=DuetTeam.MAIN)
+        state, profile = MiniGameState.from_board(board=board), unit.new_profile()
+        runner = MiniGameRunner(players=players, state=state, move_policy=unit.move_policy, instrumentation=profile)
+        result = runner.run_game()
+        winner = pairing if result.win else None
+        outcomes.append(GameOutcome(seed=seed, match=unit.match, winner=winner, reason=result.reason, profile=profile))
+    return outcomes
+
+
+def _flatten(outcome_lists: Iterable[list[GameOutcome]]) -> list[GameOutcome]:
+    return [outcome for outcomes in outcome_lists for outcome in outcomes]
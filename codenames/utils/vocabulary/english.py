@@ -1,4 +1,4 @@
-ENGLISH_WORDS = list(
+ENGLISH_WORDS = sorted(
     {
         "able",
         "abortion",
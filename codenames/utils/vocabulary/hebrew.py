@@ -1,4 +1,4 @@
-HEBREW_WORDS = list(
+HEBREW_WORDS = sorted(
     {
         "אביב",
         "אגרטל",
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import importlib
+import threading
 from enum import StrEnum
+from pathlib import Path
+from typing import Callable, Iterable
 
-from codenames.generic.board import Vocabulary
-from codenames.utils.vocabulary.english import ENGLISH_WORDS
-from codenames.utils.vocabulary.hebrew import HEBREW_WORDS
+from codenames.generic.board import IndexedVocabulary
+
+WordsLoader = Callable[[], Iterable[str]]
 
 
 class SupportedLanguage(StrEnum):
@@ -12,11 +16,73 @@ class SupportedLanguage(StrEnum):
     HEBREW = "hebrew"
 
 
-def get_vocabulary(language: str) -> Vocabulary:
-    language = language.lower()
-    if language == SupportedLanguage.ENGLISH:
-        return Vocabulary(language=language, words=ENGLISH_WORDS)
-    if language == SupportedLanguage.HEBREW:
-        return Vocabulary(language=language, words=HEBREW_WORDS)
-    msg = f"Unknown language: {language}"
-    raise NotImplementedError(msg)
+class VocabularyRegistry:
+    """
+    Maps languages to word loaders. Each loader runs once, on the first request for its language.
+    """
+
+    def __init__(self):
+        self._loaders: dict[str, WordsLoader] = {}
+        self._vocabularies: dict[str, IndexedVocabulary] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def languages(self) -> tuple[str, ...]:
+        return tuple(self._loaders)
+
+    def register(self, language: str, loader: WordsLoader):
+        language = language.lower()
+        with self._lock:
+            self._loaders[language] = loader
+            self._vocabularies.pop(language, None)
+
+    def register_words_file(self, language: str, path: str | Path, encoding: str = "utf-8"):
+        self.register(language, loader=lambda: read_words_file(path, encoding=encoding))
+
+    def get(self, language: str) -> IndexedVocabulary:
+        language = language.lower()
+        vocabulary = self._vocabularies.get(language)
+        if vocabulary is not None:
+            return vocabulary
+        with self._lock:
+            if language in self._vocabularies:
+                return self._vocabularies[language]
+            loader = self._loaders.get(language)
+            if loader is None:
+                msg = f"Unknown language: {language}"
+                raise NotImplementedError(msg)
+            vocabulary = IndexedVocabulary(language=language, words=tuple(loader()))
+            self._vocabularies[language] = vocabulary
+            return vocabulary
+
+
+def read_words_file(path: str | Path, encoding: str = "utf-8") -> list[str]:
+    # One word per line, blank lines and lines starting with '#' are skipped.
+    lines = Path(path).read_text(encoding=encoding).splitlines()
+    words = (line.strip() for line in lines)
+    return [word for word in words if word and not word.startswith("#")]
+
+
+def _builtin_loader(module_name: str, attribute: str) -> WordsLoader:
+    def load() -> Iterable[str]:
+        module = importlib.import_module(f"codenames.utils.vocabulary.{module_name}")
+        return getattr(module, attribute)
+
+    return load
+
+
+VOCABULARY_REGISTRY = VocabularyRegistry()
+VOCABULARY_REGISTRY.register(SupportedLanguage.ENGLISH, loader=_builtin_loader("english", "ENGLISH_WORDS"))
+VOCABULARY_REGISTRY.register(SupportedLanguage.HEBREW, loader=_builtin_loader("hebrew", "HEBREW_WORDS"))
+
+
+def get_vocabulary(language: str) -> IndexedVocabulary:
+    return VOCABULARY_REGISTRY.get(language)
+
+
+def register_language(language: str, loader: WordsLoader):
+    VOCABULARY_REGISTRY.register(language, loader=loader)
+
+
+def register_words_file(language: str, path: str | Path, encoding: str = "utf-8"):
+    VOCABULARY_REGISTRY.register_words_file(language, path=path, encoding=encoding)
@@ -1,9 +1,12 @@
 import logging
+import random
 
 import pytest
 
 from codenames.classic.board import ClassicBoard
+from codenames.classic.color import ClassicColor
 from codenames.classic.team import ClassicTeam
+from codenames.classic.types import ClassicCard
 from codenames.generic.board import two_integer_factors
 from codenames.generic.exceptions import CardNotFoundError
 from codenames.utils.vocabulary.languages import SupportedLanguage, get_vocabulary
@@ -99,6 +102,33 @@ def test_build_board_with_params():
     assert len(board.assassin_cards) == 2
 
 
+def test_board_seed_zero_is_reproducible():
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    board_1 = ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=0)
+    board_2 = ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=0)
+    assert board_1 == board_2
+
+
+def test_board_from_rng_matches_seed():
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    seeded = ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=7)
+    from_rng = ClassicBoard.from_vocabulary(vocabulary=vocabulary, rng=random.Random(7))
+    assert seeded == from_rng
+    with pytest.raises(ValueError):
+        ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=7, rng=random.Random(7))
+
+
+def test_many_boards_are_reproducible():
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    boards = ClassicBoard.many_from_vocabulary(vocabulary=vocabulary, amount=50, seed=3)
+    assert len(boards) == 50
+    for board in boards:
+        _validate_standard_board(board)
+        assert len(set(board.all_words)) == 25
+    assert len({board.all_words for board in boards}) == 50
+    assert ClassicBoard.many_from_vocabulary(vocabulary=vocabulary, amount=50, seed=3) == boards
+
+
 def _validate_standard_board(board: ClassicBoard):
     assert len(board.cards) == 25
     assert len(board.revealed_cards) == 0
@@ -106,3 +136,92 @@ def _validate_standard_board(board: ClassicBoard):
     assert len(board.blue_cards) >= 8
     assert len(board.neutral_cards) == 7
     assert len(board.assassin_cards) == 1
+
+
+def test_reveal_card_updates_board_queries(board_10: ClassicBoard):
+    assert board_10.is_clean
+    board_10.reveal_card(0)
+    board_10.reveal_card(4)
+
+    assert not board_10.is_clean
+    assert board_10.revealed_card_indexes == (0, 4)
+    assert board_10.revealed_cards == (board_10[0], board_10[4])
+    assert len(board_10.unrevealed_cards) == 8
+    assert board_10.revealed_cards_for_color(ClassicColor.BLUE) == (board_10[0],)
+    assert len(board_10.unrevealed_cards_for_color(ClassicColor.RED)) == 2
+
+    board_10.reset_state()
+    assert board_10.is_clean
+    assert board_10.revealed_cards == ()
+
+
+def test_set_card_color_updates_board_queries(board_10: ClassicBoard):
+    assert len(board_10.blue_cards) == 4
+    board_10.set_card_color(0, ClassicColor.RED)
+
+    assert board_10[0].color == ClassicColor.RED
+    assert len(board_10.blue_cards) == 3
+    assert len(board_10.red_cards) == 4
+    assert board_10.red_cards[0] is board_10[0]
+
+
+def test_censored_view_follows_board_changes(board_10: ClassicBoard):
+    censored_view = board_10.censored_view
+    assert censored_view[2].color is None
+    board_10.reveal_card(2)
+
+    assert censored_view[2] == board_10[2]
+    assert censored_view.revealed_card_indexes == (2,)
+
+    board_10.set_card_color(2, ClassicColor.RED)
+    assert censored_view[2].color == ClassicColor.RED
+    board_10.reset_state()
+    assert board_10.censored_view.is_clean
+    assert board_10.censored_view[2].color is None
+
+
+def test_copied_board_queries_follow_its_own_cards(board_10: ClassicBoard):
+    board_10.reveal_card(0)
+    assert board_10.revealed_card_indexes == (0,)
+    new_cards = [card.model_copy() for card in board_10.cards]
+    new_cards[0].revealed = False
+    new_cards[5].revealed = True
+
+    updated = board_10.model_copy(update={"cards": new_cards})
+    assert updated.revealed_card_indexes == (5,)
+    copied = board_10.model_copy(deep=True)
+    copied.reveal_card(1)
+    assert copied.revealed_card_indexes == (0, 1)
+    assert board_10.revealed_card_indexes == (0,)
+    shallow = board_10.model_copy()
+    shallow.replace_card(0, new_cards[0])
+    shallow.reveal_card(2)
+    assert shallow.revealed_card_indexes == (2,)
+    assert board_10.revealed_card_indexes == (0,)
+    assert not board_10[2].revealed
+
+
+def test_find_card_index_on_large_board():
+    cards = [ClassicCard(word=f"Word_{i}", color=ClassicColor.NEUTRAL) for i in range(100)]
+    board = ClassicBoard(language="english", cards=cards)
+    assert board.find_card_index("word 0") == 0
+    assert board.find_card_index(" WORD 99 ") == 99
+    with pytest.raises(CardNotFoundError):
+        board.find_card_index("word 100")
+
+
+def test_find_card_index_after_cards_replaced(board_10: ClassicBoard):
+    assert board_10.find_card_index("Card 9") == 9
+    board_10.cards = list(reversed(board_10.cards))
+    assert board_10.find_card_index("Card 9") == 0
+    assert board_10.blue_cards == tuple(reversed(constants.board_10().blue_cards))
+
+
+def test_find_card_index_after_replace_card(board_10: ClassicBoard):
+    assert board_10.find_card_index("Card 3") == 3
+    board_10.replace_card(3, ClassicCard(word="Card 3", color=ClassicColor.RED))
+    assert board_10.find_card_index("card 3") == 3
+    board_10.replace_card(3, ClassicCard(word="New Word", color=ClassicColor.RED))
+    assert board_10.find_card_index("new word") == 3
+    with pytest.raises(CardNotFoundError):
+        board_10.find_card_index("Card 3")
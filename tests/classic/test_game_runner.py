@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock
 
 from codenames.classic.board import ClassicBoard
@@ -8,6 +9,8 @@ from codenames.classic.team import ClassicTeam
 from codenames.classic.types import ClassicGivenClue, ClassicGivenGuess
 from codenames.classic.winner import Winner, WinningReason
 from codenames.generic.move import Clue
+from codenames.generic.player import PlayerRole
+from codenames.generic.runner import MovePolicy
 from tests.classic.utils.dictated import (
     ClassicDictatedOperative,
     ClassicDictatedSpymaster,
@@ -157,3 +160,59 @@ def test_game_runner_operative_state(board_10: ClassicBoard):
     ]
     assert game_state_5.current_clue == game_state_5.given_clues[1]
     assert len(game_state_5.turn_guesses) == 1
+
+
+def test_spymaster_timeout_forfeits_the_game(board_10: ClassicBoard):
+    players = build_players(all_turns=[DictatedTurn(clue=Clue(word="A", card_amount=2), guesses=[0])])
+    release = threading.Event()
+
+    def blocking_give_clue(game_state):  # pylint: disable=unused-argument
+        release.wait(timeout=5)
+        return Clue(word="A", card_amount=2)
+
+    players.blue_team.spymaster.give_clue = blocking_give_clue  # type: ignore
+    runner = ClassicGameRunner(players=players, board=board_10, move_policy=MovePolicy(clue_timeout_sec=0.01))
+    runner.run_game()
+    release.set()
+
+    assert runner.winner == Winner(team=ClassicTeam.RED, reason=WinningReason.OPPONENT_TIMED_OUT)
+    assert [timing.timed_out for timing in runner.move_timings] == [True]
+    assert runner.move_timings[0].role == PlayerRole.SPYMASTER
+
+
+def test_timed_moves_get_a_detached_state(board_10: ClassicBoard):
+    all_turns = [
+        DictatedTurn(clue=Clue(word="A", card_amount=2), guesses=[0, 1, 2]),
+        DictatedTurn(clue=Clue(word="B", card_amount=1), guesses=[9]),
+    ]
+    players = build_players(all_turns=all_turns)
+    operative = players.blue_team.operative
+    game_states: list = []
+    dictated_guess = operative.guess
+
+    def recording_guess(game_state):
+        game_states.append(game_state)
+        return dictated_guess(game_state=game_state)
+
+    operative.guess = recording_guess  # type: ignore
+    runner = ClassicGameRunner(players=players, board=board_10, move_policy=MovePolicy(guess_timeout_sec=5))
+    runner.run_game()
+
+    assert type(game_states[0]) is ClassicOperativeState
+    assert game_states[0].given_guesses == []
+    assert len(runner.state.given_guesses) == 4
+
+
+def test_invalid_guesses_are_capped_by_forced_pass(board_10: ClassicBoard):
+    all_turns = [
+        DictatedTurn(clue=Clue(word="A", card_amount=2), guesses=[100, 100, 100]),  # Out of range
+        DictatedTurn(clue=Clue(word="B", card_amount=1), guesses=[9]),  # Assassin
+    ]
+    players = build_players(all_turns=all_turns)
+    runner = ClassicGameRunner(players=players, board=board_10, move_policy=MovePolicy(max_invalid_guesses=3))
+    runner.run_game()
+
+    assert runner.winner == Winner(team=ClassicTeam.BLUE, reason=WinningReason.OPPONENT_HIT_ASSASSIN)
+    assert len(runner.state.given_guesses) == 1
+    roles = [timing.role for timing in runner.move_timings]
+    assert roles == [PlayerRole.SPYMASTER, *[PlayerRole.OPERATIVE] * 3, PlayerRole.SPYMASTER, PlayerRole.OPERATIVE]
@@ -1,14 +1,19 @@
+import copy
 import json
 
 import pytest
 
 from codenames.classic.board import ClassicBoard
 from codenames.classic.color import ClassicColor
-from codenames.classic.state import ClassicGameState, ClassicPlayerState
+from codenames.classic.state import (
+    ClassicGameState,
+    ClassicOperativeState,
+    ClassicPlayerState,
+)
 from codenames.classic.team import ClassicTeam
 from codenames.classic.types import ClassicCard, ClassicGivenClue, ClassicGivenGuess
 from codenames.classic.winner import Winner, WinningReason
-from codenames.generic.exceptions import InvalidGuess, InvalidTurn
+from codenames.generic.exceptions import InvalidClue, InvalidGuess, InvalidTurn
 from codenames.generic.move import PASS_GUESS, Clue, Guess
 from codenames.generic.player import PlayerRole
 from codenames.utils.vocabulary.languages import SupportedLanguage
@@ -151,6 +156,24 @@ def test_game_state_json_serialization_and_load(board_10: ClassicBoard):
     assert game_state_dict == game_state.model_dump()
 
 
+@pytest.mark.parametrize("trusted", [False, True])
+def test_game_state_normalized_serialization_and_load(board_10: ClassicBoard, trusted: bool):
+    game_state = ClassicGameState.from_board(board=board_10)
+    game_state.process_clue(Clue(word="A", card_amount=2))
+    game_state.process_guess(Guess(card_index=0))
+    game_state.process_guess(Guess(card_index=1))
+    game_state.process_guess(Guess(card_index=4))
+
+    game_state_json = json.dumps(game_state.model_dump_normalized())
+    game_state_from_json = ClassicGameState.model_validate_normalized(json.loads(game_state_json), trusted=trusted)
+    assert game_state_from_json == game_state
+    assert len(game_state_json) < len(game_state.model_dump_json()) / 2
+    # Guesses point back at the loaded board cards and clues
+    guess = game_state_from_json.given_guesses[1]
+    assert guess.guessed_card is game_state_from_json.board.cards[1]
+    assert guess.for_clue is game_state_from_json.given_clues[0]
+
+
 def _get_moves(state: ClassicPlayerState) -> list[Move]:
     return get_moves(
         given_clues=state.given_clues,
@@ -162,3 +185,101 @@ def _get_moves(state: ClassicPlayerState) -> list[Move]:
 def test_game_state_from_language():
     game_state = ClassicGameState.from_language(language=SupportedLanguage.ENGLISH)
     assert len(game_state.board.cards) == 25
+
+
+def test_illegal_clue_words_are_tracked_incrementally(board_10: ClassicBoard):
+    game_state = ClassicGameState.from_board(board=board_10)
+    assert game_state.is_illegal_clue_word("CARD_0")
+    assert not game_state.is_illegal_clue_word("Clue 1")
+
+    game_state.process_clue(Clue(word="Clue 1", card_amount=1))
+    assert game_state.is_illegal_clue_word("clue 1")
+    assert game_state.illegal_clue_word_set == frozenset(game_state.illegal_clue_words)
+    assert game_state.spymaster_state.is_illegal_clue_word("clue 1")
+
+    game_state.process_guess(Guess(card_index=PASS_GUESS))
+    with pytest.raises(InvalidClue):
+        game_state.process_clue(Clue(word="CLUE 1", card_amount=1))
+
+
+def test_illegal_clue_words_follow_assigned_fields(board_10: ClassicBoard):
+    game_state = ClassicGameState.from_board(board=board_10)
+    game_state.process_clue(Clue(word="Clue 1", card_amount=1))
+    assert game_state.is_illegal_clue_word("clue 1")
+
+    game_state.given_clues = []
+    assert not game_state.is_illegal_clue_word("clue 1")
+
+    game_state.board.replace_card(0, ClassicCard(word="New", color=ClassicColor.BLUE))
+    assert game_state.is_illegal_clue_word("new")
+    assert not game_state.is_illegal_clue_word("card 0")
+
+    game_state.board.cards = [ClassicCard(word="Other", color=ClassicColor.RED)]
+    assert game_state.is_illegal_clue_word("other")
+    assert not game_state.is_illegal_clue_word("new")
+
+
+def test_player_views_match_player_states(board_10: ClassicBoard):
+    game_state = ClassicGameState.from_board(board=board_10)
+    assert game_state.spymaster_view == game_state.spymaster_state
+
+    game_state.process_clue(Clue(word="Clue 1", card_amount=2))
+    game_state.process_guess(Guess(card_index=0))
+    operative_view = game_state.operative_view
+    assert isinstance(operative_view, ClassicOperativeState)
+    assert operative_view == game_state.operative_state
+    assert operative_view.board[0].color == ClassicColor.BLUE
+    assert operative_view.board[1].color is None
+    assert game_state.spymaster_view == game_state.spymaster_state
+
+
+def test_operative_view_follows_the_live_state(board_10: ClassicBoard):
+    game_state = ClassicGameState.from_board(board=board_10)
+    game_state.process_clue(Clue(word="Clue 1", card_amount=2))
+    operative_view = game_state.operative_view
+    censored_board = operative_view.board
+    assert operative_view.left_guesses == 3
+
+    game_state.process_guess(Guess(card_index=7))
+    assert censored_board[7].revealed
+    assert censored_board[7].color == ClassicColor.NEUTRAL
+    assert censored_board.revealed_card_indexes == (7,)
+    assert censored_board.cards_for_color(ClassicColor.NEUTRAL) == (board_10[7],)
+    assert operative_view.current_team == ClassicTeam.RED
+    assert operative_view.current_player_role == PlayerRole.SPYMASTER
+    assert operative_view.left_guesses == 0
+    assert len(operative_view.given_guesses) == 1
+
+
+def test_player_views_are_read_only(board_10: ClassicBoard):
+    game_state = ClassicGameState.from_board(board=board_10)
+    game_state.process_clue(Clue(word="Clue 1", card_amount=2))
+    spymaster_view = game_state.spymaster_view
+    operative_view = game_state.operative_view
+
+    with pytest.raises(AttributeError):
+        operative_view.left_guesses = 10
+    with pytest.raises(AttributeError):
+        spymaster_view.board.reveal_card(0)
+    with pytest.raises(AttributeError):
+        spymaster_view.board[0].revealed = True
+    with pytest.raises(AttributeError):
+        spymaster_view.score.add_point(ClassicTeam.BLUE)
+    with pytest.raises(AttributeError):
+        spymaster_view.given_clues[0].word = "Other"
+    with pytest.raises(AttributeError):
+        spymaster_view.given_clues.append(spymaster_view.given_clues[0])  # type: ignore[attr-defined]
+    assert not game_state.board[0].revealed
+    assert game_state.given_clues[0].word == "clue 1"
+    assert len(game_state.given_clues) == 1
+
+
+def test_deep_copied_view_is_detached(board_10: ClassicBoard):
+    game_state = ClassicGameState.from_board(board=board_10)
+    detached = copy.deepcopy(game_state.operative_view)
+    assert type(detached) is ClassicOperativeState
+    assert detached == game_state.operative_state
+
+    game_state.process_clue(Clue(word="Clue 1", card_amount=2))
+    assert detached.given_clues == []
+    assert detached.model_dump() != game_state.operative_view.model_dump()
@@ -0,0 +1,97 @@
+import random
+
+import numpy as np
+import pytest
+
+from codenames.classic import kernel
+from codenames.classic.board import ClassicBoard
+from codenames.classic.state import ClassicGameState
+from codenames.generic.exceptions import GameIsOver, InvalidGuess, InvalidTurn
+from codenames.generic.move import PASS_GUESS, QUIT_GAME, Clue, Guess
+from codenames.utils.vocabulary.languages import SupportedLanguage, get_vocabulary
+
+
+def make_boards(amount: int, seed: int) -> list[ClassicBoard]:
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    return ClassicBoard.many_from_vocabulary(vocabulary=vocabulary, amount=amount, seed=seed)
+
+
+def assert_batch_matches(batch, states: list[ClassicGameState], boards: list[ClassicBoard]):
+    expected = kernel.ClassicGameBatch.from_states(states)
+    for field in ("colors", "revealed", "score_revealed", "current_team", "operative_turn", "left_guesses", "winner"):
+        assert np.array_equal(getattr(batch, field), getattr(expected, field)), field
+    assert batch.winners == [state.winner for state in states]
+    for converted, state in zip(batch.to_states(boards), states, strict=True):
+        assert converted.board.cards == state.board.cards
+        assert converted.score == state.score
+        assert converted.current_team == state.current_team
+        assert converted.current_player_role == state.current_player_role
+        assert converted.left_guesses == state.left_guesses
+
+
+def random_moves(batch, rng: random.Random) -> list[int]:
+    moves = []
+    for awaiting_guess, hidden in zip(batch.awaiting_guess, batch.hidden_cards, strict=True):
+        choice = rng.random()
+        if choice < 0.01:
+            moves.append(QUIT_GAME)
+        elif not awaiting_guess:
+            moves.append(rng.randint(0, 3))
+        elif choice < 0.15:
+            moves.append(PASS_GUESS)
+        else:
+            moves.append(rng.choice(np.flatnonzero(hidden).tolist()))
+    return moves
+
+
+def test_random_playouts_match_game_state():
+    rng = random.Random(5)
+    boards = make_boards(amount=200, seed=5)
+    states = [ClassicGameState.from_board(board=board.model_copy(deep=True)) for board in boards]
+    batch = kernel.ClassicGameBatch.from_boards(boards)
+    assert_batch_matches(batch, states, boards)
+    for step in range(500):
+        if batch.is_game_over.all():
+            break
+        moves = random_moves(batch, rng)
+        awaiting_clue, awaiting_guess = batch.awaiting_clue, batch.awaiting_guess
+        batch.process_moves(np.array(moves))
+        for i in np.flatnonzero(awaiting_clue):
+            states[i].process_clue(Clue(word=f"clue {step}", card_amount=moves[i]))
+        for i in np.flatnonzero(awaiting_guess):
+            states[i].process_guess(Guess(card_index=moves[i]))
+        assert_batch_matches(batch, states, boards)
+    assert all(state.is_game_over for state in states)
+    assert {state.winner.reason for state in states} == set(kernel.REASONS[:3])  # type: ignore
+
+
+def test_from_board_matches_game_state():
+    boards = make_boards(amount=20, seed=1)
+    batch = kernel.ClassicGameBatch.from_boards(boards)
+    expected = kernel.ClassicGameBatch.from_states([ClassicGameState.from_board(board=board) for board in boards])
+    assert np.array_equal(batch.current_team, expected.current_team)
+    assert np.array_equal(batch.score_total, expected.score_total)
+
+
+def test_invalid_moves_are_rejected_without_changes():
+    boards = make_boards(amount=3, seed=2)
+    batch = kernel.ClassicGameBatch.from_boards(boards)
+    with pytest.raises(InvalidTurn):
+        batch.process_guesses(np.array([0, 0, 0]), active=np.ones(3, dtype=bool))
+    batch.process_clues(np.array([2, 2, 2]))
+    with pytest.raises(InvalidTurn):
+        batch.process_clues(np.array([2, 2, 2]), active=np.ones(3, dtype=bool))
+    with pytest.raises(InvalidGuess):
+        batch.process_moves(np.array([0, 25, 1]))
+    assert not batch.revealed.any()
+    batch.process_moves(np.array([QUIT_GAME, PASS_GUESS, PASS_GUESS]))
+    assert batch.is_game_over.tolist() == [True, False, False]
+    with pytest.raises(GameIsOver):
+        batch.process_clues(np.array([1, 1, 1]), active=np.ones(3, dtype=bool))
+
+
+def test_many_boards_from_numpy_generator():
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    boards_1 = ClassicBoard.many_from_vocabulary(vocabulary=vocabulary, amount=5, rng=np.random.default_rng(3))
+    boards_2 = ClassicBoard.many_from_vocabulary(vocabulary=vocabulary, amount=5, rng=np.random.default_rng(3))
+    assert boards_1 == boards_2
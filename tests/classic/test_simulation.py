@@ -0,0 +1,113 @@
+import random
+from typing import Callable
+
+import pytest
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
+from codenames.classic.simulation import ClassicGameSimulator, GameRecord
+from codenames.classic.state import ClassicGameState, ClassicSpymasterState
+from codenames.classic.team import ClassicTeam
+from codenames.classic.winner import WinningReason
+from codenames.generic.exceptions import InvalidClue
+from codenames.generic.move import PASS_GUESS, QUIT_GAME, Clue, Guess
+from codenames.generic.runner import MovePolicy, TeamPlayers
+from codenames.utils.instrumentation import Instrumentation, Metric
+from codenames.utils.vocabulary.languages import SupportedLanguage, get_vocabulary
+from tests.classic.utils import constants
+from tests.classic.utils.runner import build_players
+from tests.classic.utils.types import ClassicCheaterOperator, ClassicCheaterSpymaster
+from tests.utils.players.dictated import DictatedTurn
+from tests.utils.players.randoms import RandomOperative, RandomSpymaster
+
+DICTATED_TURNS = [
+    DictatedTurn(clue=Clue(word="A", card_amount=2), guesses=[0, 1, PASS_GUESS]),
+    DictatedTurn(clue=Clue(word="B", card_amount=2), guesses=[4, 7]),
+    DictatedTurn(clue=Clue(word="C", card_amount=2), guesses=[2, 3]),
+]
+
+
+class NumberedCheaterSpymaster(ClassicCheaterSpymaster):
+    def give_clue(self, game_state: ClassicSpymasterState) -> Clue:
+        super().give_clue(game_state)
+        # Random clue words may collide with board words, which fails the game
+        clue_word = f"{self.name} {len(game_state.given_clues)}"
+        return Clue(word=clue_word, card_amount=self.card_amount)
+
+
+def build_cheaters() -> ClassicGamePlayers:
+    blue_spymaster = NumberedCheaterSpymaster(name="Yoda", team=ClassicTeam.BLUE, card_amount=2)
+    red_spymaster = NumberedCheaterSpymaster(name="Einstein", team=ClassicTeam.RED, card_amount=3)
+    blue_operative = ClassicCheaterOperator(name="Anakin", team=ClassicTeam.BLUE, spymaster=blue_spymaster)
+    red_operative = ClassicCheaterOperator(name="Newton", team=ClassicTeam.RED, spymaster=red_spymaster)
+    return ClassicGamePlayers.from_collection(blue_spymaster, blue_operative, red_spymaster, red_operative)
+
+
+def test_simulation_records_game_results():
+    simulator = ClassicGameSimulator(players_factory=lambda: build_players(all_turns=DICTATED_TURNS))
+    result = simulator.run(boards=[constants.board_10(), constants.board_10()])
+
+    expected_record = GameRecord(
+        winner=ClassicTeam.BLUE,
+        reason=WinningReason.TARGET_SCORE_REACHED,
+        turn_count=3,
+        blue_revealed=4,
+        red_revealed=1,
+    )
+    assert result.records == [expected_record, expected_record]
+    assert result.wins(ClassicTeam.BLUE) == 2
+    assert result.games_per_second > 0
+
+
+def build_random_team(name: str, team: ClassicTeam) -> TeamPlayers:
+    return TeamPlayers(spymaster=RandomSpymaster(f"{name} Spymaster", team), operative=RandomOperative(name, team))
+
+
+def build_random_players() -> ClassicGamePlayers:
+    blue_team = build_random_team("Blue", ClassicTeam.BLUE)
+    red_team = build_random_team("Red", ClassicTeam.RED)
+    return ClassicGamePlayers(blue_team=blue_team, red_team=red_team)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("players_factory", [build_cheaters, build_random_players])
+def test_simulation_matches_game_runner(seed: int, players_factory: Callable[[], ClassicGamePlayers]):
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    board = ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=seed)
+    random.seed(seed)
+    runner = ClassicGameRunner(players=players_factory(), board=board.model_copy(deep=True))
+    runner.run_game()
+
+    random.seed(seed)
+    simulator = ClassicGameSimulator(players_factory=players_factory)
+    state = simulator.play_game(board=board)
+
+    assert state.model_dump() == runner.state.model_dump()
+    assert GameRecord.from_state(state) == GameRecord.from_state(runner.state)
+
+
+def test_simulation_uses_the_runner_for_move_policies():
+    simulator = ClassicGameSimulator(
+        players_factory=lambda: build_players(all_turns=DICTATED_TURNS),
+        move_policy=MovePolicy(clue_timeout_sec=5),
+    )
+    instrumentation = Instrumentation()
+    record = simulator.run_game(board=constants.board_10(), instrumentation=instrumentation)
+
+    assert record.turn_count == 3
+    assert instrumentation[Metric.GIVE_CLUE].count == 3
+
+
+def test_turn_count_skips_rejected_and_quit_clues():
+    state = ClassicGameState.from_board(board=constants.board_10())
+    with pytest.raises(InvalidClue):
+        state.process_clue(Clue(word="Card 0", card_amount=2))
+    state.process_clue(Clue(word="A", card_amount=2))
+    state.process_guess(Guess(card_index=PASS_GUESS))
+    state.process_clue(Clue(word="B", card_amount=QUIT_GAME))
+
+    record = GameRecord.from_state(state)
+
+    assert len(state.clues) == 3
+    assert record.turn_count == 1
+    assert record.reason == WinningReason.OPPONENT_QUIT
@@ -29,6 +29,15 @@ def test_dual_board_construction(seed: int):
     assert len(green_union) == 15
 
 
+def test_dual_board_with_local_rng_is_reproducible():
+    english_vocabulary = get_vocabulary(language="english")
+    board_a = DuetBoard.from_vocabulary(vocabulary=english_vocabulary, seed=0)
+    dual_1 = DuetBoard.dual_board(board=board_a, rng=random.Random(0))
+    dual_2 = DuetBoard.dual_board(board=board_a, seed=0)
+    assert dual_1 == dual_2
+    assert len(DuetBoard.many_from_vocabulary(vocabulary=english_vocabulary, amount=10, seed=0)) == 10
+
+
 def _get_green_indices(board: DuetBoard) -> set[int]:
     return _get_color_indices(board=board, color=DuetColor.GREEN)
 
@@ -1,3 +1,4 @@
+import threading
 from typing import Generator
 from unittest import mock
 
@@ -7,6 +8,7 @@ from codenames.duet.board import DuetBoard
 from codenames.duet.runner import DuetGameRunner
 from codenames.duet.score import (
     MISTAKE_LIMIT_REACHED,
+    MOVE_TIMED_OUT,
     TARGET_REACHED,
     TIMER_TOKENS_DEPLETED,
 )
@@ -19,6 +21,7 @@ from codenames.duet.state import (
 from codenames.duet.team import DuetTeam
 from codenames.duet.types import DuetGivenClue, DuetGivenGuess
 from codenames.generic.move import PASS_GUESS, Clue
+from codenames.generic.runner import MovePolicy
 from tests.duet.utils.runner import build_players, run_duet_game
 from tests.utils.hooks import hook_method
 from tests.utils.players.dictated import DictatedSpymaster, DictatedTurn
@@ -147,3 +150,21 @@ def test_sudden_death(board_10_state: DuetGameState):
     assert runner.state.game_result == TARGET_REACHED
     assert runner.state.timer_tokens == 0
     assert runner.state.is_sudden_death
+
+
+def test_operative_timeout_loses_the_game(board_10_state: DuetGameState):
+    turns_by_side = {DuetSide.SIDE_A: [DictatedTurn(clue=Clue(word="A", card_amount=2), guesses=[0])]}
+    players = build_players(turns_by_side=turns_by_side)
+    release = threading.Event()
+
+    def guess(game_state):  # pylint: disable=unused-argument
+        release.wait(timeout=5)
+
+    players.player_b.guess = guess  # type: ignore
+    runner = DuetGameRunner(players=players, state=board_10_state, move_policy=MovePolicy(guess_timeout_sec=0.01))
+    runner.run_game()
+    release.set()
+
+    assert runner.state.game_result == MOVE_TIMED_OUT
+    assert runner.state.side_a.game_result == MOVE_TIMED_OUT
+    assert [timing.player for timing in runner.move_timings] == [players.player_a.name, players.player_b.name]
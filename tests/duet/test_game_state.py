@@ -5,7 +5,7 @@ import pytest
 from codenames.duet.board import DuetBoard
 from codenames.duet.score import TARGET_REACHED
 from codenames.duet.state import DuetGameState, DuetSide
-from codenames.generic.exceptions import InvalidGuess
+from codenames.generic.exceptions import InvalidClue, InvalidGuess
 from codenames.generic.move import PASS_GUESS, Clue, Guess
 from codenames.generic.player import PlayerRole
 from tests.duet.utils.moves import get_duet_moves, get_side_moves
@@ -24,6 +24,19 @@ def test_game_state_json_serialization_and_load(board_10: DuetBoard):
     assert game_state_dict == game_state.model_dump()
 
 
+@pytest.mark.parametrize("trusted", [False, True])
+def test_game_state_normalized_serialization_and_load(board_10: DuetBoard, trusted: bool):
+    game_state = DuetGameState.from_board(board=board_10)
+    game_state.process_clue(clue=Clue(word="A", card_amount=2))
+    game_state.process_guess(guess=Guess(card_index=0))
+    game_state.process_guess(guess=Guess(card_index=1))
+
+    game_state_json = json.dumps(game_state.model_dump_normalized())
+    game_state_from_json = DuetGameState.model_validate_normalized(json.loads(game_state_json), trusted=trusted)
+    assert game_state_from_json == game_state
+    assert game_state_from_json.model_dump() == game_state.model_dump()
+
+
 def test_game_state_flow(board_10: DuetBoard, board_10_dual: DuetBoard):
     game_state = DuetGameState.from_boards(board_a=board_10, board_b=board_10_dual)
     assert game_state.current_playing_side == DuetSide.SIDE_A
@@ -137,3 +150,21 @@ def test_game_state_flow(board_10: DuetBoard, board_10_dual: DuetBoard):
     assert game_state.timer_tokens == 4
     assert game_state.is_game_over
     assert game_state.game_result == TARGET_REACHED
+
+
+def test_dual_given_words_are_illegal_clue_words(board_10: DuetBoard, board_10_dual: DuetBoard):
+    game_state = DuetGameState.from_boards(board_a=board_10, board_b=board_10_dual)
+    assert not game_state.side_b.is_illegal_clue_word("Clue 1")
+
+    game_state.process_clue(clue=Clue(word="Clue 1", card_amount=2))
+    assert game_state.side_a.is_illegal_clue_word("clue 1")
+    assert game_state.side_b.is_illegal_clue_word("clue 1")
+    assert game_state.side_b.illegal_clue_word_set == frozenset(game_state.side_b.illegal_clue_words)
+    game_state.side_b.dual_given_words = []
+    assert not game_state.side_b.is_illegal_clue_word("clue 1")
+    game_state.side_b.dual_given_words = ["clue 1"]
+
+    game_state.process_guess(guess=Guess(card_index=PASS_GUESS))
+    assert game_state.current_playing_side == DuetSide.SIDE_B
+    with pytest.raises(InvalidClue):
+        game_state.process_clue(clue=Clue(word="Clue 1", card_amount=2))
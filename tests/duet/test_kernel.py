@@ -0,0 +1,95 @@
+import random
+
+import numpy as np
+import pytest
+
+from codenames.duet import kernel
+from codenames.duet.board import DuetBoard
+from codenames.duet.state import DuetGameState
+from codenames.generic.exceptions import GameIsOver, InvalidGuess, InvalidTurn
+from codenames.generic.move import PASS_GUESS, QUIT_GAME, Clue, Guess
+from codenames.utils.vocabulary.languages import SupportedLanguage, get_vocabulary
+
+
+def make_states(amount: int, seed: int) -> list[DuetGameState]:
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    boards = DuetBoard.many_from_vocabulary(vocabulary=vocabulary, amount=amount, seed=seed)
+    return [DuetGameState.from_board(board=board) for board in boards]
+
+
+def assert_batch_matches(batch, states: list[DuetGameState]):
+    expected = kernel.DuetGameBatch.from_states(states)
+    for field in ("colors", "revealed", "green_revealed", "side_results", "operative_turn", "current_side"):
+        assert np.array_equal(getattr(batch, field), getattr(expected, field)), field
+    assert np.array_equal(batch.timer_tokens, expected.timer_tokens)
+    assert np.array_equal(batch.allowed_mistakes, expected.allowed_mistakes)
+    assert batch.game_results == [state.game_result for state in states]
+
+
+def random_guesses(batch, rng: random.Random) -> list[int]:
+    guesses = []
+    for hidden in batch.hidden_cards:
+        choice = rng.random()
+        if choice < 0.1:
+            guesses.append(PASS_GUESS)
+        elif choice < 0.11:
+            guesses.append(QUIT_GAME)
+        else:
+            guesses.append(rng.choice(np.flatnonzero(hidden).tolist()))
+    return guesses
+
+
+def is_stalled(state: DuetGameState) -> bool:
+    # The current side already won while the game goes on, `DuetGameState` rejects further moves.
+    return not state.is_game_over and state.current_side_state.is_game_over
+
+
+def test_random_playouts_match_game_state():
+    rng = random.Random(7)
+    states = make_states(amount=200, seed=7)
+    batch = kernel.DuetGameBatch.from_boards(
+        boards_a=[state.side_a.board.model_copy(deep=True) for state in states],
+        boards_b=[state.side_b.board.model_copy(deep=True) for state in states],
+    )
+    assert_batch_matches(batch, states)
+    for step in range(200):
+        assert batch.is_stalled.tolist() == [is_stalled(state) for state in states]
+        awaiting_clue, awaiting_guess = batch.awaiting_clue, batch.awaiting_guess
+        if not awaiting_clue.any() and not awaiting_guess.any():
+            break
+        batch.process_clues(active=awaiting_clue)
+        for i in np.flatnonzero(awaiting_clue):
+            states[i].process_clue(Clue(word=f"clue {step}", card_amount=2))
+        guesses = random_guesses(batch, rng)
+        batch.process_guesses(np.array(guesses), active=awaiting_guess)
+        for i in np.flatnonzero(awaiting_guess):
+            states[i].process_guess(Guess(card_index=guesses[i]))
+        assert_batch_matches(batch, states)
+    assert all(state.is_game_over or is_stalled(state) for state in states)
+    assert any(state.is_sudden_death for state in states)
+
+
+def test_invalid_guesses_are_rejected_without_changes():
+    states = make_states(amount=3, seed=1)
+    batch = kernel.DuetGameBatch.from_states(states)
+    with pytest.raises(InvalidTurn):
+        batch.process_guesses(np.array([0, 0, 0]), active=np.ones(3, dtype=bool))
+    batch.process_clues()
+    with pytest.raises(InvalidGuess):
+        batch.process_guesses(np.array([0, 25, 1]))
+    assert not batch.revealed.any()
+    green_card = int(np.flatnonzero(batch.colors[0, 0] == kernel.GREEN)[0])
+    first_game = np.array([True, False, False])
+    batch.process_guesses(np.array([green_card, PASS_GUESS, PASS_GUESS]), active=first_game)
+    with pytest.raises(InvalidGuess):
+        batch.process_guesses(np.array([green_card, PASS_GUESS, PASS_GUESS]), active=first_game)
+
+
+def test_finished_games_reject_moves():
+    states = make_states(amount=2, seed=2)
+    batch = kernel.DuetGameBatch.from_states(states)
+    batch.process_clues()
+    batch.process_guesses(np.array([QUIT_GAME, PASS_GUESS]))
+    assert batch.is_game_over.tolist() == [True, False]
+    with pytest.raises(GameIsOver):
+        batch.process_clues(active=np.array([True, True]))
@@ -3,6 +3,7 @@ import json
 import pytest
 
 from codenames.duet.board import DuetBoard
+from codenames.duet.card import DuetColor
 from codenames.duet.score import ASSASSIN_HIT, GAME_QUIT, TARGET_REACHED
 from codenames.duet.state import DuetSideState
 from codenames.generic.exceptions import GameIsOver, InvalidGuess, InvalidTurn
@@ -158,3 +159,22 @@ def test_side_state_operator_quit(board_10: DuetBoard):
     side_state.process_guess(guess=Guess(card_index=QUIT_GAME))
     assert side_state.is_game_over
     assert side_state.game_result == GAME_QUIT
+
+
+def test_side_state_views_match_player_states(board_10: DuetBoard, board_10_dual: DuetBoard):
+    side_state, dual_state = DuetSideState.from_board(board=board_10), DuetSideState.from_board(board=board_10_dual)
+    side_state.process_clue(clue=Clue(word="A", card_amount=2))
+    side_state.process_guess(guess=Guess(card_index=0))
+    dual_state.dual_card_revealed(guess=Guess(card_index=0))
+
+    assert side_state.get_spymaster_view(dual_state) == side_state.get_spymaster_state(dual_state)
+    assert side_state.get_operative_view(dual_state) == side_state.get_operative_state(dual_state)
+    assert dual_state.operative_view == dual_state.operative_state
+    assert dual_state.operative_view.board[0].color == DuetColor.IRRELEVANT
+
+    spymaster_view = side_state.get_spymaster_view(dual_state)
+    dual_state.dual_card_revealed(guess=Guess(card_index=1))
+    assert spymaster_view.dual_state is not None
+    assert spymaster_view.dual_state.board[1].revealed
+    with pytest.raises(AttributeError):
+        spymaster_view.dual_state.board.reveal_card(2)
@@ -1,11 +1,15 @@
+import threading
+
 from codenames.duet.board import DuetBoard
 from codenames.duet.score import (
     MISTAKE_LIMIT_REACHED,
+    MOVE_TIMED_OUT,
     TARGET_REACHED,
     TIMER_TOKENS_DEPLETED,
 )
 from codenames.duet.state import DuetSide
 from codenames.generic.move import PASS_GUESS, Clue
+from codenames.generic.runner import MovePolicy, TimeoutAction
 from codenames.mini.runner import MiniGameRunner
 from codenames.mini.state import MiniGameState
 from tests.duet.utils.runner import build_players
@@ -72,3 +76,48 @@ def test_mistake_limit_reached(board_10: DuetBoard):
     assert runner.state.allowed_mistakes == 0
     assert len(runner.state.given_clues) == 3
     assert len(runner.state.given_guesses) == 4
+
+
+def test_operative_timeout_passes_the_turn(board_10: DuetBoard):
+    turns_by_side = {
+        DuetSide.SIDE_A: [
+            DictatedTurn(clue=Clue(word="A", card_amount=3), guesses=[]),  # Timed out, pass
+            DictatedTurn(clue=Clue(word="B", card_amount=4), guesses=[0, 1, 2, 3]),  # All green
+        ],
+    }
+    players = build_players(turns_by_side=turns_by_side)
+    operative = players.team_a.operative
+    dictated_guess = operative.guess
+    release = threading.Event()
+    calls = []
+
+    def guess(game_state):
+        calls.append(game_state)
+        if len(calls) == 1:
+            release.wait(timeout=5)
+        return dictated_guess(game_state=game_state)
+
+    operative.guess = guess  # type: ignore
+    policy = MovePolicy(guess_timeout_sec=0.01, on_timeout=TimeoutAction.END_TURN)
+    runner = MiniGameRunner(players=players.team_a, board=board_10, move_policy=policy)
+    runner.run_game()
+    release.set()
+
+    assert runner.state.game_result == TARGET_REACHED
+    assert runner.state.timer_tokens == 4  # 5 - 1 (timeout pass)
+    assert [timing.timed_out for timing in runner.move_timings] == [False, True, *[False] * 5]
+
+
+def test_spymaster_timeout_loses_the_game(board_10: DuetBoard):
+    players = build_players(turns_by_side={DuetSide.SIDE_A: []})
+    release = threading.Event()
+
+    def give_clue(game_state):  # pylint: disable=unused-argument
+        release.wait(timeout=5)
+
+    players.team_a.spymaster.give_clue = give_clue  # type: ignore
+    runner = MiniGameRunner(players=players.team_a, board=board_10, move_policy=MovePolicy(clue_timeout_sec=0.01))
+    runner.run_game()
+    release.set()
+
+    assert runner.state.game_result == MOVE_TIMED_OUT
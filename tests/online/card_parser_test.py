@@ -0,0 +1,24 @@
+import pytest
+
+from codenames.classic.color import ClassicColor
+from codenames.online.codenames_game.card_parser import parse_cards_payload
+
+
+def test_parse_cards_payload_sorts_by_index_and_parses_fields():
+    payload = [
+        {"index": "1", "word": " Apple\n", "classes": "card red", "label": "apple, revealed"},
+        {"index": "0", "word": "Bank", "classes": "card gray", "label": "bank"},
+        {"index": "2", "word": "Cat", "classes": "card black", "label": ""},
+    ]
+    results = parse_cards_payload(payload)
+    assert [result.index for result in results] == [0, 1, 2]
+    cards = [result.card for result in results]
+    assert [card.word for card in cards] == ["bank", "apple", "cat"]
+    assert [card.color for card in cards] == [ClassicColor.NEUTRAL, ClassicColor.RED, ClassicColor.ASSASSIN]
+    assert [card.revealed for card in cards] == [False, True, False]
+
+
+def test_parse_cards_payload_rejects_unknown_color():
+    payload = [{"index": "0", "word": "Bank", "classes": "card", "label": ""}]
+    with pytest.raises(ValueError, match="color"):
+        parse_cards_payload(payload)
@@ -3,6 +3,9 @@ import pytest
 from codenames.classic.runner import ClassicGamePlayers
 from codenames.classic.team import ClassicTeam
 from codenames.classic.winner import WinningReason
+from codenames.generic.move import PASS_GUESS, Clue
+from codenames.online.codenames_game.adapter import CodenamesGamePlayerAdapter
+from codenames.online.codenames_game.local_app import LocalCodenamesApp
 from codenames.online.codenames_game.runner import CodenamesGameRunner
 from codenames.online.codenames_game.screenshot import reset_screenshot_run
 from tests.classic.utils.types import ClassicCheaterOperator, ClassicCheaterSpymaster
@@ -25,3 +28,45 @@ def test_full_codenames_game_flow():
         runner = manager.auto_start()
         assert runner.winner is not None
         assert runner.winner.reason == WinningReason.TARGET_SCORE_REACHED
+
+
+@pytest.mark.web
+def test_full_game_flow_against_local_app():
+    players = get_cheaters()
+    with LocalCodenamesApp(seed=0) as app:
+        runner_players = (*players.spymasters, *players.operatives)
+        with CodenamesGameRunner(*runner_players, show_host=False, base_url=app.base_url) as manager:
+            runner = manager.auto_start()
+    assert runner.winner is not None
+    assert runner.winner.reason == WinningReason.TARGET_SCORE_REACHED
+
+
+@pytest.mark.web
+def test_adapter_locators_resolve_on_local_app():
+    spymaster = ClassicCheaterSpymaster(name="Yoda", team=ClassicTeam.BLUE)
+    with LocalCodenamesApp(seed=0) as app:
+        adapter = CodenamesGamePlayerAdapter(player=spymaster, base_url=app.base_url)
+        try:
+            adapter.open().host_game()
+            assert adapter.get_game_url()
+            adapter.choose_role().start_game()
+            (room,) = app.rooms.values()
+            if room.state.current_team != ClassicTeam.BLUE:  # type: ignore
+                # Play the red turn through the app, so the adapter gets to give a clue.
+                red_spymaster, red_operative = room.join("Einstein"), room.join("Newton")
+                room.choose_role(red_spymaster, team=ClassicTeam.RED, role="SPYMASTER")
+                room.choose_role(red_operative, team=ClassicTeam.RED, role="OPERATIVE")
+                room.give_clue(red_spymaster, word="red", amount=1)
+                room.guess(red_operative, index=PASS_GUESS)
+            assert len(adapter.poll_element(adapter.get_cards_payload)) == 25
+            assert adapter.get_card_container(0)
+            assert adapter.get_card_picker(0)
+            adapter.poll_element(adapter.get_clue_input)
+            number_wrapper = adapter.get_number_wrapper()
+            assert adapter.get_number_option(number_wrapper, 2)
+            assert adapter.get_give_clue_button()
+            adapter.transmit_clue(Clue(word="something", card_amount=2))
+            assert adapter.get_clue_text().text.strip().lower() == "something"
+            assert adapter.get_cards_text().text.strip() == "2"
+        finally:
+            adapter.close()
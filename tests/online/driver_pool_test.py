@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from codenames.online.codenames_game.driver_pool import DriverPool, DriverPoolExhausted
+
+
+class FakeDriver:
+    def __init__(self, headless: bool):
+        self.headless = headless
+        self.resets = 0
+        self.quit_called = False
+        self.broken = False
+
+    def execute_script(self, script: str):
+        if self.broken:
+            raise RuntimeError("Session is gone")
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url: str):
+        assert url == "about:blank"
+        self.resets += 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(max_size: int = 2) -> tuple[DriverPool, list[FakeDriver]]:
+    created: list[FakeDriver] = []
+
+    def factory(headless: bool) -> FakeDriver:
+        driver = FakeDriver(headless)
+        created.append(driver)
+        return driver
+
+    return DriverPool(max_size=max_size, driver_factory=factory), created  # type: ignore
+
+
+def test_released_session_is_reset_and_reused():
+    pool, created = make_pool()
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire() is driver
+    assert len(created) == 1
+    assert created[0].resets == 1
+
+
+def test_sessions_are_matched_by_headless_mode():
+    pool, created = make_pool(max_size=2)
+    pool.release(pool.acquire(headless=True))
+    visible = pool.acquire(headless=False)
+    assert visible.headless is False  # type: ignore
+    assert len(created) == 2
+
+
+def test_full_pool_replaces_idle_session_of_other_mode():
+    pool, created = make_pool(max_size=1)
+    pool.release(pool.acquire(headless=True))
+    pool.acquire(headless=False)
+    assert created[0].quit_called
+    assert pool.size == 1
+
+
+def test_acquire_blocks_until_session_is_released():
+    pool, _ = make_pool(max_size=1)
+    driver = pool.acquire()
+    with pytest.raises(DriverPoolExhausted):
+        pool.acquire(timeout_sec=0.05)
+    threading.Timer(0.05, pool.release, args=[driver]).start()
+    assert pool.acquire(timeout_sec=5) is driver
+
+
+def test_broken_session_is_discarded():
+    pool, created = make_pool()
+    driver = pool.acquire()
+    created[0].broken = True
+    pool.release(driver)
+    assert created[0].quit_called
+    assert pool.size == 0
+
+
+def test_discarded_session_is_quit_and_frees_its_slot():
+    pool, created = make_pool(max_size=1)
+    driver = pool.acquire()
+    pool.discard(driver)
+    assert created[0].quit_called
+    assert pool.size == 0
+    assert pool.acquire() is created[1]
+
+
+def test_close_quits_idle_and_later_released_sessions():
+    pool, created = make_pool()
+    idle, in_use = pool.acquire(), pool.acquire()
+    pool.release(idle)
+    pool.close()
+    assert created[0].quit_called
+    assert not created[1].quit_called
+    pool.release(in_use)
+    assert created[1].quit_called
+    assert pool.size == 0
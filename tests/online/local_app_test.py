@@ -0,0 +1,136 @@
+import json
+import threading
+import time
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from typing import Any, Iterator
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from codenames.classic.team import ClassicTeam
+from codenames.generic.move import PASS_GUESS
+from codenames.online.codenames_game.adapter import CARDS_TEXT_XPATH, CLUE_TEXT_XPATH
+from codenames.online.codenames_game.local_app import LocalCodenamesApp
+
+VOID_TAGS = {"meta", "input", "br", "img", "link"}
+
+
+class _TreeBuilder(HTMLParser):
+    # Builds an ElementTree out of the served page, so absolute paths can be checked without a browser.
+    def __init__(self):
+        super().__init__()
+        self.root = ET.Element("document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        element = ET.SubElement(self.stack[-1], tag, {name: value or "" for name, value in attrs})
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_endtag(self, tag: str):
+        if tag not in VOID_TAGS:
+            self.stack.pop()
+
+
+@pytest.fixture
+def app() -> Iterator[LocalCodenamesApp]:
+    with LocalCodenamesApp(seed=0) as local_app:
+        yield local_app
+
+
+def get(url: str) -> tuple[str, Any]:
+    with urlopen(url, timeout=15) as response:  # noqa: S310
+        body = response.read().decode("utf-8")
+        return response.url, json.loads(body) if "json" in response.headers["Content-Type"] else body
+
+
+def post(app: LocalCodenamesApp, room_id: str, action: str, **body: Any) -> dict[str, Any]:
+    url = f"{app.base_url}api/rooms/{room_id}/{action}"
+    data = json.dumps(body).encode("utf-8")
+    request = Request(url, data=data, headers={"Content-Type": "application/json"})  # noqa: S310
+    with urlopen(request, timeout=5) as response:  # noqa: S310
+        return json.loads(response.read())
+
+
+def create_room(app: LocalCodenamesApp) -> str:
+    room_url, page = get(f"{app.base_url}create")
+    assert "nickname-input" in page
+    return room_url.rstrip("/").split("/")[-1]
+
+
+def join(app: LocalCodenamesApp, room_id: str, name: str, team: ClassicTeam, role: str) -> str:
+    player = post(app, room_id, "join", name=name)["player"]
+    post(app, room_id, "role", player=player, team=team, role=role)
+    return player
+
+
+def test_home_page_links_to_room_creation(app: LocalCodenamesApp):
+    _, page = get(app.base_url)
+    assert "CREATE ROOM" in page
+    assert "numSelect-wrapper" in page
+
+
+@pytest.mark.parametrize("xpath", [CLUE_TEXT_XPATH, CARDS_TEXT_XPATH])
+def test_clue_paragraph_paths_resolve(app: LocalCodenamesApp, xpath: str):
+    # The paragraphs are rendered into the clue article, so the article must sit at the adapter's path.
+    _, page = get(f"{app.base_url}room/some-room")
+    builder = _TreeBuilder()
+    builder.feed(page)
+    article_path = xpath.removeprefix("/").rsplit("/", maxsplit=1)[0]
+    matches = builder.root.findall(article_path)
+    assert [element.get("id") for element in matches] == ["clue"]
+
+
+def test_game_is_played_through_the_api(app: LocalCodenamesApp):
+    room_id = create_room(app)
+    players = {
+        (team, role): join(app, room_id, f"{team} {role}", team, role)
+        for team in ClassicTeam
+        for role in ("SPYMASTER", "OPERATIVE")
+    }
+    view = post(app, room_id, "start", player=players[(ClassicTeam.BLUE, "SPYMASTER")])["view"]
+    assert len(view["board"]) == 25
+    team = view["current_team"]
+    spymaster, operative = players[(team, "SPYMASTER")], players[(team, "OPERATIVE")]
+
+    spymaster_view = post(app, room_id, "language", player=spymaster, code="en")["view"]
+    assert all(card["color"] for card in spymaster_view["board"])
+    view = post(app, room_id, "clue", player=spymaster, word="Something", amount=2)["view"]
+    assert view["clue"] == {"word": "something", "amount": 2}
+    assert view["current_role"] == "OPERATIVE"
+
+    operative_view = post(app, room_id, "guess", player=operative, index=0)["view"]
+    assert operative_view["board"][0]["revealed"]
+    assert operative_view["board"][0]["color"] is not None
+    assert operative_view["board"][1]["color"] is None
+    if operative_view["current_role"] == "OPERATIVE":
+        post(app, room_id, "guess", player=operative, index=PASS_GUESS)
+    _, view = get(f"{app.base_url}api/rooms/{room_id}?player={spymaster}")
+    assert view["clue"] is None
+    assert view["current_team"] != team
+
+
+def test_moves_are_validated(app: LocalCodenamesApp):
+    room_id = create_room(app)
+    spymaster = join(app, room_id, "Spymaster", ClassicTeam.BLUE, "SPYMASTER")
+    post(app, room_id, "start", player=spymaster)
+    other = post(app, room_id, "join", name="Other")["player"]
+    with pytest.raises(HTTPError) as error:
+        post(app, room_id, "role", player=other, team=ClassicTeam.BLUE, role="SPYMASTER")
+    assert error.value.code == 400
+    with pytest.raises(HTTPError) as error:
+        post(app, room_id, "guess", player=other, index=0)
+    assert error.value.code == 403
+
+
+def test_long_poll_returns_once_room_changes(app: LocalCodenamesApp):
+    room_id = create_room(app)
+    _, view = get(f"{app.base_url}api/rooms/{room_id}")
+    threading.Timer(0.1, post, args=[app, room_id, "join"], kwargs={"name": "Late"}).start()
+    start = time.time()
+    _, changed = get(f"{app.base_url}api/rooms/{room_id}?since={view['version']}")
+    assert time.time() - start < 5
+    assert changed["version"] > view["version"]
+    assert [player["name"] for player in changed["players"]] == ["Late"]
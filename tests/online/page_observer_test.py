@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+from codenames.generic.move import PASS_GUESS
+from codenames.online.codenames_game.page_observer import PageObserver
+from codenames.online.utils import PollingTimeout
+
+
+class FakeDriver:
+    # Hands out one queued batch of events per drain, like the page-side observer.
+    def __init__(self, *batches: list[dict]):
+        self.batches = list(batches)
+        self.installs = 0
+        self.drains = 0
+
+    def set_script_timeout(self, timeout: float):
+        pass
+
+    def execute_script(self, script: str, *args) -> bool:
+        self.installs += 1
+        return True
+
+    def execute_async_script(self, script: str, *args) -> list[dict] | None:
+        self.drains += 1
+        return self.batches.pop(0) if self.batches else []
+
+
+def make_observer(*batches: list[dict]) -> PageObserver:
+    return PageObserver(driver=FakeDriver(*batches), clue_text_xpath="", cards_text_xpath="")  # type: ignore
+
+
+def test_wait_for_clue_matches_clue_by_order():
+    observer = make_observer(
+        [{"type": "clue", "clue": 1, "word": "first", "cards": "2"}],
+        [{"type": "turn_end", "clue": 1}, {"type": "clue", "clue": 2, "word": "second", "cards": "3 cards"}],
+    )
+    clue = observer.wait_for_clue(clue_number=2, timeout_sec=5)
+    assert clue.word == "second"
+    assert clue.card_amount == 3
+    assert observer.driver.drains == 2  # type: ignore
+
+
+def test_wait_for_guess_ignores_known_reveals():
+    observer = make_observer(
+        [{"type": "reveal", "clue": 1, "index": 3}],
+        [{"type": "reveal", "clue": 2, "index": 7}],
+    )
+    guess = observer.wait_for_guess(revealed_card_indexes={3}, clue_number=2, timeout_sec=5)
+    assert guess.card_index == 7
+
+
+def test_wait_for_guess_returns_pass_when_current_turn_ends():
+    observer = make_observer(
+        [{"type": "turn_end", "clue": 1}],
+        [{"type": "turn_end", "clue": 2}],
+    )
+    guess = observer.wait_for_guess(revealed_card_indexes=set(), clue_number=2, timeout_sec=5)
+    assert guess.card_index == PASS_GUESS
+    assert observer.driver.drains == 2  # type: ignore
+
+
+def test_observer_is_reinstalled_when_page_lost_it():
+    observer = make_observer(None, [{"type": "clue", "clue": 1, "word": "word", "cards": "1"}])  # type: ignore
+    observer.wait_for_clue(clue_number=1, timeout_sec=5)
+    assert observer.driver.installs == 2  # type: ignore
+
+
+def test_unbounded_wait_drains_until_the_move_arrives():
+    observer = make_observer([], [], [{"type": "clue", "clue": 1, "word": "late", "cards": "1"}])
+    clue = observer.wait_for_clue(clue_number=1, timeout_sec=math.inf)
+    assert clue.word == "late"
+    assert observer.driver.drains == 3  # type: ignore
+
+
+def test_wait_is_bounded():
+    observer = make_observer()
+    with pytest.raises(PollingTimeout):
+        observer.wait_for_clue(clue_number=1, timeout_sec=0)
@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pytest
+
+from codenames.classic.team import ClassicTeam
+from codenames.online.codenames_game import runner as runner_module
+from codenames.online.codenames_game.runner import (
+    CodenamesGameRunner,
+    GameStartTimeout,
+)
+from tests.classic.utils.types import ClassicCheaterOperator, ClassicCheaterSpymaster
+
+HOST_SETUP_SEC = 0.2
+
+
+class FakeAdapter:
+    # Records when each step happens, instead of driving a browser.
+    events: list[tuple[str, str, float]] = []
+    failing_logins: set[str] = set()
+    host_blocker: threading.Event | None = None
+
+    def __init__(self, player, game_url: str | None = None, **kwargs):
+        self.player = player
+        self.game_url = game_url
+        self.closed = False
+
+    def _record(self, step: str):
+        FakeAdapter.events.append((self.player.name, step, time.monotonic()))
+
+    def open(self) -> "FakeAdapter":
+        self._record(f"open {self.game_url}")
+        return self
+
+    def host_game(self) -> "FakeAdapter":
+        if FakeAdapter.host_blocker:
+            FakeAdapter.host_blocker.wait()
+        if self.closed:
+            msg = "Browser closed"
+            raise RuntimeError(msg)
+        time.sleep(HOST_SETUP_SEC)
+        self._record("host")
+        return self
+
+    def configure_language(self, language):
+        pass
+
+    def choose_role(self) -> "FakeAdapter":
+        self._record("role")
+        return self
+
+    def get_game_url(self) -> str:
+        return "room-url"
+
+    def login(self) -> "FakeAdapter":
+        if self.player.name in FakeAdapter.failing_logins:
+            msg = f"{self.player.name} failed to log in"
+            raise RuntimeError(msg)
+        self._record("login")
+        return self
+
+    def close(self, discard: bool = False):
+        self.closed = True
+        self._record("discard" if discard else "close")
+        if FakeAdapter.host_blocker:
+            # Like closing a browser in the middle of a call, the blocked call returns.
+            FakeAdapter.host_blocker.set()
+
+
+@pytest.fixture
+def fake_adapter(monkeypatch: pytest.MonkeyPatch) -> type[FakeAdapter]:
+    FakeAdapter.events = []
+    FakeAdapter.failing_logins = set()
+    FakeAdapter.host_blocker = None
+    monkeypatch.setattr(runner_module, "CodenamesGamePlayerAdapter", FakeAdapter)
+    return FakeAdapter
+
+
+def make_runner() -> CodenamesGameRunner:
+    blue_spymaster = ClassicCheaterSpymaster(name="Yoda", team=ClassicTeam.BLUE)
+    red_spymaster = ClassicCheaterSpymaster(name="Einstein", team=ClassicTeam.RED)
+    blue_operative = ClassicCheaterOperator(name="Anakin", team=ClassicTeam.BLUE, spymaster=blue_spymaster)
+    red_operative = ClassicCheaterOperator(name="Newton", team=ClassicTeam.RED, spymaster=red_spymaster)
+    return CodenamesGameRunner(blue_spymaster, red_spymaster, blue_operative, red_operative, show_host=False)
+
+
+def test_guests_load_while_host_creates_room(fake_adapter: type[FakeAdapter]):
+    runner = make_runner()
+    start = time.monotonic()
+    runner.connect_players(timeout_sec=5)
+    assert time.monotonic() - start < 2 * HOST_SETUP_SEC + 0.5
+    host_done = next(at for name, step, at in fake_adapter.events if step == "host")
+    guest_opens = [at for name, step, at in fake_adapter.events if step == "open None" and name != "Yoda"]
+    assert len(guest_opens) == 3
+    assert all(at < host_done for at in guest_opens)
+    joined = {name for name, step, _ in fake_adapter.events if step == "open room-url"}
+    assert joined == {"Einstein", "Anakin", "Newton"}
+    assert len(runner.guests) == 3
+
+
+def test_guest_error_is_raised_instead_of_hanging(fake_adapter: type[FakeAdapter]):
+    fake_adapter.failing_logins = {"Newton"}
+    runner = make_runner()
+    with pytest.raises(RuntimeError, match="Newton failed to log in"):
+        runner.connect_players(timeout_sec=5)
+    discarded = {name for name, step, _ in fake_adapter.events if step == "discard"}
+    assert discarded == {"Yoda", "Einstein", "Anakin", "Newton"}
+    assert not runner.host_connected
+    assert not runner.guests
+
+
+def test_start_is_bounded_by_deadline(fake_adapter: type[FakeAdapter]):
+    fake_adapter.host_blocker = threading.Event()
+    runner = make_runner()
+    start = time.monotonic()
+    try:
+        with pytest.raises(GameStartTimeout):
+            runner.connect_players(timeout_sec=0.2)
+    finally:
+        fake_adapter.host_blocker.set()
+    # The blocked host call returned once its browser was closed, so the setup threads were joined.
+    assert time.monotonic() - start < 1
+    discarded = {name for name, step, _ in fake_adapter.events if step == "discard"}
+    assert discarded == {"Yoda", "Einstein", "Anakin", "Newton"}
+    assert "host" not in {step for _, step, _ in fake_adapter.events}
@@ -0,0 +1,144 @@
+import base64
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from codenames.online.codenames_game import screenshot as screenshot_module
+from codenames.online.codenames_game.screenshot import (
+    ScreenshotSettings,
+    ScreenshotWriter,
+)
+
+PNG_BYTES = b"\x89PNG fake image"
+
+
+class FakeDriver:
+    def __init__(self):
+        self.image = PNG_BYTES
+        self.capture_threads: list[threading.Thread] = []
+        self.cdp_calls: list[tuple[str, dict]] = []
+
+    def get_screenshot_as_png(self) -> bytes:
+        self.capture_threads.append(threading.current_thread())
+        return self.image
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict[str, Any]:
+        self.cdp_calls.append((cmd, cmd_args))
+        if cmd == "Page.getLayoutMetrics":
+            return {"cssLayoutViewport": {"clientWidth": 800, "clientHeight": 600}}
+        return {"data": base64.b64encode(b"jpeg").decode()}
+
+
+class FakeAdapter:
+    def __init__(self, name: str, driver: FakeDriver | None = None):
+        self.player = name
+        self.log_prefix = f"[{name}]"
+        self.driver = driver or FakeDriver()
+
+
+@pytest.fixture(autouse=True)
+def run_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_default_capture_is_full_size_png():
+    settings = ScreenshotSettings()
+    assert settings.image_format == "png"
+    assert settings.scale == 1
+    assert settings.is_default_capture
+
+
+def test_submit_captures_the_page_on_the_calling_thread():
+    writer = ScreenshotWriter()
+    adapter = FakeAdapter("Yoda")
+    path = writer.submit(adapter, tag="game start")  # type: ignore
+    adapter.driver.image = b"\x89PNG later page"
+    writer.flush()
+    assert path is not None
+    assert path.endswith("yoda - game start.png")
+    assert Path(path).read_bytes() == PNG_BYTES
+    assert adapter.driver.capture_threads == [threading.current_thread()]
+
+
+def test_captures_are_rate_limited_per_adapter():
+    writer = ScreenshotWriter(ScreenshotSettings(min_interval_sec=60))
+    yoda, einstein = FakeAdapter("Yoda"), FakeAdapter("Einstein")
+    assert writer.submit(yoda, tag="first")  # type: ignore
+    assert writer.submit(yoda, tag="second") is None  # type: ignore
+    assert writer.submit(einstein, tag="first")  # type: ignore
+    assert writer.submit(yoda, tag="game over", rate_limited=False)  # type: ignore
+    writer.flush()
+
+
+def test_run_budget_stops_capturing():
+    writer = ScreenshotWriter(ScreenshotSettings(min_interval_sec=0, max_run_bytes=2 * len(PNG_BYTES)))
+    adapter = FakeAdapter("Yoda")
+    writer.save(adapter, tag="first")  # type: ignore
+    writer.save(adapter, tag="second")  # type: ignore
+    assert writer.submit(adapter, tag="third") is None  # type: ignore
+    writer.reset_run()
+    assert writer.submit(adapter, tag="fourth")  # type: ignore
+    writer.flush()
+
+
+def test_queued_screenshots_count_against_the_run_budget(run_dir: Path):
+    release = threading.Event()
+
+    class BlockedWriter(ScreenshotWriter):
+        def _write(self, job):
+            release.wait()
+            super()._write(job)
+
+    writer = BlockedWriter(ScreenshotSettings(min_interval_sec=0, max_run_bytes=2 * len(PNG_BYTES)))
+    adapter = FakeAdapter("Yoda")
+    assert writer.submit(adapter, tag="first")  # type: ignore
+    assert writer.submit(adapter, tag="second")  # type: ignore
+    assert writer.submit(adapter, tag="third") is None  # type: ignore
+    assert writer.pending_bytes == 2 * len(PNG_BYTES)
+    release.set()
+    writer.flush()
+    assert writer.run_bytes == 2 * len(PNG_BYTES)
+    assert writer.pending_bytes == 0
+    assert len(list(run_dir.rglob("*.png"))) == 2
+
+
+def test_counter_is_unique_across_threads():
+    writer = ScreenshotWriter(ScreenshotSettings(min_interval_sec=0, max_pending=100))
+    adapters = [FakeAdapter(f"player {i}") for i in range(8)]
+    paths: list[str | None] = []
+
+    def submit_all(adapter: FakeAdapter):
+        paths.extend(writer.submit(adapter, tag=str(i)) for i in range(10))  # type: ignore
+
+    threads = [threading.Thread(target=submit_all, args=[adapter]) for adapter in adapters]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.flush()
+    counters = {Path(path).name.split(" ")[0] for path in paths if path}
+    assert len(counters) == 80
+
+
+def test_compressed_capture_is_downscaled_by_the_browser():
+    writer = ScreenshotWriter(ScreenshotSettings(image_format="jpeg", quality=50, scale=0.5))
+    adapter = FakeAdapter("Yoda")
+    path = writer.save(adapter, tag="after join")  # type: ignore
+    assert path.endswith(".jpg")
+    assert Path(path).read_bytes() == b"jpeg"
+    _, params = adapter.driver.cdp_calls[-1]
+    assert params["quality"] == 50
+    assert params["clip"]["scale"] == 0.5
+    assert params["clip"]["width"] == 800
+
+
+def test_save_screenshot_swallows_errors(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(screenshot_module, "SCREENSHOT_WRITER", ScreenshotWriter())
+    adapter = FakeAdapter("Yoda")
+    adapter.driver = None  # type: ignore
+    assert screenshot_module.save_screenshot(adapter, tag="broken") is None  # type: ignore
+    with pytest.raises(AttributeError):
+        screenshot_module.save_screenshot(adapter, tag="broken", raise_on_error=True)  # type: ignore
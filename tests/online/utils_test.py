@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from codenames.online.utils import (
+    PollingTimeout,
+    fill_input,
+    multi_click,
+    poll_condition,
+    try_poll_condition,
+)
+
+
+class FakeElement:
+    def __init__(self):
+        self.clicks = 0
+        self.value = ""
+
+    def click(self):
+        self.clicks += 1
+
+    def send_keys(self, keys: str):
+        for key in keys:
+            self.value = self.value[:-1] if key == "\b" else self.value + key
+
+    def get_attribute(self, name: str) -> str:
+        assert name == "value"
+        return self.value
+
+
+def test_poll_condition_returns_soon_after_condition_holds():
+    ready_at = time.time() + 0.1
+    start = time.time()
+    poll_condition(lambda: time.time() >= ready_at, timeout_sec=5, poll_interval_sec=2)
+    assert time.time() - start < 0.5
+
+
+def test_poll_condition_raises_after_upper_bound():
+    with pytest.raises(PollingTimeout):
+        poll_condition(lambda: False, timeout_sec=0.1)
+    assert not try_poll_condition(lambda: False, timeout_sec=0.1)
+
+
+def test_multi_click_stops_once_acknowledged():
+    element = FakeElement()
+    acknowledged = multi_click(element, times=10, until=lambda: element.clicks >= 2)  # type: ignore
+    assert acknowledged
+    assert element.clicks == 2
+
+
+def test_multi_click_reports_unacknowledged_clicks():
+    element = FakeElement()
+    acknowledged = multi_click(element, times=3, until=lambda: False, interval_sec=0.01)  # type: ignore
+    assert not acknowledged
+    assert element.clicks == 3
+
+
+def test_fill_input_replaces_value():
+    element = FakeElement()
+    element.value = "old"
+    start = time.time()
+    fill_input(element, "new value")  # type: ignore
+    assert element.value == "new value"
+    assert time.time() - start < 0.5
@@ -0,0 +1,63 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from codenames.utils.archive import ArchiveError, GameArchive, GameArchiveWriter
+from codenames.utils.recording import GameRecorder
+from tests.test_recording import build_classic_runner, build_duet_runner
+
+
+def record_games(amount: int, build_runner=build_classic_runner) -> list:
+    runners, recordings = [], []
+    for seed in range(amount):
+        random.seed(seed)
+        runner = build_runner()
+        recorder = GameRecorder(runner)
+        runner.run_game()
+        runners.append(runner)
+        recordings.append(recorder.recording)
+    return list(zip(runners, recordings, strict=True))
+
+
+def test_archive_random_access(tmp_path: Path):
+    games = record_games(5)
+    path = tmp_path / "games.cna"
+    with GameArchiveWriter(path) as writer:
+        game_ids = [writer.append(recording) for _, recording in games]
+    assert game_ids == [0, 1, 2, 3, 4]
+
+    with GameArchive(path) as archive:
+        assert len(archive) == 5
+        runner, recording = games[3]
+        assert archive[3] == recording
+        assert archive.replayer(3).final_state() == runner.state
+        with pytest.raises(IndexError):
+            archive.get_bytes(5)
+
+
+def test_archive_appends_across_writers(tmp_path: Path):
+    classic_games = record_games(2)
+    duet_games = record_games(2, build_runner=build_duet_runner)
+    path = tmp_path / "games.cna"
+    with GameArchiveWriter(path) as writer:
+        for _, recording in classic_games:
+            writer.append(recording)
+    with GameArchiveWriter(path) as writer:
+        assert writer.append(duet_games[0][1].to_bytes()) == 2
+        writer.append(duet_games[1][1])
+
+    with GameArchive(path) as archive:
+        assert list(archive) == [recording for _, recording in classic_games + duet_games]
+        final_states = list(archive.iter_final_states())
+    assert final_states == [runner.state for runner, _ in classic_games + duet_games]
+
+
+def test_archive_rejects_other_files(tmp_path: Path):
+    path = tmp_path / "games.cna"
+    with pytest.raises(ArchiveError):
+        GameArchive(path)
+    path.write_bytes(b"not an archive")
+    (tmp_path / "games.cna.idx").write_bytes(b"")
+    with pytest.raises(ArchiveError):
+        GameArchive(path)
@@ -0,0 +1,201 @@
+import asyncio
+import random
+import threading
+
+from codenames.classic.async_runner import (
+    AsyncClassicGamePlayers,
+    AsyncClassicGameRunner,
+)
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
+from codenames.classic.team import ClassicTeam
+from codenames.duet.async_runner import AsyncDuetGamePlayers, AsyncDuetGameRunner
+from codenames.duet.board import DuetBoard
+from codenames.duet.player import CompositeDuetPlayer
+from codenames.duet.runner import DuetGamePlayers, DuetGameRunner
+from codenames.duet.score import MOVE_TIMED_OUT
+from codenames.duet.state import DuetGameState
+from codenames.duet.team import DuetTeam
+from codenames.generic.async_runner import AsyncTeamPlayers
+from codenames.generic.move import Guess
+from codenames.generic.player import PlayerRole
+from codenames.generic.runner import MovePolicy, TeamPlayers
+from codenames.mini.async_runner import AsyncMiniGameRunner
+from codenames.mini.runner import MiniGameRunner
+from codenames.utils.instrumentation import Instrumentation, Metric
+from codenames.utils.vocabulary.languages import get_vocabulary
+from tests.utils.players.randoms import (
+    AsyncRandomOperative,
+    AsyncRandomPlayer,
+    AsyncRandomSpymaster,
+    RandomOperative,
+    RandomSpymaster,
+)
+
+VOCABULARY = get_vocabulary("english")
+
+
+def build_team(name: str, team) -> TeamPlayers:
+    return TeamPlayers(spymaster=RandomSpymaster(f"{name} Spymaster", team), operative=RandomOperative(name, team))
+
+
+def build_async_team(name: str, team) -> AsyncTeamPlayers:
+    return AsyncTeamPlayers(
+        spymaster=AsyncRandomSpymaster(f"{name} Spymaster", team),
+        operative=AsyncRandomOperative(name, team),
+    )
+
+
+def build_async_classic_runner(board: ClassicBoard) -> AsyncClassicGameRunner:
+    players = AsyncClassicGamePlayers(
+        blue_team=build_async_team("Blue", ClassicTeam.BLUE),
+        red_team=build_async_team("Red", ClassicTeam.RED),
+    )
+    return AsyncClassicGameRunner(players=players, board=board)
+
+
+def test_async_classic_game_matches_sync_game():
+    board = ClassicBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    players = ClassicGamePlayers(
+        blue_team=build_team("Blue", ClassicTeam.BLUE),
+        red_team=build_team("Red", ClassicTeam.RED),
+    )
+    random.seed(1)
+    sync_runner = ClassicGameRunner(players=players, board=board.model_copy(deep=True))
+    sync_winner = sync_runner.run_game()
+
+    random.seed(1)
+    async_runner = build_async_classic_runner(board=board)
+    async_winner = asyncio.run(async_runner.run_game())
+
+    assert async_winner == sync_winner
+    assert async_runner.state.model_dump() == sync_runner.state.model_dump()
+
+
+def test_async_duet_game_matches_sync_game():
+    board_a = DuetBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    board_b = DuetBoard.dual_board(board_a, seed=1)
+    team_a, team_b = build_team("A", DuetTeam.MAIN), build_team("B", DuetTeam.MAIN)
+    players = DuetGamePlayers(
+        player_a=CompositeDuetPlayer(spymaster=team_a.spymaster, operative=team_a.operative),
+        player_b=CompositeDuetPlayer(spymaster=team_b.spymaster, operative=team_b.operative),
+    )
+    random.seed(1)
+    sync_runner = DuetGameRunner(
+        players=players,
+        state=DuetGameState.from_boards(board_a=board_a.model_copy(deep=True), board_b=board_b.model_copy(deep=True)),
+    )
+    sync_result = sync_runner.run_game()
+
+    random.seed(1)
+    async_players = AsyncDuetGamePlayers(
+        # Named after the sync spymasters, since clue words contain the player name.
+        player_a=AsyncRandomPlayer("A Spymaster", DuetTeam.MAIN),
+        player_b=AsyncRandomPlayer("B Spymaster", DuetTeam.MAIN),
+    )
+    async_runner = AsyncDuetGameRunner(
+        players=async_players,
+        state=DuetGameState.from_boards(board_a=board_a, board_b=board_b),
+    )
+    async_result = asyncio.run(async_runner.run_game())
+
+    assert async_result == sync_result
+    assert async_runner.state.model_dump() == sync_runner.state.model_dump()
+
+
+def test_async_mini_game_matches_sync_game():
+    board = DuetBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    random.seed(1)
+    sync_runner = MiniGameRunner(players=build_team("Mini", DuetTeam.MAIN), board=board.model_copy(deep=True))
+    sync_result = sync_runner.run_game()
+
+    random.seed(1)
+    async_runner = AsyncMiniGameRunner(players=build_async_team("Mini", DuetTeam.MAIN), board=board)
+    async_result = asyncio.run(async_runner.run_game())
+
+    assert async_result == sync_result
+    assert async_runner.state.model_dump() == sync_runner.state.model_dump()
+
+
+def test_many_games_run_concurrently_on_one_loop():
+    boards = ClassicBoard.many_from_vocabulary(vocabulary=VOCABULARY, amount=20, seed=2)
+    runners = [build_async_classic_runner(board=board) for board in boards]
+
+    async def run_all():
+        return await asyncio.gather(*(runner.run_game() for runner in runners))
+
+    winners = asyncio.run(run_all())
+
+    assert len(winners) == len(boards)
+    assert all(runner.state.is_game_over for runner in runners)
+
+
+def test_sync_players_can_run_in_worker_threads():
+    threads = set()
+
+    class ThreadRecordingOperative(RandomOperative):
+        def guess(self, game_state):
+            threads.add(threading.get_ident())
+            return super().guess(game_state)
+
+    board = DuetBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    operative = ThreadRecordingOperative("Mini", DuetTeam.MAIN)
+    players = TeamPlayers(spymaster=RandomSpymaster("Mini Spymaster", DuetTeam.MAIN), operative=operative)
+    runner = AsyncMiniGameRunner(players=players, board=board, sync_players_in_thread=True)
+
+    asyncio.run(runner.run_game())
+
+    assert runner.state.is_game_over
+    assert threading.get_ident() not in threads
+
+
+def test_async_runner_times_out_moves():
+    class SlowOperative(AsyncRandomOperative):
+        async def guess(self, game_state):
+            await asyncio.sleep(5)
+
+    board = DuetBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    players = AsyncTeamPlayers(
+        spymaster=AsyncRandomSpymaster("Mini Spymaster", DuetTeam.MAIN),
+        operative=SlowOperative("Mini", DuetTeam.MAIN),
+    )
+    runner = AsyncMiniGameRunner(players=players, board=board, move_policy=MovePolicy(guess_timeout_sec=0.01))
+    timed_out: list = []
+    runner.timed_out_subscribers.append(timed_out.append)
+
+    result = asyncio.run(runner.run_game())
+
+    assert result == MOVE_TIMED_OUT
+    assert timed_out == [players.operative]
+    assert [(timing.role, timing.timed_out) for timing in runner.move_timings] == [
+        (PlayerRole.SPYMASTER, False),
+        (PlayerRole.OPERATIVE, True),
+    ]
+
+
+def test_async_runner_caps_invalid_guesses_and_measures():
+    class InvalidOperative(AsyncRandomOperative):
+        async def guess(self, game_state):
+            return Guess(card_index=100)
+
+    board = ClassicBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    players = AsyncClassicGamePlayers(
+        blue_team=AsyncTeamPlayers(
+            spymaster=AsyncRandomSpymaster("Blue Spymaster", ClassicTeam.BLUE),
+            operative=InvalidOperative("Blue", ClassicTeam.BLUE),
+        ),
+        red_team=build_async_team("Red", ClassicTeam.RED),
+    )
+    instrumentation = Instrumentation()
+    runner = AsyncClassicGameRunner(
+        players=players,
+        board=board,
+        move_policy=MovePolicy(max_invalid_guesses=2),
+        instrumentation=instrumentation,
+    )
+
+    asyncio.run(runner.run_game())
+
+    assert {given_guess.for_clue.team for given_guess in runner.state.given_guesses} == {ClassicTeam.RED}
+    assert instrumentation[Metric.GIVE_CLUE].count == len(runner.state.given_clues)
+    assert instrumentation[Metric.PROCESS_GUESS].count > 0
@@ -0,0 +1,38 @@
+import pytest
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.harness import (
+    Benchmark,
+    Comparison,
+    compare,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+
+@pytest.mark.parametrize("benchmark", BENCHMARKS, ids=lambda benchmark: benchmark.name)
+def test_benchmark_case_runs(benchmark: Benchmark):
+    run = benchmark.prepare(2)
+    run()
+
+
+def test_baseline_round_trip_detects_regressions(tmp_path):
+    benchmark = Benchmark(name="noop", unit="call", prepare=lambda n: lambda: None)
+    result = run_benchmark(benchmark, min_round_sec=0, rounds=2)
+    path = tmp_path / "baseline.json"
+    save_baseline([result], path=path)
+
+    baseline = load_baseline(path)
+
+    assert baseline == {"noop": result}
+    (comparison,) = compare([result], baseline=baseline)
+    assert comparison.ratio == 1
+    assert not comparison.is_regression(tolerance=0.1)
+    assert compare([result], baseline={}) == []
+
+
+def test_zero_baseline_is_not_compared():
+    comparison = Comparison(name="noop", baseline_sec_per_op=0, current_sec_per_op=0.1)
+    assert comparison.ratio is None
+    assert not comparison.is_regression(tolerance=0.1)
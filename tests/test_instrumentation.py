@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
+from codenames.classic.team import ClassicTeam
+from codenames.generic.runner import TeamPlayers
+from codenames.utils.instrumentation import (
+    NO_INSTRUMENTATION,
+    Instrumentation,
+    Metric,
+    TimingStats,
+)
+from codenames.utils.vocabulary.languages import get_vocabulary
+from tests.utils.players.randoms import RandomOperative, RandomSpymaster
+
+
+def build_runner(instrumentation: Instrumentation | None = None) -> ClassicGameRunner:
+    board = ClassicBoard.from_vocabulary(vocabulary=get_vocabulary("english"), seed=1)
+    players = ClassicGamePlayers(
+        blue_team=TeamPlayers(
+            spymaster=RandomSpymaster("Blue Spymaster", ClassicTeam.BLUE),
+            operative=RandomOperative("Blue Operative", ClassicTeam.BLUE),
+        ),
+        red_team=TeamPlayers(
+            spymaster=RandomSpymaster("Red Spymaster", ClassicTeam.RED),
+            operative=RandomOperative("Red Operative", ClassicTeam.RED),
+        ),
+    )
+    return ClassicGameRunner(players=players, board=board, instrumentation=instrumentation)
+
+
+def test_timing_stats_histogram():
+    stats = TimingStats()
+    for duration_sec in [0.000_001, 0.000_003, 0.000_003, 0.001]:
+        stats.add(duration_sec)
+
+    assert stats.count == 4
+    assert stats.max_sec == 0.001
+    assert stats.mean_sec == pytest.approx(0.001_007 / 4)
+    assert stats.quantile_sec(0.5) == 4 / 1_000_000  # Upper bound of the [2, 4) microseconds bucket
+    assert stats.quantile_sec(1) == 0.001
+
+    other = TimingStats()
+    other.add(0.5)
+    stats.merge(other)
+
+    assert stats.count == 5
+    assert stats.max_sec == 0.5
+    assert sum(stats.buckets) == 5
+
+
+def test_runner_records_hot_path_timings():
+    random.seed(1)
+    instrumentation = Instrumentation()
+    runner = build_runner(instrumentation=instrumentation)
+    runner.run_game()
+
+    clues, guesses = len(runner.state.given_clues), len(runner.state.given_guesses)
+    assert instrumentation[Metric.GIVE_CLUE].count == clues
+    assert instrumentation[Metric.PROCESS_CLUE].count == clues
+    assert instrumentation[Metric.SPYMASTER_VIEW].count == clues
+    assert instrumentation[Metric.CLUE_SUBSCRIBERS].count == clues
+    # Random operatives never guess a revealed card, so every guess is valid.
+    assert instrumentation[Metric.GUESS].count == guesses
+    assert instrumentation[Metric.PROCESS_GUESS].count == guesses
+    assert instrumentation[Metric.OPERATIVE_VIEW].count == guesses
+    assert set(instrumentation.to_dict()) == set(Metric)
+
+
+def test_runner_is_not_instrumented_by_default():
+    runner = build_runner()
+    runner.run_game()
+
+    assert runner.instrumentation is NO_INSTRUMENTATION
+    assert not NO_INSTRUMENTATION.stats
+
+
+def test_merged_instrumentation_aggregates_games():
+    profiles = []
+    for seed in range(3):
+        random.seed(seed)
+        runner = build_runner(instrumentation=Instrumentation())
+        runner.run_game()
+        profiles.append(runner.instrumentation)
+
+    merged = Instrumentation.merged(profiles)
+
+    expected = sum(profile[Metric.PROCESS_GUESS].count for profile in profiles)
+    assert merged[Metric.PROCESS_GUESS].count == expected
+    assert merged.to_dict()[Metric.PROCESS_GUESS]["count"] == expected
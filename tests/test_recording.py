@@ -0,0 +1,116 @@
+import random
+import threading
+
+import pytest
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.runner import ClassicGamePlayers, ClassicGameRunner
+from codenames.classic.team import ClassicTeam
+from codenames.duet.board import DuetBoard
+from codenames.duet.player import CompositeDuetPlayer
+from codenames.duet.runner import DuetGamePlayers, DuetGameRunner
+from codenames.duet.team import DuetTeam
+from codenames.generic.runner import MovePolicy, TeamPlayers
+from codenames.mini.runner import MiniGameRunner
+from codenames.utils.recording import (
+    EventKind,
+    GameRecorder,
+    GameRecording,
+    GameReplayer,
+    RecordingError,
+)
+from codenames.utils.vocabulary.languages import get_vocabulary
+from tests.utils.players.randoms import RandomOperative, RandomSpymaster
+
+VOCABULARY = get_vocabulary("english")
+
+
+def build_team(name: str, team) -> TeamPlayers:
+    return TeamPlayers(spymaster=RandomSpymaster(f"{name} Spymaster", team), operative=RandomOperative(name, team))
+
+
+def build_classic_runner() -> ClassicGameRunner:
+    board = ClassicBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    players = ClassicGamePlayers(
+        blue_team=build_team("Blue", ClassicTeam.BLUE),
+        red_team=build_team("Red", ClassicTeam.RED),
+    )
+    return ClassicGameRunner(players=players, board=board)
+
+
+def build_duet_runner() -> DuetGameRunner:
+    board = DuetBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    team_a, team_b = build_team("A", DuetTeam.MAIN), build_team("B", DuetTeam.MAIN)
+    players = DuetGamePlayers(
+        player_a=CompositeDuetPlayer(spymaster=team_a.spymaster, operative=team_a.operative),
+        player_b=CompositeDuetPlayer(spymaster=team_b.spymaster, operative=team_b.operative),
+    )
+    return DuetGameRunner(players=players, board=board)
+
+
+def build_mini_runner() -> MiniGameRunner:
+    board = DuetBoard.from_vocabulary(vocabulary=VOCABULARY, seed=1)
+    return MiniGameRunner(players=build_team("Mini", DuetTeam.MAIN), board=board)
+
+
+@pytest.mark.parametrize("build_runner", [build_classic_runner, build_duet_runner, build_mini_runner])
+def test_replayed_game_matches_recorded_game(build_runner):
+    random.seed(1)
+    runner = build_runner()
+    recorder = GameRecorder(runner)
+    initial_state = runner.state.model_dump()
+    runner.run_game()
+
+    data = recorder.to_bytes()
+    replayer = GameReplayer.from_bytes(data)
+
+    assert replayer.recording == recorder.recording
+    assert replayer.final_state() == runner.state
+    assert replayer.state_at(0).model_dump() == initial_state
+    assert len(list(replayer.states())) == replayer.event_count + 1
+
+
+@pytest.mark.parametrize("build_runner", [build_classic_runner, build_duet_runner, build_mini_runner])
+def test_replayed_timeout_matches_recorded_game(build_runner, monkeypatch: pytest.MonkeyPatch):
+    release = threading.Event()
+
+    def blocking_guess(self, game_state):  # pylint: disable=unused-argument
+        release.wait(timeout=5)
+
+    monkeypatch.setattr(RandomOperative, "guess", blocking_guess)
+    runner = build_runner()
+    runner.move_timer.policy = MovePolicy(guess_timeout_sec=0.01)
+    recorder = GameRecorder(runner)
+    runner.run_game()
+    release.set()
+
+    replayer = GameReplayer.from_bytes(recorder.to_bytes())
+    assert [event.kind for event in replayer.recording.events] == [EventKind.CLUE, EventKind.TIME_OUT]
+    assert replayer.final_state() == runner.state
+    assert replayer.final_state().is_game_over
+
+
+def test_recording_is_compact():
+    random.seed(1)
+    runner = build_classic_runner()
+    recorder = GameRecorder(runner)
+    runner.run_game()
+
+    data = recorder.to_bytes()
+    state_json = runner.state.model_dump_json()
+
+    assert len(data) * 10 < len(state_json)
+    kinds = {event.kind for event in recorder.recording.events}
+    assert kinds == {EventKind.CLUE, EventKind.GUESS}
+
+
+def test_recorder_requires_clean_boards():
+    runner = build_classic_runner()
+    runner.state.board.reveal_card(0)
+    with pytest.raises(RecordingError):
+        GameRecorder(runner)
+
+
+def test_invalid_data_is_rejected():
+    with pytest.raises(RecordingError):
+        GameRecording.from_bytes(b"XYZ" + bytes(20))
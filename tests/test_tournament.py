@@ -0,0 +1,111 @@
+from collections import Counter
+
+import pytest
+
+from codenames.duet.score import ASSASSIN_HIT, TARGET_REACHED
+from codenames.utils.game_type import GameType
+from codenames.utils.tournament import (
+    GameOutcome,
+    Pairing,
+    Tournament,
+    TournamentResult,
+)
+from tests.utils.players.randoms import RandomOperative, RandomSpymaster
+
+SEEDS = list(range(6))
+
+
+def build_tournament(game_type: GameType, max_workers: int | None = 0) -> Tournament:
+    return Tournament(
+        game_type=game_type,
+        spymasters={"Yoda": RandomSpymaster, "Einstein": RandomSpymaster},
+        operatives={"Anakin": RandomOperative},
+        seeds=SEEDS,
+        chunk_size=4,
+        max_workers=max_workers,
+    )
+
+
+def test_classic_tournament_schedules_every_ordered_pairing():
+    tournament = build_tournament(GameType.CLASSIC)
+    yoda, einstein = Pairing(spymaster="Yoda", operative="Anakin"), Pairing(spymaster="Einstein", operative="Anakin")
+
+    assert tournament.matches == [(yoda, einstein), (einstein, yoda)]
+    assert len(tournament.work_units()) == 4
+
+    result = tournament.run()
+
+    assert len(result.outcomes) == 2 * len(SEEDS)
+    stats = result.pairing_stats
+    assert stats[yoda].games == stats[einstein].games == 2 * len(SEEDS)
+    assert stats[yoda].wins + stats[einstein].wins == 2 * len(SEEDS)
+    for pairing_stats in stats.values():
+        assert sum(pairing_stats.reasons.values()) == pairing_stats.wins
+        assert sum(pairing_stats.loss_reasons.values()) == pairing_stats.games - pairing_stats.wins
+    assert sum(result.reason_counts.values()) == 2 * len(SEEDS)
+
+
+def test_self_play_counts_each_game_once():
+    tournament = Tournament(
+        game_type=GameType.CLASSIC,
+        spymasters={"Yoda": RandomSpymaster},
+        operatives={"Anakin": RandomOperative},
+        seeds=SEEDS,
+        include_self_play=True,
+        max_workers=0,
+    )
+    yoda = Pairing(spymaster="Yoda", operative="Anakin")
+    assert tournament.matches == [(yoda, yoda)]
+
+    stats = tournament.run().pairing_stats
+
+    assert stats[yoda].games == stats[yoda].wins == len(SEEDS)
+    assert stats[yoda].win_rate == 1
+    assert sum(stats[yoda].reasons.values()) == len(SEEDS)
+    assert not stats[yoda].loss_reasons
+
+
+@pytest.mark.parametrize("game_type", [GameType.DUET, GameType.MINI])
+def test_cooperative_tournament_plays_each_pairing_alone(game_type: GameType):
+    tournament = build_tournament(game_type)
+
+    result = tournament.run()
+
+    assert len(result.outcomes) == 2 * len(SEEDS)
+    for outcome in result.outcomes:
+        assert len(outcome.match) == 1
+        assert outcome.winner in (None, outcome.match[0])
+    assert all(0 <= stats.win_rate <= 1 for stats in result.pairing_stats.values())
+
+
+def test_cooperative_losses_count_their_reasons():
+    pairing = Pairing(spymaster="Yoda", operative="Anakin")
+    won = GameOutcome(seed=0, match=(pairing,), winner=pairing, reason=TARGET_REACHED.reason)
+    lost = GameOutcome(seed=1, match=(pairing,), winner=None, reason=ASSASSIN_HIT.reason)
+    result = TournamentResult(outcomes=[won, lost, lost], duration_sec=1)
+
+    stats = result.pairing_stats[pairing]
+
+    assert stats.games == 3
+    assert stats.wins == 1
+    assert stats.reasons == Counter({TARGET_REACHED.reason: 1})
+    assert stats.loss_reasons == Counter({ASSASSIN_HIT.reason: 2})
+
+
+def test_tournament_is_deterministic_across_processes():
+    serial = build_tournament(GameType.CLASSIC).run()
+    parallel = build_tournament(GameType.CLASSIC, max_workers=2).run()
+
+    assert parallel.outcomes == serial.outcomes
+
+
+def test_instrumented_tournament_exports_game_and_run_profiles():
+    tournament = build_tournament(GameType.MINI, max_workers=2)
+    tournament.instrument = True
+
+    result = tournament.run()
+
+    assert all(outcome.profile for outcome in result.outcomes)
+    games_profile = sum(outcome.profile["process_guess"].count for outcome in result.outcomes if outcome.profile)
+    assert result.profile["process_guess"].count == games_profile > 0
+    assert "give_clue" in result.profile.to_dict()
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from codenames.classic.board import ClassicBoard
+from codenames.classic.color import ClassicColor
+from codenames.generic.board import IndexedVocabulary, Vocabulary
+from codenames.generic.exceptions import WordNotFoundError
+from codenames.utils.vocabulary.languages import (
+    SupportedLanguage,
+    VocabularyRegistry,
+    get_vocabulary,
+)
+
+
+def test_indexed_vocabulary_ids_are_sorted_and_unique():
+    vocabulary = IndexedVocabulary(language="english", words=("pear", "Apple", "pear", "fig_tree"))
+
+    assert vocabulary.words == ("Apple", "fig_tree", "pear")
+    assert len(vocabulary) == 3
+    assert vocabulary.word_id("pear") == 2
+    # Canonical forms resolve to the same ID.
+    assert vocabulary.word_id("apple") == 0
+    assert vocabulary.word_id("Fig tree") == 1
+    with pytest.raises(WordNotFoundError):
+        vocabulary.word_id("banana")
+
+
+def test_indexed_vocabulary_from_plain_vocabulary():
+    plain = Vocabulary(language="english", words=["b", "a"])
+    indexed = IndexedVocabulary.from_vocabulary(plain)
+
+    assert indexed.words == ("a", "b")
+    assert IndexedVocabulary.from_vocabulary(indexed) is indexed
+
+
+@pytest.mark.parametrize("language", list(SupportedLanguage))
+def test_language_vocabularies_are_stably_ordered(language: str):
+    vocabulary = get_vocabulary(language=language)
+
+    assert list(vocabulary.words) == sorted(vocabulary.words)
+    assert get_vocabulary(language=language.upper()) is vocabulary
+
+
+def test_board_round_trips_through_word_ids():
+    vocabulary = get_vocabulary(language=SupportedLanguage.ENGLISH)
+    board = ClassicBoard.from_vocabulary(vocabulary=vocabulary, seed=1)
+
+    word_ids = board.word_ids(vocabulary)
+    colors = [card.color for card in board.cards]
+    rebuilt = ClassicBoard.from_word_ids(vocabulary=vocabulary, word_ids=word_ids, colors=colors)
+
+    assert rebuilt == board
+    assert isinstance(rebuilt.cards[0].color, ClassicColor)
+
+
+def test_builtin_vocabularies_are_loaded_lazily():
+    code = (
+        "import sys; import codenames.classic.board; "
+        "assert 'codenames.utils.vocabulary.english' not in sys.modules; "
+        "assert 'codenames.utils.vocabulary.hebrew' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_registry_loads_words_file_once(tmp_path: Path):
+    words_file = tmp_path / "words.txt"
+    words_file.write_text("# Fruits\npear\n\napple\n", encoding="utf-8")
+    registry = VocabularyRegistry()
+    registry.register_words_file("Fruits", path=words_file)
+
+    vocabulary = registry.get("fruits")
+
+    assert vocabulary.words == ("apple", "pear")
+    assert registry.get("FRUITS") is vocabulary
+    assert registry.languages == ("fruits",)
+    with pytest.raises(NotImplementedError):
+        registry.get("vegetables")
@@ -0,0 +1,37 @@
+import asyncio
+import random
+
+from codenames.generic.card import CardColor
+from codenames.generic.move import Clue, Guess
+from codenames.generic.player import Operative, Player, Spymaster
+from codenames.generic.state import OperativeState, SpymasterState
+from codenames.generic.team import Team
+
+
+class RandomSpymaster[C: CardColor, T: Team, S: SpymasterState](Spymaster[C, T, S]):
+    def give_clue(self, game_state: S) -> Clue:
+        # Numbered clue words never collide with board words
+        clue_word = f"{self.name} {len(game_state.given_clues)}"
+        return Clue(word=clue_word, card_amount=random.randint(1, 3))
+
+
+class RandomOperative[C: CardColor, T: Team, S: OperativeState](Operative[C, T, S]):
+    def guess(self, game_state: S) -> Guess:
+        unrevealed = [i for i, card in enumerate(game_state.board.cards) if not card.revealed]
+        return Guess(card_index=random.choice(unrevealed))
+
+
+class AsyncRandomSpymaster[C: CardColor, T: Team](Player[C, T]):
+    async def give_clue(self, game_state: SpymasterState) -> Clue:
+        await asyncio.sleep(0)
+        return RandomSpymaster.give_clue(self, game_state)  # type: ignore[arg-type]
+
+
+class AsyncRandomOperative[C: CardColor, T: Team](Player[C, T]):
+    async def guess(self, game_state: OperativeState) -> Guess:
+        await asyncio.sleep(0)
+        return RandomOperative.guess(self, game_state)  # type: ignore[arg-type]
+
+
+class AsyncRandomPlayer[C: CardColor, T: Team](AsyncRandomSpymaster[C, T], AsyncRandomOperative[C, T]):
+    pass